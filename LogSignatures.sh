@@ -1,2 +1,8 @@
-find LOG/ -name '*.log' -exec grep -a 'RX SIGNATURE:' {} \; | sort | uniq -c | sort -n
+# Import the RX signatures of existing log files once, when the RX signature statistics database has not been created.
+if [ ! -f LOG/Pi433MHzSignatures.db ]
+then
+   find LOG/ -name '*_433MHz.log*' -exec ./Pi433MHzSignatures.py IMPORT {} +
+fi
+
+./Pi433MHzSignatures.py TOP 1000000
 
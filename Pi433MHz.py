@@ -1,4 +1,4 @@
-#!/usr/bin/python
+#!/usr/bin/python3
 
 # Pi433MHz - 433MHz Data Reciever and Decoder
 # Copyright (C) 2019 Jason Birch
@@ -34,297 +34,202 @@ import sys
 import math
 import time
 import datetime
-import RPi.GPIO
-
-
-
-# GPIO Pin connected to 433MHz receiver.
-GPIO_RX_PIN = 26
+import threading
+import Pi433MHzCapture
+import Pi433MHzWave
+import Pi433MHzDecode
+import Pi433MHzRecord
+import Pi433MHzRing
+import Pi433MHzDedup
+import Pi433MHzLog
+import Pi433MHzSignatureDb
+
+
+
+# GPIO Pins connected to 433MHz receivers, each receiver is captured independently.
+# With more than one receiver, each log entry includes the GPIO pin, and a copy of the same data received
+# on another GPIO pin within DEDUP_WINDOW is counted as a repeat.
+GPIO_RX_PINS = [26]
 # GPIO Pin connected to 433MHz transmitter.
 GPIO_TX_PIN = 19
 
+# Receiver capture backend, POLL, EDGE, CHARDEV or SIMULATED.
+RX_CAPTURE_BACKEND = Pi433MHzCapture.BACKEND_EDGE
+
 # Put bad data lines in log file.
 LOG_BAD_DATA = False
+# Views of the RX data in each log entry, any of BINARY, HEX, ALT_HEX, BYTE, WORD0, WORD1, CHARACTER and LINE_CODE.
+# Only the selected views are formatted, fewer views use less CPU and log file space.
+# The line code is only detected when LINE_CODE is selected.
+LOG_VIEWS = Pi433MHzDecode.DECODE_VIEWS
+# Size of log entries buffered before writing to the log file.
+LOG_FLUSH_SIZE = 65536
+# Longest period log entries are buffered before writing to the log file.
+LOG_FLUSH_PERIOD = 5.0
+# Compress log files with gzip after midnight.
+LOG_COMPRESS = False
+# Record raw RX data in a daily recording file, for Pi433MHzReplay.py.
+RECORD_RX_DATA = False
+# RX signature statistics database, for Pi433MHzSignatures.py, empty for no database.
+SIGNATURE_DATABASE = "LOG/Pi433MHzSignatures.db"
+# Period after the last copy of repeated data to log the next copy with the same RX signature, in nanoseconds.
+DEDUP_WINDOW = 500000000
+
+# GPIO level to switch transmitter off, in Pi433MHzWave.py shared with the transmitting applications.
+TX_OFF_LEVEL = Pi433MHzWave.TX_OFF_LEVEL
+# Data decoding settings are in Pi433MHzDecode.py, shared with Pi433MHzReplay.py.
+RX_BIT_INVERT = Pi433MHzDecode.RX_BIT_INVERT
+RX_END_PERIOD = Pi433MHzDecode.RX_END_PERIOD
+RX_REJECT_PERIOD = Pi433MHzDecode.RX_REJECT_PERIOD
+# Period to wait for RX data when idle, before updating the noise count display, in nanoseconds.
+RX_IDLE_PERIOD = 500000000
+# Number of captured RX data packets which can wait to be decoded.
+RX_RING_SIZE = 64
+# Number of background threads decoding and logging RX data.
+RX_DECODE_WORKERS = 1
+
+
+
+# Write a line to the daily log file.
+def WriteLogLine(Now, LogLine):
+   sys.stdout.write(LogLine)
+   LogFile.Write(Now, LogLine)
 
-# GPIO level to switch transmitter off.
-TX_OFF_LEVEL = 1
-# When converting 5V signal to 3V3 signal for Raspberry Pi GPIO, NPN transistor inverts the signal.
-RX_BIT_INVERT = 1
-# Period of no RX data to consider end of RX data message.
-RX_END_PERIOD = 0.01
-# Smallest period of high or low signal to consider noise rather than data, and flag as bad data. 
-RX_REJECT_PERIOD = 0.000005
-# Ignore extra bits at start of transmission.
-RX_START_BITS = 1
-# RX Signature size, number of hex values to use as a signature.
-RX_SIGNATURE_SIZE = 4
 
-# RX data field names.
-DATA_SEQUENCE = 0
-DATA_RX_PIN = 1
-DATA_LEVEL = 2
-DATA_PERIOD = 3
 
+# Record the raw RX data in a daily recording file, for decoding later with Pi433MHzReplay.py.
+def RecordRxData(Now, TimeStampNs, Data):
+   global Recording, RecordingDate
 
+   if Now.strftime("%Y-%m-%d") != RecordingDate:
+      if Recording != None:
+         Recording.Close()
+      RecordingDate = Now.strftime("%Y-%m-%d")
+      Recording = Pi433MHzRecord.CaptureWriter("LOG/{:s}_433MHz.rec".format(RecordingDate))
+   Recording.Write(Data.RxPin, TimeStampNs, Data)
 
-class RxPacket:
-   StartBitCount = RX_START_BITS
-   AltStartBitCount = RX_START_BITS
-   DataCount = 0
-   Data = []
-   BitPeriod = 0
-   LastGpioLevel = RX_BIT_INVERT
-   RxSignatures = {}
 
 
+# End of data detected at EndTime on the capture clock, pass the RX data to the decoding workers.
+# The wall clock time is only used to time stamp the log entry.
+def EndRxPacket(Data, EndTime):
+   RxRing.Put([time.time_ns(), EndTime, Data])
 
-# Initialise application data.
-def DataInit(ThisRxPacket):
-   ThisRxPacket.StartBitCount = RX_START_BITS
-   ThisRxPacket.AltStartBitCount = RX_START_BITS
-   ThisRxPacket.DataCount = 0
-   ThisRxPacket.Data = []
-   ThisRxPacket.BitPeriod = 0
-   ThisRxPacket.LastGpioLevel = RX_BIT_INVERT
 
 
+# Decode and log RX data, called by the decoding worker threads.
+def ProcessRxPacket(RxCapture):
+   global NoiseCount
 
-# Write a line to the log file.
-def WriteLogLine(LogFile, LogLine):
-   sys.stdout.write(LogLine)
-   LogFile.write(LogLine)
-
-
-#  /*******************************************/
-# /* Configure Raspberry Pi GPIO interfaces. */
-#/*******************************************/
-RPi.GPIO.setwarnings(False)
-RPi.GPIO.setmode(RPi.GPIO.BCM)
-RPi.GPIO.setup(GPIO_RX_PIN, RPi.GPIO.IN, pull_up_down=RPi.GPIO.PUD_UP)
-RPi.GPIO.setup(GPIO_TX_PIN, RPi.GPIO.OUT, initial=TX_OFF_LEVEL)
-
-# Initialise a new data packet capture.
-ThisRxPacket = RxPacket
-DataInit(ThisRxPacket)
-
-# Infinate loop for this application.
-ExitFlag = False
-NoiseCount = 0
-LastSecond = 0
-sys.stdout.write("\nWAITING FOR DATA...\n\n")
-sys.stdout.flush()
-while ExitFlag == False:
-   # Check if data is currently being received.
-   ThisPeriod = time.time()
-   DiffPeriod = ThisPeriod - ThisRxPacket.BitPeriod
-   ThisSecond = int(ThisPeriod)
-   if ThisSecond != LastSecond:
-      sys.stdout.write(" NOISE: {:d}      \r".format(NoiseCount))
-      sys.stdout.flush()
-      NoiseCount = 0
-      LastSecond = ThisSecond
-
-   if len(ThisRxPacket.Data) == 0 or DiffPeriod < RX_END_PERIOD:
-      # If data level changes, log information about the data received, to be decoded when the RX data is complete.
-      GpioLevel = RPi.GPIO.input(GPIO_RX_PIN)
-      if GpioLevel != ThisRxPacket.LastGpioLevel:
-         if DiffPeriod < RX_REJECT_PERIOD:
-            NoiseCount += 1
-         else:
-            ThisRxPacket.Data.append([ThisRxPacket.DataCount, GPIO_RX_PIN, ThisRxPacket.LastGpioLevel, DiffPeriod])
-            ThisRxPacket.DataCount += 1
-            ThisRxPacket.BitPeriod = ThisPeriod
-            ThisRxPacket.LastGpioLevel = GpioLevel
-   else:
-      # New log entry.
-      LogEntry = ""
-      BadDataFlag = False
-
-      # End of data detected, decode data.
-      Now = datetime.datetime.now()
-
-      # Log the date and time of the RX data.
-      LogEntry += Now.strftime("%Y-%m-%d %H:%M:%S\n")
-
-      # Calculate the data size once, for use later.
-      DataSize = len(ThisRxPacket.Data)
-      LogEntry += "DATA SIZE: {:d} ".format(DataSize)
-
-      # Itterate though the data to find the smallest period for a high level and smallest period for a low level.
-      # This will be considered the TX data rate for high and low signals.
-      MinLowPeriodSeqCount = 0
-      MinLowPeriod = RX_END_PERIOD
-      MinHighPeriodSeqCount = 0
-      MinHighPeriod = RX_END_PERIOD
-      for DataRow in ThisRxPacket.Data:
-         # Ignore the first and last couple of periods in case they are noise.
-         if DataRow[DATA_SEQUENCE] > 2 and DataRow[DATA_SEQUENCE] < DataSize - 2:
-            if DataRow[DATA_LEVEL] == 0 and DataRow[DATA_PERIOD] < MinLowPeriod:
-               MinLowPeriodSeqCount = DataRow[DATA_SEQUENCE]
-               MinLowPeriod = DataRow[DATA_PERIOD]
-            if DataRow[DATA_LEVEL] == 1 and DataRow[DATA_PERIOD] < MinHighPeriod:
-               MinHighPeriodSeqCount = DataRow[DATA_SEQUENCE]
-               MinHighPeriod = DataRow[DATA_PERIOD]
-      LogEntry += "MIN LOW PERIOD: [{:d}] {:f} MIN HIGH PERIOD: [{:d}] {:f}\n".format(MinLowPeriodSeqCount, MinLowPeriod, MinHighPeriodSeqCount, MinHighPeriod)
-
-      # Check for data that looks erronious and display an error rather than the data.
-      if MinLowPeriod == RX_END_PERIOD or MinHighPeriod == RX_END_PERIOD \
-         or MinLowPeriod < RX_REJECT_PERIOD or MinHighPeriod < RX_REJECT_PERIOD:
-         BadDataFlag = True
-         LogEntry += "! BAD DATA REJECTED (NOISY) !"
-      else:
-         # Data looks OK, so display the data in several formats to aid decoding of the data.
-         # Display binary data and store groups of eight bits as byte data for use later.
-         LogEntry += "\nBINARY DATA:\n"
-         BitDataCount = 0
-         AltBitDataCount = 0
-         ByteDataCount = 0
-         AltByteDataCount = 0
-         ByteData = []
-         AltByteData = []
-         if RX_BIT_INVERT == 0:
-            LevelTest = 0
-         else:
-            LevelTest = 1
-         for DataRow in ThisRxPacket.Data:
-            if DataRow[DATA_PERIOD] < RX_END_PERIOD:
-               if DataRow[DATA_LEVEL] == LevelTest:
-                  # Divide the data level period by the min period for the data level to calculate how many bits are of that level.
-                  BitCount = int(round(DataRow[DATA_PERIOD] / MinLowPeriod))
-                  for Count in range(BitCount):
-                     if ThisRxPacket.StartBitCount > 0:
-                        ThisRxPacket.StartBitCount -= 1
-                     else:
-                        if BitDataCount % 8 == 0:
-                           ByteData.append(0)
-                           ByteDataCount += 1
-                        BitDataCount += 1
-                        LogEntry += "0"
-                        ByteData[ByteDataCount - 1] = (ByteData[ByteDataCount - 1] << 1) + 0
-               else:
-                  # Divide the data level period by the min period for the data level to calculate how many bits are of that level.
-                  BitCount = int(round(DataRow[DATA_PERIOD] / MinHighPeriod))
-                  for Count in range(BitCount):
-                     if ThisRxPacket.StartBitCount > 0:
-                        ThisRxPacket.StartBitCount -= 1
-                     else:
-                        if BitDataCount % 8 == 0:
-                           ByteData.append(0)
-                           ByteDataCount += 1
-                        BitDataCount += 1
-                        LogEntry += "1"
-                        ByteData[ByteDataCount - 1] = (ByteData[ByteDataCount - 1] << 1) + 1
-
-               if BitCount <= 2:
-                  if ThisRxPacket.AltStartBitCount > 0:
-                     ThisRxPacket.AltStartBitCount -= 1
-                  else:
-                     if AltBitDataCount % 8 == 0:
-                        AltByteData.append(0)
-                        AltByteDataCount += 1
-                     AltBitDataCount += 1
-                     if BitCount == 1:
-                        AltByteData[AltByteDataCount - 1] = (AltByteData[AltByteDataCount - 1] << 1) + 0
-                     elif BitCount == 2:
-                        AltByteData[AltByteDataCount - 1] = (AltByteData[AltByteDataCount - 1] << 1) + 1
-
-         # Display the byte data in hex format.
-         LogEntry += "\n\nHEX DATA:\n"
-         DataCount = 0
-         ZeroTest = 0
-         for Byte in ByteData:
-            ZeroTest = (ZeroTest | Byte)
-            LogEntry += "{:02X} ".format(Byte)
-            DataCount += 1
-            if DataCount % 26 == 0:
-               LogEntry += "\n"
-         # Flag all zero data as bad data.
-         if ZeroTest == 0:
-            BadDataFlag = True
-            LogEntry += "! BAD DATA REJECTED (ZERO) !"
-
-         # Received data decoded from single bit run = 0, double bit run = 1.
-         LogEntry += "\n\nALT HEX DATA:\n"
-         RxSignatureCount = RX_SIGNATURE_SIZE
-         RxSignature = ""
-         DataCount = 0
-         ZeroTest = 0
-         for Byte in AltByteData:
-            ZeroTest = (ZeroTest | Byte)
-            LogEntry += "{:02X} ".format(Byte)
-            if RxSignatureCount > 0:
-               RxSignatureCount -= 1
-               RxSignature += "{:02X} ".format(Byte)
-            DataCount += 1
-            if DataCount % 26 == 0:
-               LogEntry += "\n"
-         LogEntry += "\n\nRX SIGNATURE: {:s}".format(RxSignature)
-         # Flag bad signiture data as bad data.
-         if RxSignatureCount > 0:
-            BadDataFlag = True
-            LogEntry += "! BAD DATA REJECTED (SIGNATURE) !"
-         # Flag all zero data as bad data.
-         if ZeroTest == 0:
-            BadDataFlag = True
-            LogEntry += "! BAD DATA REJECTED (ZERO) !"
-
-         # Display the byte data in decimal format.
-         LogEntry += "\n\nBYTE DATA:\n"
-         DataCount = 0
-         for Byte in AltByteData:
-            LogEntry += "{:3d} ".format(Byte)
-            DataCount += 1
-            if DataCount % 19 == 0:
-               LogEntry += "\n"
-
-         # Display pairs of the byte data as 16 bit words in decimal format.
-         LogEntry += "\n\nWORD DATA OFFSET 0:\n"
-         DataWord = 0
-         DataCount = 0
-         for Byte in AltByteData:
-            if DataCount % 2 == 0:
-               DataWord = Byte
-            else:
-               DataWord = (DataWord << 8) + Byte
-               LogEntry += "{:6d} ".format(DataWord)
-
-            DataCount += 1
-            if DataCount % 20 == 0:
-               LogEntry += "\n"
-
-         # Display pairs of the byte data as 16 bit words in decimal format, offset the data by one byte.
-         LogEntry += "\n\nWORD DATA OFFSET 1:\n"
-         DataWord = 0
-         DataCount = 0
-         for Byte in AltByteData:
-            if DataCount % 2 == 1:
-               DataWord = Byte
-            else:
-               DataWord = (DataWord << 8) + Byte
-               LogEntry += "{:6d} ".format(DataWord)
-
-            DataCount += 1
-            if DataCount % 20 == 0:
-               LogEntry += "\n"
-
-         # Display the byte data in ASCII format.
-         LogEntry += "\n\nCHARACTER DATA:\n"
-         for Byte in AltByteData:
-            LogEntry += "{:s}".format(chr(Byte))
-
-      # Reset data ready to receive next RX data.
-      LogEntry += "\n\n\n"
+   # End of data detected, decode data.
+   TimeStampNs, EndTime, Data = RxCapture
+   Now = datetime.datetime.fromtimestamp(TimeStampNs / 1000000000.0)
+   Decoded = Pi433MHzDecode.DecodeRxFrame(Data, None, LOG_VIEWS)
+   BadDataFlag = Decoded[Pi433MHzDecode.DECODED_BAD_DATA]
+   RxSignature = Decoded[Pi433MHzDecode.DECODED_RX_SIGNATURE]
 
+   with LogLock:
       if BadDataFlag == True:
          NoiseCount += 1
 
-      if BadDataFlag == False or (BadDataFlag == True and LOG_BAD_DATA == True):
-         # Open a daily log file.
-         LogFile = open("LOG/{:s}_433MHz.log".format(Now.strftime("%Y-%m-%d")), 'a', 0)
-         WriteLogLine(LogFile, LogEntry)
-         sys.stdout.flush()
-         LogFile.close()
-
-      # Initialise a new data packet capture.
-      DataInit(ThisRxPacket)
+      # Record the raw RX data for decoding later with Pi433MHzReplay.py.
+      if RECORD_RX_DATA == True:
+         RecordRxData(Now, TimeStampNs, Data)
 
+      # Only log the first copy of each burst of repeated data with the same RX signature.
+      if BadDataFlag == False:
+         LogFlag = RxFilter.Check(RxSignature, EndTime)
+      else:
+         LogFlag = LOG_BAD_DATA
+      if LogFlag == True:
+         # Only format the log entry when it is logged.
+         if len(GPIO_RX_PINS) > 1:
+            WriteLogLine(Now, Pi433MHzDecode.FormatLogEntry(Decoded, Now, LOG_VIEWS, Data.RxPin))
+         else:
+            WriteLogLine(Now, Pi433MHzDecode.FormatLogEntry(Decoded, Now, LOG_VIEWS))
+         sys.stdout.flush()
+         # Count the RX signature in the RX signature statistics database.
+         if BadDataFlag == False and SignatureDatabase != None:
+            SignatureDatabase.Add(RxSignature, TimeStampNs / 1000000000.0)
+
+   # Return the pulse buffer for reuse by the capture loop.
+   Data.Release()
+
+
+
+def main():
+   global LogLock, RxFilter, LogFile, Recording, RecordingDate, SignatureDatabase, RxRing, NoiseCount
+
+   # Start capturing receiver edges, with the transmitter switched off. RPi.GPIO is only imported by the backends using it.
+   Backend = Pi433MHzCapture.CreateBackend(RX_CAPTURE_BACKEND, GPIO_RX_PINS, GPIO_TX_PIN, TX_OFF_LEVEL)
+   Backend.Open()
+
+   # Start the background workers decoding and logging the captured RX data.
+   LogLock = threading.Lock()
+   RxFilter = Pi433MHzDedup.BurstFilter(DEDUP_WINDOW)
+   LogFile = Pi433MHzLog.DailyLogFile("LOG/{:s}_433MHz.log", LOG_FLUSH_SIZE, LOG_FLUSH_PERIOD, LOG_COMPRESS)
+   Recording = None
+   RecordingDate = ""
+   SignatureDatabase = None
+   if SIGNATURE_DATABASE != "":
+      SignatureDatabase = Pi433MHzSignatureDb.SignatureDatabase(SIGNATURE_DATABASE, LOG_FLUSH_PERIOD)
+   RxRing = Pi433MHzRing.RingBuffer(RX_RING_SIZE)
+   DecodeWorkers = Pi433MHzRing.WorkerPool(RxRing, ProcessRxPacket, RX_DECODE_WORKERS)
+   DecodeWorkers.Start()
+
+   # Initialise a new data packet capture.
+   Capture = Pi433MHzDecode.MultiPinCapture(GPIO_RX_PINS, RX_END_PERIOD, RX_REJECT_PERIOD, RX_BIT_INVERT)
+
+   # Infinate loop for this application.
+   ExitFlag = False
+   NoiseCount = 0
+   LastSecond = 0
+   sys.stdout.write("\nWAITING FOR DATA...\n\n")
+   sys.stdout.flush()
+   while ExitFlag == False:
+      # Wait for edges, only wait for the end of data period while data is being received.
+      if Capture.IsReceiving() == False:
+         Edges = Backend.Read(RX_IDLE_PERIOD)
+      else:
+         Edges = Backend.Read(RX_END_PERIOD)
+
+      ThisSecond = time.monotonic_ns() // 1000000000
+      if ThisSecond != LastSecond:
+         with LogLock:
+            sys.stdout.write(" NOISE: {:d} DROPPED EDGES: {:d} DROPPED CAPTURES: {:d} DECODE ERRORS: {:d} REPEATS: {:d}      \r".format(NoiseCount + Capture.ReadNoiseCount(), Backend.DroppedCount, RxRing.DroppedCount, DecodeWorkers.ErrorCount, RxFilter.RepeatCount))
+            sys.stdout.flush()
+            NoiseCount = 0
+            # Write buffered log entries when the flush period has passed.
+            LogFile.Poll()
+            if Recording != None:
+               Recording.Flush()
+            if SignatureDatabase != None:
+               SignatureDatabase.Poll()
+         LastSecond = ThisSecond
+
+      # Log information about the data received, to be decoded when the RX data is complete.
+      for Edge in Edges:
+         Data = Capture.Edge(Edge)
+         if Data != None:
+            EndRxPacket(Data, Edge[Pi433MHzCapture.EDGE_TIME])
+
+      # End of data detected.
+      Now = Backend.Now()
+      Captures = Capture.EndOfData(Now)
+      for Data in Captures:
+         EndRxPacket(Data, Now)
+      if len(Captures) == 0 and Capture.IsReceiving() == False and Backend.IsFinished() == True:
+         ExitFlag = True
+
+   Backend.Close()
+   DecodeWorkers.Stop()
+   LogFile.Close()
+   if Recording != None:
+      Recording.Close()
+   if SignatureDatabase != None:
+      SignatureDatabase.Close()
+
+
+
+if __name__ == "__main__":
+   main()
@@ -0,0 +1,245 @@
+#!/usr/bin/python3
+
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* Pi433MHzBench - Benchmark the 433MHz data decoding.                      */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* Script for measuring the decoding used by each application, with        */
+#/* synthetic received data packets, without a 433MHz receiver. For each    */
+#/* amount of timing jitter, displays the decoding throughput, the decoding */
+#/* time of each data packet and the bit error rate.                         */
+#/*                                                                          */
+#/* MONITOR - Pi433MHz.py edge capture and decoding, with each engine.       */
+#/* RX      - Pi433MHzRx.py start bit decoding and data packet validation.   */
+#/* RXMATCH - Pi433MHzRxMatch.py start bit decoding and data signature match.*/
+#/****************************************************************************/
+
+
+
+import sys
+import time
+import random
+import datetime
+import Pi433MHzDecode
+import Pi433MHzPacket
+import Pi433MHzMatch
+import Pi433MHzDedup
+import Pi433MHzSynth
+
+
+
+# Number of command line arguments.
+ARG_COUNT = 1
+# Command line arguments.
+ARG_EXE = 0
+ARG_FRAMES = 1
+ARG_GLITCH_RATE = 2
+ARG_DROP_RATE = 3
+
+# Default number of data packets decoded for each amount of jitter.
+BENCH_FRAMES = 200
+# Random number seed, so each run decodes the same data packets.
+BENCH_SEED = 433
+# Single level period of the synthetic data packets, in nanoseconds.
+BENCH_BIT_PERIOD = 500000
+# Number of bytes of data in each data packet.
+BENCH_DATA_SIZE = 16
+# Timing jitter standard deviations measured, as a fraction of the bit period.
+BENCH_JITTERS = [0.0, 0.05, 0.10, 0.15, 0.20, 0.25]
+# Number of bytes at the start of each data packet used as the data signature for RXMATCH.
+BENCH_MATCH_BYTES = 8
+
+# Data encryption key and data packet identifier, as used by Pi433MHzTx.py.
+ENCRYPTION_KEY = [ 0xC5, 0x07, 0x8C, 0xA9, 0xBD, 0x8B, 0x48, 0xEF, 0x88, 0xE1, 0x94, 0xDB, 0x63, 0x77, 0x95, 0x59 ]
+PACKET_SIGNATURE = [ 0x63, 0xF9, 0x5C, 0x1B ]
+
+# Benchmark result fields.
+RESULT_TIMES = 0
+RESULT_EDGES = 1
+RESULT_BIT_ERRORS = 2
+RESULT_BITS = 3
+RESULT_VALID = 4
+
+
+
+# Number of bit errors in the received byte data, missing bytes are all bit errors and extra bytes are ignored.
+def FrameBitErrors(PacketBytes, ByteData):
+   if ByteData == None:
+      return 8 * len(PacketBytes)
+   Count = min(len(PacketBytes), len(ByteData))
+
+   return Pi433MHzDedup.BitDifference(PacketBytes[:Count], ByteData[:Count]) + 8 * (len(PacketBytes) - Count)
+
+
+
+# Read the ALT HEX DATA bytes from a Pi433MHz.py log entry.
+def LogEntryBytes(LogEntry):
+   Start = LogEntry.find("ALT HEX DATA:\n")
+   if Start < 0:
+      return None
+   End = LogEntry.find("\n\nRX SIGNATURE", Start)
+   ByteData = []
+   for Text in LogEntry[Start + len("ALT HEX DATA:\n"):End].split():
+      if len(Text) == 2:
+         try:
+            ByteData.append(int(Text, 16))
+         except ValueError:
+            pass
+
+   return ByteData
+
+
+
+# Pi433MHz.py, capture the edges into RX data rows and decode into a log entry.
+def BenchMonitor(Frames, Engine):
+   Result = [[], 0, 0, 0, 0]
+   Now = datetime.datetime(2019, 7, 31)
+   for PacketBytes, Edges in Frames:
+      StartTime = time.perf_counter_ns()
+      ByteData = None
+      BadDataFlag = True
+      Captures = Pi433MHzDecode.CaptureEdges(Edges, 26)
+      if len(Captures) > 0:
+         LogEntry, BadDataFlag, RxSignature = Pi433MHzDecode.DecodeRxData(Captures[0], Now, Engine)
+      Result[RESULT_TIMES].append(time.perf_counter_ns() - StartTime)
+      if len(Captures) > 0:
+         ByteData = LogEntryBytes(LogEntry)
+      Result[RESULT_EDGES] += len(Edges)
+      Result[RESULT_BIT_ERRORS] += FrameBitErrors(PacketBytes, ByteData)
+      Result[RESULT_BITS] += 8 * len(PacketBytes)
+      if BadDataFlag == False and ByteData == PacketBytes:
+         Result[RESULT_VALID] += 1
+
+   return Result
+
+
+
+# Pi433MHzRx.py, decode the edges into a frame and validate the data packet.
+def BenchRx(Frames, Version=Pi433MHzPacket.PACKET_VERSION_XOR):
+   Result = [[], 0, 0, 0, 0]
+   for PacketBytes, Edges in Frames:
+      StartTime = time.perf_counter_ns()
+      ByteData = None
+      PacketResult = Pi433MHzPacket.PACKET_INVALID_SIGNATURE
+      DecodedFrames = Pi433MHzPacket.DecodeEdges(Edges, Parser=Pi433MHzPacket.PacketParser(PACKET_SIGNATURE, Version))
+      if len(DecodedFrames) > 0:
+         ByteData = DecodedFrames[0][Pi433MHzPacket.FRAME_DATA]
+         PacketResult, DataPacket = Pi433MHzPacket.DecodePacket(ByteData, PACKET_SIGNATURE, Version)
+      Result[RESULT_TIMES].append(time.perf_counter_ns() - StartTime)
+      Result[RESULT_EDGES] += len(Edges)
+      Result[RESULT_BIT_ERRORS] += FrameBitErrors(PacketBytes, ByteData)
+      Result[RESULT_BITS] += 8 * len(PacketBytes)
+      if PacketResult == Pi433MHzPacket.PACKET_VALID:
+         Result[RESULT_VALID] += 1
+
+   return Result
+
+
+
+# Pi433MHzRxMatch.py, decode the edges into a frame and find the matching data signature.
+def BenchRxMatch(Frames, ConfigIndex):
+   Result = [[], 0, 0, 0, 0]
+   for PacketBytes, Edges in Frames:
+      StartTime = time.perf_counter_ns()
+      ByteData = None
+      ConfigElement = None
+      DecodedFrames = Pi433MHzPacket.DecodeEdges(Edges, Parser=Pi433MHzMatch.SignatureParser(ConfigIndex))
+      if len(DecodedFrames) > 0:
+         ByteData = DecodedFrames[0][Pi433MHzPacket.FRAME_DATA]
+         ConfigElement = ConfigIndex.Match(ByteData)
+         # Frames are completed once a data signature matches, so only the bytes decoded are compared.
+         PacketBytes = PacketBytes[:len(ByteData)]
+      Result[RESULT_TIMES].append(time.perf_counter_ns() - StartTime)
+      Result[RESULT_EDGES] += len(Edges)
+      Result[RESULT_BIT_ERRORS] += FrameBitErrors(PacketBytes, ByteData)
+      Result[RESULT_BITS] += 8 * len(PacketBytes)
+      if ConfigElement != None and ConfigElement[Pi433MHzMatch.CONFIG_ELEMENT_MATCH] == bytes(PacketBytes[:BENCH_MATCH_BYTES]).hex().upper():
+         Result[RESULT_VALID] += 1
+
+   return Result
+
+
+
+# Display a line of benchmark results.
+def DisplayResult(Name, Jitter, Result):
+   TotalTime = sum(Result[RESULT_TIMES]) / 1000000000.0
+   FrameCount = len(Result[RESULT_TIMES])
+   sys.stdout.write("{:<15s} {:6.2f} {:10.1f} {:11.1f} {:10.1f} {:10.1f} {:10.6f} {:6.1f}\n".format(Name, Jitter, FrameCount / TotalTime, \
+      Result[RESULT_EDGES] / TotalTime, 1000000.0 * TotalTime / FrameCount, max(Result[RESULT_TIMES]) / 1000.0, \
+      Result[RESULT_BIT_ERRORS] / float(Result[RESULT_BITS]), 100.0 * Result[RESULT_VALID] / FrameCount))
+   sys.stdout.flush()
+
+
+
+def main():
+   # Check for command line arguments.
+   if len(sys.argv) < ARG_COUNT or (len(sys.argv) > ARG_FRAMES and sys.argv[ARG_FRAMES].isdigit() == False):
+      sys.stdout.write("\n" + sys.argv[ARG_EXE] + " [FRAMES] [GLITCH_RATE] [DROP_RATE]\n\n")
+      return
+
+   FrameCount = BENCH_FRAMES
+   if len(sys.argv) > ARG_FRAMES:
+      FrameCount = int(sys.argv[ARG_FRAMES])
+   GlitchRate = 0.0
+   if len(sys.argv) > ARG_GLITCH_RATE:
+      GlitchRate = float(sys.argv[ARG_GLITCH_RATE])
+   DropRate = 0.0
+   if len(sys.argv) > ARG_DROP_RATE:
+      DropRate = float(sys.argv[ARG_DROP_RATE])
+
+   # The same data packets are used for each amount of jitter, also sent with forward error correction for RX FEC.
+   Random = random.Random(BENCH_SEED)
+   FecRandom = random.Random(BENCH_SEED + 1)
+   Packets = []
+   FecPackets = []
+   for Count in range(FrameCount):
+      Data = Pi433MHzSynth.RandomBytes(BENCH_DATA_SIZE, Random)
+      DataPacket = Pi433MHzPacket.EncodePacket(Data, PACKET_SIGNATURE, ENCRYPTION_KEY)
+      Packets.append(Pi433MHzPacket.PacketBytes(DataPacket))
+      DataPacket = Pi433MHzPacket.EncodePacket(Data, PACKET_SIGNATURE, ENCRYPTION_KEY, Pi433MHzPacket.PACKET_VERSION_FEC)
+      FecPackets.append(Pi433MHzPacket.PacketBytes(DataPacket))
+
+   # Data signatures for RXMATCH, the start of each data packet.
+   ConfigIndex = Pi433MHzMatch.SignatureIndex()
+   for PacketBytes in Packets:
+      ConfigIndex.Add([bytes(PacketBytes[:BENCH_MATCH_BYTES]).hex().upper(), "FRAME"])
+
+   Engines = [Pi433MHzDecode.ENGINE_PYTHON]
+   if Pi433MHzDecode.NumPyAvailable() == True:
+      Engines.append(Pi433MHzDecode.ENGINE_NUMPY)
+
+   sys.stdout.write("\nFRAMES: {:d} BIT PERIOD: {:f} GLITCH RATE: {:f} DROP RATE: {:f}\n\n".format(FrameCount, BENCH_BIT_PERIOD / 1000000000.0, GlitchRate, DropRate))
+   sys.stdout.write("{:<15s} {:>6s} {:>10s} {:>11s} {:>10s} {:>10s} {:>10s} {:>6s}\n".format("DECODER", "JITTER", "FRAMES/S", "EDGES/S", "MEAN US", "MAX US", "BER", "VALID%"))
+   for Jitter in BENCH_JITTERS:
+      Settings = Pi433MHzSynth.SynthSettings(BENCH_BIT_PERIOD, 1, 0, int(Jitter * BENCH_BIT_PERIOD), GlitchRate, \
+         Pi433MHzDecode.RX_REJECT_PERIOD // 2, DropRate)
+      Frames = [[PacketBytes, Pi433MHzSynth.SynthEdges(PacketBytes, Settings, 26, 1000000000, Random)] for PacketBytes in Packets]
+      for Engine in Engines:
+         DisplayResult("MONITOR " + Engine, Jitter, BenchMonitor(Frames, Engine))
+      DisplayResult("RX", Jitter, BenchRx(Frames))
+      DisplayResult("RXMATCH", Jitter, BenchRxMatch(Frames, ConfigIndex))
+      FecFrames = [[PacketBytes, Pi433MHzSynth.SynthEdges(PacketBytes, Settings, 26, 1000000000, FecRandom)] for PacketBytes in FecPackets]
+      DisplayResult("RX FEC", Jitter, BenchRx(FecFrames, Pi433MHzPacket.PACKET_VERSION_FEC))
+   sys.stdout.write("\n")
+
+
+
+if __name__ == "__main__":
+   main()
@@ -0,0 +1,421 @@
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* Pi433MHzCapture - 433MHz receiver edge capture backends.                 */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* Provides a common interface for capturing the level changes (edges) of  */
+#/* a 433MHz receiver GPIO pin. Each edge is time stamped when it occurs and */
+#/* read by the decoding application in batches, so the application can     */
+#/* block waiting for data rather than polling the GPIO pin continuously.    */
+#/*                                                                          */
+#/* POLL      - Original polling of the GPIO pin, uses 100% of a CPU core.   */
+#/* EDGE      - RPi.GPIO interrupt driven edge callbacks, time stamped into  */
+#/*             a queue read by the application.                             */
+#/* CHARDEV   - Linux GPIO character device, v2 line event API. Edges are   */
+#/*             time stamped by the kernel in nanoseconds and read in bulk. */
+#/* SIMULATED - Replays a list of edges, for testing without hardware.       */
+#/*                                                                          */
+#/* RPi.GPIO is only imported by the POLL and EDGE backends. Each backend    */
+#/* except SIMULATED can also hold the transmitter GPIO pin off, so the      */
+#/* receiver is not swamped by the transmitter.                              */
+#/****************************************************************************/
+
+
+
+import os
+import time
+import fcntl
+import select
+import struct
+import queue
+import Pi433MHzWave
+
+
+
+# Capture edge field names.
+EDGE_RX_PIN = 0
+EDGE_LEVEL = 1
+EDGE_TIME = 2
+
+# Maximum number of edges held waiting to be read by the application.
+EDGE_QUEUE_SIZE = 65536
+
+# Capture backend names.
+BACKEND_POLL = "POLL"
+BACKEND_EDGE = "EDGE"
+BACKEND_CHARDEV = "CHARDEV"
+BACKEND_SIMULATED = "SIMULATED"
+
+
+
+# GPIO character device connected to the Raspberry Pi header pins.
+GPIO_CHIP_PATH = "/dev/gpiochip0"
+# Name to identify the lines requested from the GPIO character device.
+GPIO_CONSUMER = "Pi433MHz"
+# Number of line events buffered by the kernel.
+CHARDEV_EVENT_BUFFER_SIZE = 1024
+# Maximum number of line events read with each read() system call.
+CHARDEV_READ_EVENTS = 256
+
+# GPIO character device v2 API, from linux/gpio.h.
+GPIO_V2_LINES_MAX = 64
+GPIO_V2_LINE_NUM_ATTRS_MAX = 10
+GPIO_V2_LINE_FLAG_INPUT = (1 << 2)
+GPIO_V2_LINE_FLAG_OUTPUT = (1 << 3)
+GPIO_V2_LINE_FLAG_EDGE_RISING = (1 << 4)
+GPIO_V2_LINE_FLAG_EDGE_FALLING = (1 << 5)
+GPIO_V2_LINE_FLAG_BIAS_PULL_UP = (1 << 8)
+GPIO_V2_LINE_ATTR_ID_OUTPUT_VALUES = 2
+GPIO_V2_LINE_EVENT_RISING_EDGE = 1
+GPIO_V2_LINE_EVENT_FALLING_EDGE = 2
+# struct gpio_v2_line_request, the request fd is the last field.
+GPIO_V2_LINE_REQUEST = struct.Struct("={:d}I32sQI5I{:s}II5Ii".format(GPIO_V2_LINES_MAX, "IIQQ" * GPIO_V2_LINE_NUM_ATTRS_MAX))
+GPIO_V2_GET_LINE_IOCTL = (3 << 30) | (GPIO_V2_LINE_REQUEST.size << 16) | (0xB4 << 8) | 0x07
+# struct gpio_v2_line_event: timestamp_ns, id, offset, seqno, line_seqno, padding[6].
+GPIO_V2_LINE_EVENT = struct.Struct("=QIIII6I")
+
+
+
+# Configure the Raspberry Pi GPIO interface for a list of receiver pins, and the transmitter pin switched off when given.
+def GpioSetup(RxPins, TxPin=None, TxOffLevel=Pi433MHzWave.TX_OFF_LEVEL):
+   import RPi.GPIO
+
+   RPi.GPIO.setwarnings(False)
+   RPi.GPIO.setmode(RPi.GPIO.BCM)
+   if TxPin != None:
+      RPi.GPIO.setup(TxPin, RPi.GPIO.OUT, initial=TxOffLevel)
+   for RxPin in RxPins:
+      RPi.GPIO.setup(RxPin, RPi.GPIO.IN, pull_up_down=RPi.GPIO.PUD_UP)
+
+   return RPi.GPIO
+
+
+
+# Request lines from a GPIO character device, with the flags and [ID, VALUE, MASK] attributes.
+# Returns the line request fd.
+def RequestLines(ChipPath, Pins, Flags, Attributes=[], EventBufferSize=0):
+   if len(Pins) > GPIO_V2_LINES_MAX:
+      raise ValueError("Too many GPIO pins: {:d}".format(len(Pins)))
+   Offsets = list(Pins) + [0] * (GPIO_V2_LINES_MAX - len(Pins))
+   Attrs = []
+   for Id, Value, Mask in Attributes:
+      Attrs.extend([Id, 0, Value, Mask])
+   Attrs.extend([0] * (4 * (GPIO_V2_LINE_NUM_ATTRS_MAX - len(Attributes))))
+   Request = bytearray(GPIO_V2_LINE_REQUEST.pack(*(Offsets + [GPIO_CONSUMER.encode("ascii"), Flags, len(Attributes)] + [0] * 5 \
+      + Attrs + [len(Pins), EventBufferSize] + [0] * 5 + [-1])))
+   ChipFd = os.open(ChipPath, os.O_RDONLY)
+   try:
+      fcntl.ioctl(ChipFd, GPIO_V2_GET_LINE_IOCTL, Request)
+   finally:
+      os.close(ChipFd)
+
+   return GPIO_V2_LINE_REQUEST.unpack(bytes(Request))[-1]
+
+
+
+# Interface implemented by all capture backends.
+# Read() returns a list of [EDGE_RX_PIN, EDGE_LEVEL, EDGE_TIME] edges, where
+# EDGE_LEVEL is the new GPIO level after the edge and EDGE_TIME is integer
+# nanoseconds on the monotonic clock, unaffected by system clock adjustments.
+# An empty list is returned if no edges occur within the timeout period.
+class CaptureBackend:
+   def __init__(self, RxPins, TxPin=None, TxOffLevel=Pi433MHzWave.TX_OFF_LEVEL):
+      self.RxPins = list(RxPins)
+      # Transmitter pin held off while capturing, or None.
+      self.TxPin = TxPin
+      self.TxOffLevel = TxOffLevel
+      # Number of edges known to have been lost by the backend.
+      self.DroppedCount = 0
+      # Number of edges delivered to the application.
+      self.EdgeCount = 0
+
+
+   # Start capturing edges.
+   def Open(self):
+      pass
+
+
+   # Stop capturing edges.
+   def Close(self):
+      pass
+
+
+   # Current time, on the same time base as the edge time stamps.
+   def Now(self):
+      return time.monotonic_ns()
+
+
+   # Wait up to the timeout period in nanoseconds for edges and return all edges captured.
+   def Read(self, TimeoutNs):
+      raise NotImplementedError
+
+
+   # True when the backend has no more edges to deliver.
+   def IsFinished(self):
+      return False
+
+
+
+# Original polling capture, continuously reading the GPIO pin level.
+class PollBackend(CaptureBackend):
+   def __init__(self, RxPins, TxPin=None, TxOffLevel=Pi433MHzWave.TX_OFF_LEVEL):
+      CaptureBackend.__init__(self, RxPins, TxPin, TxOffLevel)
+      self.Gpio = None
+      self.LastGpioLevels = {}
+
+
+   def Open(self):
+      self.Gpio = GpioSetup(self.RxPins, self.TxPin, self.TxOffLevel)
+      for RxPin in self.RxPins:
+         self.LastGpioLevels[RxPin] = self.Gpio.input(RxPin)
+
+
+   def Read(self, TimeoutNs):
+      Edges = []
+      EndPeriod = time.monotonic_ns() + TimeoutNs
+      while len(Edges) == 0:
+         ThisPeriod = time.monotonic_ns()
+         for RxPin in self.RxPins:
+            GpioLevel = self.Gpio.input(RxPin)
+            if GpioLevel != self.LastGpioLevels[RxPin]:
+               self.LastGpioLevels[RxPin] = GpioLevel
+               Edges.append([RxPin, GpioLevel, ThisPeriod])
+         if ThisPeriod >= EndPeriod:
+            break
+      self.EdgeCount += len(Edges)
+
+      return Edges
+
+
+
+# Interrupt driven capture, using RPi.GPIO edge detection callbacks on both edges.
+class EdgeBackend(CaptureBackend):
+   def __init__(self, RxPins, TxPin=None, TxOffLevel=Pi433MHzWave.TX_OFF_LEVEL):
+      CaptureBackend.__init__(self, RxPins, TxPin, TxOffLevel)
+      self.Gpio = None
+      self.EdgeQueue = queue.Queue(EDGE_QUEUE_SIZE)
+      self.LastGpioLevels = {}
+
+
+   def Open(self):
+      self.Gpio = GpioSetup(self.RxPins, self.TxPin, self.TxOffLevel)
+      for RxPin in self.RxPins:
+         self.LastGpioLevels[RxPin] = self.Gpio.input(RxPin)
+         self.Gpio.add_event_detect(RxPin, self.Gpio.BOTH, callback=self.EdgeCallback)
+
+
+   def Close(self):
+      if self.Gpio != None:
+         for RxPin in self.RxPins:
+            self.Gpio.remove_event_detect(RxPin)
+
+
+   # Called from the RPi.GPIO event thread for every edge, time stamp the edge first.
+   def EdgeCallback(self, RxPin):
+      EdgeTime = time.monotonic_ns()
+      GpioLevel = self.Gpio.input(RxPin)
+      # The same level seen twice means a pair of edges was too short to be seen.
+      if GpioLevel == self.LastGpioLevels[RxPin]:
+         self.DroppedCount += 2
+         return
+      self.LastGpioLevels[RxPin] = GpioLevel
+      try:
+         self.EdgeQueue.put_nowait([RxPin, GpioLevel, EdgeTime])
+      except queue.Full:
+         self.DroppedCount += 1
+
+
+   def Read(self, TimeoutNs):
+      Edges = []
+      try:
+         Edges.append(self.EdgeQueue.get(True, TimeoutNs / 1000000000.0))
+         while True:
+            Edges.append(self.EdgeQueue.get_nowait())
+      except queue.Empty:
+         pass
+      self.EdgeCount += len(Edges)
+
+      return Edges
+
+
+
+# Pack a GPIO character device line event, as read from a line request fd.
+def PackLineEvent(TimeStampNs, RxPin, Level, SeqNo=0, LineSeqNo=0):
+   if Level == 1:
+      EventId = GPIO_V2_LINE_EVENT_RISING_EDGE
+   else:
+      EventId = GPIO_V2_LINE_EVENT_FALLING_EDGE
+
+   return GPIO_V2_LINE_EVENT.pack(TimeStampNs, EventId, RxPin, SeqNo, LineSeqNo, 0, 0, 0, 0, 0, 0)
+
+
+
+# Linux GPIO character device capture, reading kernel time stamped line events in bulk.
+# Line events are time stamped on the monotonic clock, the same clock as time.monotonic_ns().
+# A line request fd can be provided, such as a pipe replaying recorded line events, in
+# which case the time is taken from the line event time stamps rather than the clock.
+class CharDevBackend(CaptureBackend):
+   def __init__(self, RxPins, ChipPath=GPIO_CHIP_PATH, LineFd=None, TxPin=None, TxOffLevel=Pi433MHzWave.TX_OFF_LEVEL):
+      CaptureBackend.__init__(self, RxPins, TxPin, TxOffLevel)
+      self.ChipPath = ChipPath
+      self.LineFd = LineFd
+      self.TxFd = None
+      self.SimulatedClock = (LineFd != None)
+      self.SimulatedTime = 0
+      self.Poll = None
+      self.ReadBuffer = b""
+      self.Finished = False
+      self.LastLineSeqNos = {}
+      # Number of read() system calls made.
+      self.ReadCount = 0
+
+
+   # Request the receiver pins as input lines, with events for both edges, and the transmitter pin as an output line
+   # switched off, which is held until the backend is closed.
+   def Open(self):
+      if self.LineFd == None:
+         Flags = GPIO_V2_LINE_FLAG_INPUT | GPIO_V2_LINE_FLAG_EDGE_RISING | GPIO_V2_LINE_FLAG_EDGE_FALLING | GPIO_V2_LINE_FLAG_BIAS_PULL_UP
+         self.LineFd = RequestLines(self.ChipPath, self.RxPins, Flags, [], CHARDEV_EVENT_BUFFER_SIZE)
+         if self.TxPin != None:
+            self.TxFd = RequestLines(self.ChipPath, [self.TxPin], GPIO_V2_LINE_FLAG_OUTPUT, \
+               [[GPIO_V2_LINE_ATTR_ID_OUTPUT_VALUES, self.TxOffLevel, 1]])
+      self.Poll = select.poll()
+      self.Poll.register(self.LineFd, select.POLLIN)
+
+
+   def Close(self):
+      if self.LineFd != None:
+         os.close(self.LineFd)
+         self.LineFd = None
+      if self.TxFd != None:
+         os.close(self.TxFd)
+         self.TxFd = None
+
+
+   def Now(self):
+      if self.SimulatedClock == True:
+         return self.SimulatedTime
+      else:
+         return time.monotonic_ns()
+
+
+   def Read(self, TimeoutNs):
+      Edges = []
+      if self.Finished == False and len(self.Poll.poll(TimeoutNs // 1000000)) > 0:
+         Data = os.read(self.LineFd, GPIO_V2_LINE_EVENT.size * CHARDEV_READ_EVENTS)
+         self.ReadCount += 1
+         if len(Data) == 0:
+            self.Finished = True
+         # Keep any partial line event until the remainder is read.
+         Data = self.ReadBuffer + Data
+         EventsSize = len(Data) - len(Data) % GPIO_V2_LINE_EVENT.size
+         self.ReadBuffer = Data[EventsSize:]
+         for LineEvent in GPIO_V2_LINE_EVENT.iter_unpack(Data[:EventsSize]):
+            TimeStampNs, EventId, RxPin, SeqNo, LineSeqNo = LineEvent[:5]
+            # Gaps in the line sequence numbers are events lost by the kernel.
+            LastLineSeqNo = self.LastLineSeqNos.get(RxPin, LineSeqNo - 1)
+            if LineSeqNo > LastLineSeqNo + 1:
+               self.DroppedCount += LineSeqNo - LastLineSeqNo - 1
+            self.LastLineSeqNos[RxPin] = LineSeqNo
+            if EventId == GPIO_V2_LINE_EVENT_RISING_EDGE:
+               GpioLevel = 1
+            else:
+               GpioLevel = 0
+            Edges.append([RxPin, GpioLevel, TimeStampNs])
+      if self.SimulatedClock == True:
+         if len(Edges) > 0:
+            self.SimulatedTime = Edges[-1][EDGE_TIME]
+         else:
+            self.SimulatedTime += TimeoutNs
+      self.EdgeCount += len(Edges)
+
+      return Edges
+
+
+   def IsFinished(self):
+      return self.Finished
+
+
+
+# Simulated capture, replaying a list of edges on a simulated clock. There is no transmitter, so the transmitter pin is ignored.
+class SimulatedBackend(CaptureBackend):
+   def __init__(self, RxPins, Edges=None, StartTime=0, TxPin=None, TxOffLevel=Pi433MHzWave.TX_OFF_LEVEL):
+      CaptureBackend.__init__(self, RxPins, TxPin, TxOffLevel)
+      self.Edges = []
+      self.EdgeIndex = 0
+      self.SimulatedTime = StartTime
+      if Edges != None:
+         self.AddEdges(Edges)
+
+
+   # Add edges to be replayed, edges must be in time order.
+   def AddEdges(self, Edges):
+      self.Edges.extend(Edges)
+
+
+   # Add edges from a list of [LEVEL, PERIOD] pulses, with periods in nanoseconds, starting after the last edge added.
+   def AddPulses(self, RxPin, Pulses):
+      if len(self.Edges) > 0:
+         ThisPeriod = self.Edges[-1][EDGE_TIME]
+      else:
+         ThisPeriod = self.SimulatedTime
+      for Level, Period in Pulses:
+         ThisPeriod += Period
+         # The edge at the end of a pulse changes the level away from the pulse level.
+         self.Edges.append([RxPin, 1 - Level, ThisPeriod])
+
+
+   def Now(self):
+      return self.SimulatedTime
+
+
+   def Read(self, TimeoutNs):
+      Edges = []
+      EndPeriod = self.SimulatedTime + TimeoutNs
+      while self.EdgeIndex < len(self.Edges) and self.Edges[self.EdgeIndex][EDGE_TIME] <= EndPeriod:
+         Edges.append(self.Edges[self.EdgeIndex])
+         self.EdgeIndex += 1
+      if len(Edges) > 0:
+         self.SimulatedTime = Edges[-1][EDGE_TIME]
+      else:
+         self.SimulatedTime = EndPeriod
+      self.EdgeCount += len(Edges)
+
+      return Edges
+
+
+   def IsFinished(self):
+      return self.EdgeIndex >= len(self.Edges)
+
+
+
+# Create a capture backend by name, holding the transmitter pin off when given.
+def CreateBackend(BackendName, RxPins, TxPin=None, TxOffLevel=Pi433MHzWave.TX_OFF_LEVEL, **Options):
+   if BackendName == BACKEND_POLL:
+      Backend = PollBackend(RxPins, TxPin, TxOffLevel)
+   elif BackendName == BACKEND_EDGE:
+      Backend = EdgeBackend(RxPins, TxPin, TxOffLevel)
+   elif BackendName == BACKEND_CHARDEV:
+      Backend = CharDevBackend(RxPins, TxPin=TxPin, TxOffLevel=TxOffLevel, **Options)
+   elif BackendName == BACKEND_SIMULATED:
+      Backend = SimulatedBackend(RxPins, TxPin=TxPin, TxOffLevel=TxOffLevel, **Options)
+   else:
+      raise ValueError("Unknown capture backend: {:s}".format(BackendName))
+
+   return Backend
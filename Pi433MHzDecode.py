@@ -0,0 +1,572 @@
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* Pi433MHzDecode - 433MHz received data decoder.                           */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* Decodes the data levels and periods received by Pi433MHz.py into the     */
+#/* various views of the data logged, shared with the Pi433MHzReplay.py      */
+#/* application to decode recorded data. Only the selected views are         */
+#/* formatted, once the data is to be logged.                                */
+#/* Received edges are captured into RX data rows without a GPIO dependency, */
+#/* so other applications can capture and decode edges from any source.      */
+#/*                                                                          */
+#/* PYTHON - Original decoding, one data row and bit at a time.              */
+#/* NUMPY  - Vectorised decoding with NumPy, for decoding large amounts of   */
+#/*          recorded data. Produces identical output to the PYTHON engine. */
+#/****************************************************************************/
+
+
+
+import Pi433MHzCapture
+import Pi433MHzPulse
+import Pi433MHzLineCode
+
+
+
+# When converting 5V signal to 3V3 signal for Raspberry Pi GPIO, NPN transistor inverts the signal.
+RX_BIT_INVERT = 1
+# Period of no RX data to consider end of RX data message, in nanoseconds.
+RX_END_PERIOD = 10000000
+# Smallest period of high or low signal to consider noise rather than data, and flag as bad data, in nanoseconds.
+RX_REJECT_PERIOD = 5000
+# Ignore extra bits at start of transmission.
+RX_START_BITS = 1
+# RX Signature size, number of hex values to use as a signature.
+RX_SIGNATURE_SIZE = 4
+
+# RX data field names.
+DATA_SEQUENCE = Pi433MHzPulse.DATA_SEQUENCE
+DATA_RX_PIN = Pi433MHzPulse.DATA_RX_PIN
+DATA_LEVEL = Pi433MHzPulse.DATA_LEVEL
+DATA_PERIOD = Pi433MHzPulse.DATA_PERIOD
+
+# Decoded RX data field names.
+DECODED_SIZE = 0
+DECODED_MIN_LOW_SEQ = 1
+DECODED_MIN_LOW = 2
+DECODED_MIN_HIGH_SEQ = 3
+DECODED_MIN_HIGH = 4
+DECODED_BITS = 5
+DECODED_BYTES = 6
+DECODED_ALT_BYTES = 7
+DECODED_RX_SIGNATURE = 8
+DECODED_BAD_DATA = 9
+# Detected line code [LINE CODE, UNIT, BYTES], or None if not decoded.
+DECODED_LINE_CODE = 10
+
+# Log entry view names.
+VIEW_BINARY = "BINARY"
+VIEW_HEX = "HEX"
+VIEW_ALT_HEX = "ALT_HEX"
+VIEW_BYTE = "BYTE"
+VIEW_WORD_0 = "WORD0"
+VIEW_WORD_1 = "WORD1"
+VIEW_CHARACTER = "CHARACTER"
+VIEW_LINE_CODE = "LINE_CODE"
+# Views formatted into log entries when no views are specified.
+DECODE_VIEWS = [VIEW_BINARY, VIEW_HEX, VIEW_ALT_HEX, VIEW_BYTE, VIEW_WORD_0, VIEW_WORD_1, VIEW_CHARACTER, VIEW_LINE_CODE]
+
+# Decoding engine names.
+ENGINE_PYTHON = "PYTHON"
+ENGINE_NUMPY = "NUMPY"
+# Decoding engine used when no engine is specified.
+DECODE_ENGINE = ENGINE_PYTHON
+
+# NumPy module, imported when first used as it is an optional dependency.
+numpy = None
+
+
+
+# Import NumPy if it is available, returns True if the NUMPY engine can be used.
+def NumPyAvailable():
+   global numpy
+
+   if numpy == None:
+      try:
+         import numpy
+      except ImportError:
+         return False
+
+   return True
+
+
+
+# Capture received level changes into a pulse buffer of RX data, to be decoded when the RX data is complete.
+# Edge times and RX data periods are integer nanoseconds.
+# Completed pulse buffers are taken from Pool, release them once decoded so they are reused.
+class RxDataCapture:
+   def __init__(self, RxPin, EndPeriod=RX_END_PERIOD, RejectPeriod=RX_REJECT_PERIOD, BitInvert=RX_BIT_INVERT, Pool=None):
+      self.RxPin = RxPin
+      self.EndPeriod = EndPeriod
+      self.RejectPeriod = RejectPeriod
+      self.BitInvert = BitInvert
+      if Pool == None:
+         Pool = Pi433MHzPulse.PulsePool()
+      self.Pool = Pool
+      # Number of level changes rejected as noise.
+      self.NoiseCount = 0
+      self.Reset()
+
+
+   # Reset data to start a new RX data capture.
+   def Reset(self):
+      self.Data = self.Pool.Get(self.RxPin)
+      self.BitPeriod = 0
+      self.LastGpioLevel = self.BitInvert
+
+
+   # Process a received level change at time ThisPeriod.
+   # Returns the previous RX data when this level change is after the end of data period, otherwise None.
+   def Edge(self, ThisPeriod, GpioLevel):
+      Data = None
+      DiffPeriod = ThisPeriod - self.BitPeriod
+      # An edge after the end of data period starts new RX data, so end the previous RX data first.
+      if len(self.Data) > 0 and DiffPeriod >= self.EndPeriod:
+         Data = self.Data
+         self.Reset()
+         DiffPeriod = ThisPeriod - self.BitPeriod
+
+      # If data level changes, log information about the data received.
+      if GpioLevel != self.LastGpioLevel:
+         if DiffPeriod < self.RejectPeriod:
+            self.NoiseCount += 1
+         else:
+            self.Data.Append(self.LastGpioLevel, DiffPeriod)
+            self.BitPeriod = ThisPeriod
+            self.LastGpioLevel = GpioLevel
+
+      return Data
+
+
+   # Returns the RX data when no data has been received for the end of data period at time Now, otherwise None.
+   def EndOfData(self, Now):
+      Data = None
+      if len(self.Data) > 0 and Now - self.BitPeriod >= self.EndPeriod:
+         Data = self.Data
+         self.Reset()
+
+      return Data
+
+
+
+# Capture received level changes from several receivers, with an RX data capture for each GPIO pin.
+# The captures share one pool of pulse buffers.
+class MultiPinCapture:
+   def __init__(self, RxPins, EndPeriod=RX_END_PERIOD, RejectPeriod=RX_REJECT_PERIOD, BitInvert=RX_BIT_INVERT, Pool=None):
+      if Pool == None:
+         Pool = Pi433MHzPulse.PulsePool()
+      self.Captures = {}
+      for RxPin in RxPins:
+         self.Captures[RxPin] = RxDataCapture(RxPin, EndPeriod, RejectPeriod, BitInvert, Pool)
+
+
+   # True when RX data is being captured on any GPIO pin.
+   def IsReceiving(self):
+      for Capture in self.Captures.values():
+         if len(Capture.Data) > 0:
+            return True
+
+      return False
+
+
+   # Number of level changes rejected as noise on all GPIO pins, since the count was last read.
+   def ReadNoiseCount(self):
+      NoiseCount = 0
+      for Capture in self.Captures.values():
+         NoiseCount += Capture.NoiseCount
+         Capture.NoiseCount = 0
+
+      return NoiseCount
+
+
+   # Process a capture edge [EDGE_RX_PIN, EDGE_LEVEL, EDGE_TIME] with the RX data capture for its GPIO pin.
+   # Returns the previous RX data on the GPIO pin when this level change is after the end of data period, otherwise None.
+   def Edge(self, Edge):
+      return self.Captures[Edge[Pi433MHzCapture.EDGE_RX_PIN]].Edge(Edge[Pi433MHzCapture.EDGE_TIME], Edge[Pi433MHzCapture.EDGE_LEVEL])
+
+
+   # Returns the list of RX data on all GPIO pins when no data has been received for the end of data period at time Now.
+   def EndOfData(self, Now):
+      Captures = []
+      for Capture in self.Captures.values():
+         Data = Capture.EndOfData(Now)
+         if Data != None:
+            Captures.append(Data)
+
+      return Captures
+
+
+
+# Capture a list of capture edges for one RX pin, returns the list of RX data captured.
+def CaptureEdges(Edges, RxPin, EndPeriod=RX_END_PERIOD, RejectPeriod=RX_REJECT_PERIOD, BitInvert=RX_BIT_INVERT):
+   Captures = []
+   Capture = RxDataCapture(RxPin, EndPeriod, RejectPeriod, BitInvert)
+   for Edge in Edges:
+      Data = Capture.Edge(Edge[Pi433MHzCapture.EDGE_TIME], Edge[Pi433MHzCapture.EDGE_LEVEL])
+      if Data != None:
+         Captures.append(Data)
+   if len(Capture.Data) > 0:
+      Captures.append(Capture.Data)
+
+   return Captures
+
+
+
+# Decode a pulse buffer of RX data received at the given date and time, into a log entry of the selected views.
+# Returns the log entry, True if the data is considered bad data, and the RX signature.
+def DecodeRxData(Data, Now, Engine=None, Views=None):
+   Decoded = DecodeRxFrame(Data, Engine, Views)
+
+   return FormatLogEntry(Decoded, Now, Views), Decoded[DECODED_BAD_DATA], Decoded[DECODED_RX_SIGNATURE]
+
+
+
+# Decode a pulse buffer of RX data into bits and bytes, without formatting a log entry.
+# Returns the decoded fields, so the log entry is only formatted when it is to be logged.
+# The line code is only detected when the LINE_CODE view is one of the selected views.
+def DecodeRxFrame(Data, Engine=None, Views=None):
+   if Engine == None:
+      Engine = DECODE_ENGINE
+   if Views == None:
+      Views = DECODE_VIEWS
+
+   if Engine == ENGINE_NUMPY:
+      Decoded = DecodeRxDataNumPy(Data)
+   else:
+      Decoded = DecodeRxDataPython(Data)
+
+   # Flag noisy data, all zero data and data too short for an RX signature as bad data.
+   if Decoded[DECODED_BITS] == None:
+      Decoded.extend(["", True, None])
+   else:
+      ByteData = Decoded[DECODED_BYTES]
+      AltByteData = Decoded[DECODED_ALT_BYTES]
+      RxSignature = "".join(["{:02X} ".format(Byte) for Byte in AltByteData[:RX_SIGNATURE_SIZE]])
+      BadDataFlag = any(ByteData) == False or len(AltByteData) < RX_SIGNATURE_SIZE or any(AltByteData) == False
+      # Record the line code the data was decoded with, detected from the level periods.
+      LineCode = None
+      if VIEW_LINE_CODE in Views:
+         LineCode = Pi433MHzLineCode.DecodeLineCode(Data, RX_END_PERIOD, RX_BIT_INVERT)
+      Decoded.extend([RxSignature, BadDataFlag, LineCode])
+
+   return Decoded
+
+
+
+# PYTHON decoding engine.
+def DecodeRxDataPython(Data):
+   StartBitCount = RX_START_BITS
+   AltStartBitCount = RX_START_BITS
+
+   # Calculate the data size once, for use later.
+   DataSize = len(Data)
+
+   # Itterate though the data to find the smallest period for a high level and smallest period for a low level.
+   # This will be considered the TX data rate for high and low signals.
+   MinLowPeriodSeqCount = 0
+   MinLowPeriod = RX_END_PERIOD
+   MinHighPeriodSeqCount = 0
+   MinHighPeriod = RX_END_PERIOD
+   Levels = Data.LevelView()
+   Periods = Data.PeriodView()
+   # Ignore the first and last couple of periods in case they are noise.
+   for Sequence in range(3, DataSize - 2):
+      if Levels[Sequence] == 0 and Periods[Sequence] < MinLowPeriod:
+         MinLowPeriodSeqCount = Sequence
+         MinLowPeriod = Periods[Sequence]
+      if Levels[Sequence] == 1 and Periods[Sequence] < MinHighPeriod:
+         MinHighPeriodSeqCount = Sequence
+         MinHighPeriod = Periods[Sequence]
+   Decoded = [DataSize, MinLowPeriodSeqCount, MinLowPeriod, MinHighPeriodSeqCount, MinHighPeriod, None, None, None]
+
+   # Check for data that looks erronious, which is not decoded.
+   if MinLowPeriod == RX_END_PERIOD or MinHighPeriod == RX_END_PERIOD \
+      or MinLowPeriod < RX_REJECT_PERIOD or MinHighPeriod < RX_REJECT_PERIOD:
+      return Decoded
+
+   # Data looks OK, store the binary data as ASCII digits, and groups of eight bits as byte data.
+   Bits = bytearray()
+   BitDataCount = 0
+   AltBitDataCount = 0
+   ByteDataCount = 0
+   AltByteDataCount = 0
+   ByteData = []
+   AltByteData = []
+   if RX_BIT_INVERT == 0:
+      LevelTest = 0
+   else:
+      LevelTest = 1
+   for Level, Period in zip(Levels, Periods):
+      if Period < RX_END_PERIOD:
+         if Level == LevelTest:
+            # Divide the data level period by the min period for the data level to calculate how many bits are of that level.
+            BitCount = int(round(Period / MinLowPeriod))
+            for Count in range(BitCount):
+               if StartBitCount > 0:
+                  StartBitCount -= 1
+               else:
+                  if BitDataCount % 8 == 0:
+                     ByteData.append(0)
+                     ByteDataCount += 1
+                  BitDataCount += 1
+                  Bits.append(48)
+                  ByteData[ByteDataCount - 1] = (ByteData[ByteDataCount - 1] << 1) + 0
+         else:
+            # Divide the data level period by the min period for the data level to calculate how many bits are of that level.
+            BitCount = int(round(Period / MinHighPeriod))
+            for Count in range(BitCount):
+               if StartBitCount > 0:
+                  StartBitCount -= 1
+               else:
+                  if BitDataCount % 8 == 0:
+                     ByteData.append(0)
+                     ByteDataCount += 1
+                  BitDataCount += 1
+                  Bits.append(49)
+                  ByteData[ByteDataCount - 1] = (ByteData[ByteDataCount - 1] << 1) + 1
+
+         # Received data decoded from single bit run = 0, double bit run = 1.
+         if BitCount <= 2:
+            if AltStartBitCount > 0:
+               AltStartBitCount -= 1
+            else:
+               if AltBitDataCount % 8 == 0:
+                  AltByteData.append(0)
+                  AltByteDataCount += 1
+               AltBitDataCount += 1
+               if BitCount == 1:
+                  AltByteData[AltByteDataCount - 1] = (AltByteData[AltByteDataCount - 1] << 1) + 0
+               elif BitCount == 2:
+                  AltByteData[AltByteDataCount - 1] = (AltByteData[AltByteDataCount - 1] << 1) + 1
+
+   Decoded[DECODED_BITS] = bytes(Bits)
+   Decoded[DECODED_BYTES] = ByteData
+   Decoded[DECODED_ALT_BYTES] = AltByteData
+
+   return Decoded
+
+
+
+# Format the selected views of decoded RX data received at the given date and time into a log entry.
+# Each part of the log entry is written once into a single buffer, rather than concatenating strings.
+# The GPIO pin the RX data was received on is logged when RxPin is given.
+def FormatLogEntry(Decoded, Now, Views=None, RxPin=None):
+   if Views == None:
+      Views = DECODE_VIEWS
+
+   LogEntry = []
+   Write = LogEntry.append
+
+   # Log the date and time of the RX data, and the smallest periods considered the TX data rate for low and high levels.
+   Write(Now.strftime("%Y-%m-%d %H:%M:%S\n"))
+   if RxPin != None:
+      Write("RX PIN: {:d}\n".format(RxPin))
+   Write("DATA SIZE: {:d} MIN LOW PERIOD: [{:d}] {:f} MIN HIGH PERIOD: [{:d}] {:f}\n".format(Decoded[DECODED_SIZE], \
+      Decoded[DECODED_MIN_LOW_SEQ], Decoded[DECODED_MIN_LOW] / 1000000000.0, Decoded[DECODED_MIN_HIGH_SEQ], Decoded[DECODED_MIN_HIGH] / 1000000000.0))
+
+   # Display an error rather than the data for data that looks erronious.
+   if Decoded[DECODED_BITS] == None:
+      Write("! BAD DATA REJECTED (NOISY) !\n")
+   else:
+      ByteData = Decoded[DECODED_BYTES]
+      AltByteData = Decoded[DECODED_ALT_BYTES]
+      ZeroFlag = (any(ByteData) == False)
+
+      if VIEW_BINARY in Views:
+         Write("\nBINARY DATA:\n")
+         Write(Decoded[DECODED_BITS].decode("ascii"))
+         Write("\n")
+
+      # Display the byte data in hex format.
+      if VIEW_HEX in Views:
+         Write("\nHEX DATA:\n")
+         Write(FormatHexRows(ByteData, 26))
+         if ZeroFlag == True:
+            Write("! BAD DATA REJECTED (ZERO) !")
+         Write("\n")
+
+      # Received data decoded from single bit run = 0, double bit run = 1.
+      if VIEW_ALT_HEX in Views:
+         Write("\nALT HEX DATA:\n")
+         Write(FormatHexRows(AltByteData, 26))
+         Write("\n")
+
+      # The RX signature and bad data flags are always logged.
+      Write("\nRX SIGNATURE: {:s}".format(Decoded[DECODED_RX_SIGNATURE]))
+      if ZeroFlag == True and VIEW_HEX not in Views:
+         Write("! BAD DATA REJECTED (ZERO) !")
+      if len(AltByteData) < RX_SIGNATURE_SIZE:
+         Write("! BAD DATA REJECTED (SIGNATURE) !")
+      if any(AltByteData) == False:
+         Write("! BAD DATA REJECTED (ZERO) !")
+      Write("\n")
+
+      # Display the byte data in decimal format.
+      if VIEW_BYTE in Views:
+         Write("\nBYTE DATA:\n")
+         Write(FormatRows(AltByteData, "{:3d} ", 19))
+         Write("\n")
+
+      # Display pairs of the byte data as 16 bit words in decimal format, with and without a one byte offset.
+      for Offset, View in [[0, VIEW_WORD_0], [1, VIEW_WORD_1]]:
+         if View in Views:
+            Write("\nWORD DATA OFFSET {:d}:\n".format(Offset))
+            Write(FormatWords(AltByteData, Offset, 20))
+            Write("\n")
+
+      # Display the byte data in ASCII format.
+      if VIEW_CHARACTER in Views:
+         Write("\nCHARACTER DATA:\n")
+         Write(bytes(AltByteData).decode("latin-1"))
+         Write("\n")
+
+      # Display the byte data decoded with the detected line code.
+      if VIEW_LINE_CODE in Views:
+         LineCode = Decoded[DECODED_LINE_CODE]
+         if LineCode == None:
+            Write("\nLINE CODE: ! NOT DECODED !\n")
+         else:
+            Write("\nLINE CODE: {:s} UNIT: {:f}\n".format(LineCode[Pi433MHzLineCode.DECODED_LINE_CODE], \
+               LineCode[Pi433MHzLineCode.DECODED_UNIT] / 1000000000.0))
+            Write(FormatHexRows(LineCode[Pi433MHzLineCode.DECODED_BYTES], 26))
+         Write("\n")
+
+   Write("\n\n")
+
+   return "".join(LogEntry)
+
+
+
+# Format a list of values, adding a new line after each row of values.
+def FormatRows(Values, Format, RowSize):
+   Text = [Format.format(Value) for Value in Values]
+   for Count in range(RowSize - 1, len(Text), RowSize):
+      Text[Count] += "\n"
+
+   return "".join(Text)
+
+
+
+# Format a list of byte values as hex, converting each row of values at once.
+def FormatHexRows(Values, RowSize):
+   Text = []
+   for Count in range(0, len(Values), RowSize):
+      Row = bytes(Values[Count:Count + RowSize])
+      Text.append(Row.hex(" ").upper() + " ")
+      if len(Row) == RowSize:
+         Text.append("\n")
+
+   return "".join(Text)
+
+
+
+# Format pairs of byte values as 16 bit words in decimal format, starting Offset bytes into the first word.
+# A word is displayed after each second byte, adding a new line after each row of bytes.
+def FormatWords(Values, Offset, RowSize):
+   Text = []
+   DataWord = 0
+   for Count in range(len(Values)):
+      if Count % 2 == Offset:
+         DataWord = Values[Count]
+      else:
+         DataWord = (DataWord << 8) + Values[Count]
+         Text.append("{:6d} ".format(DataWord))
+      if Count % RowSize == RowSize - 1:
+         Text.append("\n")
+
+   return "".join(Text)
+
+
+
+# Pack groups of eight bits into bytes, most significant bit first. A bit
+# with a shift of zero takes a place in the byte without being shifted in.
+def PackBitGroups(Bits, Shifts):
+   GroupCount = (len(Bits) + 7) // 8
+   if GroupCount == 0:
+      return numpy.zeros(0, dtype=numpy.int64)
+
+   if numpy.all(Shifts == 1):
+      Bytes = numpy.packbits(Bits.astype(numpy.uint8)).astype(numpy.int64)
+      # The last partial byte is only shifted by the number of bits it holds.
+      if len(Bits) % 8 != 0:
+         Bytes[-1] >>= 8 - len(Bits) % 8
+   else:
+      # Each bit is shifted left once for every following shifted bit in its byte.
+      Groups = numpy.arange(len(Bits)) // 8
+      ShiftTotals = numpy.add.reduceat(Shifts, numpy.arange(0, len(Bits), 8))
+      ShiftsBefore = numpy.cumsum(ShiftTotals) - ShiftTotals
+      ShiftsAfter = ShiftTotals[Groups] + ShiftsBefore[Groups] - numpy.cumsum(Shifts)
+      Bytes = numpy.bincount(Groups, weights=(Bits * Shifts) << ShiftsAfter, minlength=GroupCount).astype(numpy.int64)
+
+   return Bytes
+
+
+
+# NUMPY decoding engine.
+def DecodeRxDataNumPy(Data):
+   if NumPyAvailable() == False:
+      raise ImportError("NumPy is required for the NUMPY decoding engine")
+
+   # Calculate the data size once, for use later.
+   DataSize = len(Data)
+   # Read the pulse buffer arrays in place.
+   Sequences = numpy.arange(DataSize)
+   Levels = numpy.frombuffer(Data.LevelView(), dtype=numpy.uint8)
+   Periods = numpy.frombuffer(Data.PeriodView(), dtype=numpy.uint32).astype(numpy.int64)
+
+   # Find the smallest period for a high level and smallest period for a low level.
+   # Ignore the first and last couple of periods in case they are noise.
+   SequenceMask = (Sequences > 2) & (Sequences < DataSize - 2) & (Periods < RX_END_PERIOD)
+   MinPeriods = []
+   for Level in [0, 1]:
+      Index = numpy.flatnonzero(SequenceMask & (Levels == Level))
+      if len(Index) == 0:
+         MinPeriods.append([0, RX_END_PERIOD])
+      else:
+         MinIndex = Index[numpy.argmin(Periods[Index])]
+         MinPeriods.append([int(Sequences[MinIndex]), int(Periods[MinIndex])])
+   MinLowPeriodSeqCount, MinLowPeriod = MinPeriods[0]
+   MinHighPeriodSeqCount, MinHighPeriod = MinPeriods[1]
+   Decoded = [DataSize, MinLowPeriodSeqCount, MinLowPeriod, MinHighPeriodSeqCount, MinHighPeriod, None, None, None]
+
+   # Check for data that looks erronious, which is not decoded.
+   if MinLowPeriod == RX_END_PERIOD or MinHighPeriod == RX_END_PERIOD \
+      or MinLowPeriod < RX_REJECT_PERIOD or MinHighPeriod < RX_REJECT_PERIOD:
+      return Decoded
+
+   # Calculate how many bits each data level period represents, dividing by the min period for the data level.
+   if RX_BIT_INVERT == 0:
+      LevelTest = 0
+   else:
+      LevelTest = 1
+   DataMask = (Periods < RX_END_PERIOD)
+   RowLevels = (Levels[DataMask] != LevelTest).astype(numpy.int64)
+   RowPeriods = Periods[DataMask]
+   BitCounts = numpy.rint(RowPeriods / numpy.where(RowLevels == 0, MinLowPeriod, MinHighPeriod)).astype(numpy.int64)
+
+   # Store the binary data as ASCII digits, and groups of eight bits as byte data.
+   Bits = numpy.repeat(RowLevels, BitCounts)[RX_START_BITS:]
+   Decoded[DECODED_BITS] = (Bits + ord("0")).astype(numpy.uint8).tobytes()
+   Decoded[DECODED_BYTES] = PackBitGroups(Bits, numpy.ones(len(Bits), dtype=numpy.int64)).tolist()
+
+   # Received data decoded from single bit run = 0, double bit run = 1.
+   AltBitCounts = BitCounts[BitCounts <= 2][RX_START_BITS:]
+   Decoded[DECODED_ALT_BYTES] = PackBitGroups((AltBitCounts == 2).astype(numpy.int64), (AltBitCounts > 0).astype(numpy.int64)).tolist()
+
+   return Decoded
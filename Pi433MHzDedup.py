@@ -0,0 +1,222 @@
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* Pi433MHzDedup - Repeated transmission de-duplication.                    */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* Key-fobs and sensors repeat the same data several times for each button */
+#/* press. A burst of repeated data is considered one transmission until no */
+#/* copy has been received for the window period.                            */
+#/*                                                                          */
+#/* BurstFilter - Identifies repeated copies of the same key.                */
+#/* BurstVoter  - Groups copies of byte data differing by a few bit errors,  */
+#/*               and repairs bit errors with a majority vote of each bit   */
+#/*               across the copies received. A burst handled for one key   */
+#/*               does not group copies matching a different key.            */
+#/* DiversitySelector - Groups the copies of one transmission received by   */
+#/*               several receivers, and selects the cleanest copy.          */
+#/****************************************************************************/
+
+
+
+import collections
+import Pi433MHzPacket
+
+
+
+# Burst fields.
+BURST_FIRST_TIME = 0
+BURST_LAST_TIME = 1
+BURST_COPIES = 2
+BURST_DATA = 3
+BURST_FLAG = 4
+
+
+
+# Count the number of bits which differ between two lists of byte data of the same length.
+def BitDifference(ByteData, OtherByteData):
+   Difference = 0
+   for Count in range(len(ByteData)):
+      Difference += bin(ByteData[Count] ^ OtherByteData[Count]).count("1")
+
+   return Difference
+
+
+
+# Majority vote of each bit across a list of copies of byte data, as long as the longest copy. Each byte is voted
+# by the copies long enough to have the byte, a tied vote takes the bit from the first of those copies.
+def MajorityVote(Copies):
+   VoteData = []
+   for Count in range(max([len(Copy) for Copy in Copies])):
+      Voters = [Copy for Copy in Copies if len(Copy) > Count]
+      Byte = 0
+      for BitCount in range(7, -1, -1):
+         BitMask = (1 << BitCount)
+         Votes = 0
+         for Copy in Voters:
+            if Copy[Count] & BitMask:
+               Votes += 1
+         if Votes * 2 > len(Voters) or (Votes * 2 == len(Voters) and Voters[0][Count] & BitMask):
+            Byte |= BitMask
+      VoteData.append(Byte)
+
+   return VoteData
+
+
+
+# Identify repeated copies of the same key within the window period, using an expiring cache of keys.
+class BurstFilter:
+   def __init__(self, Window):
+      self.Window = Window
+      self.Bursts = collections.OrderedDict()
+      # Number of repeated copies identified.
+      self.RepeatCount = 0
+
+
+   # Remove bursts which have not been received for the window period.
+   def Expire(self, Now):
+      while len(self.Bursts) > 0:
+         Key, Burst = next(iter(self.Bursts.items()))
+         if Now - Burst[BURST_LAST_TIME] <= self.Window:
+            break
+         del self.Bursts[Key]
+
+
+   # Returns True for the first copy of a key, False for a repeated copy within the window period.
+   def Check(self, Key, Now):
+      self.Expire(Now)
+      Burst = self.Bursts.pop(Key, None)
+      if Burst == None:
+         Burst = [Now, Now, 1, Key, False]
+         NewFlag = True
+      else:
+         Burst[BURST_LAST_TIME] = Now
+         Burst[BURST_COPIES] += 1
+         self.RepeatCount += 1
+         NewFlag = False
+      # Keep the bursts in order of the last copy received, so the oldest expire first.
+      self.Bursts[Key] = Burst
+
+      return NewFlag
+
+
+
+# Group copies of byte data differing by up to a maximum number of bit errors within the window
+# period, repairing bit errors with a majority vote of the copies.
+class BurstVoter:
+   def __init__(self, Window, MaxBitErrors=2):
+      self.Window = Window
+      self.MaxBitErrors = MaxBitErrors
+      self.Bursts = []
+      # Number of repeated copies identified.
+      self.RepeatCount = 0
+
+
+   # Remove bursts which have not been received for the window period.
+   def Expire(self, Now):
+      self.Bursts = [Burst for Burst in self.Bursts if Now - Burst[BURST_LAST_TIME] <= self.Window]
+
+
+   # Add a copy of byte data, returning the burst it belongs to and True if it is the first copy.
+   # The application sets the burst flag to the key a burst is handled for, such as the command run, and passes the
+   # key matched by each copy, or None when the copy does not match. A copy matching a different key does not join a
+   # handled burst, so another button pressed on the same remote is a new burst. Copies of different lengths are
+   # compared on the shorter length and kept at full length, so copies completed early from a matching prefix join
+   # the same burst as full copies.
+   def Add(self, ByteData, Now, Key=None):
+      self.Expire(Now)
+      for Burst in self.Bursts:
+         if Key != None and Burst[BURST_FLAG] != False and Burst[BURST_FLAG] != Key:
+            continue
+         VoteData = MajorityVote(Burst[BURST_DATA])
+         Count = min(len(VoteData), len(ByteData))
+         if BitDifference(VoteData[:Count], ByteData[:Count]) <= self.MaxBitErrors:
+            Burst[BURST_DATA].append(list(ByteData))
+            Burst[BURST_LAST_TIME] = Now
+            Burst[BURST_COPIES] += 1
+            self.RepeatCount += 1
+            return Burst, False
+
+      Burst = [Now, Now, 1, [list(ByteData)], False]
+      self.Bursts.append(Burst)
+
+      return Burst, True
+
+
+   # Byte data of a burst, repaired with a majority vote of the copies received.
+   def VoteData(self, Burst):
+      return MajorityVote(Burst[BURST_DATA])
+
+
+
+# Rank a frame for diversity selection, the frame with the least noise and then the smallest timing error is the cleanest.
+def FrameRank(Frame):
+   return [Frame[Pi433MHzPacket.FRAME_NOISE], Frame[Pi433MHzPacket.FRAME_ERROR]]
+
+
+
+# Group the frames of one transmission received on several GPIO pins, ending within the window period of the
+# first copy, and select the cleanest copy with the lowest rank. Frames are only returned once every GPIO pin
+# has received a copy, or the window period and end of data period have passed since the first copy.
+class DiversitySelector:
+   def __init__(self, RxPins, Window, EndPeriod, Rank=FrameRank):
+      self.PinCount = len(RxPins)
+      self.Window = Window
+      self.EndPeriod = EndPeriod
+      self.Rank = Rank
+      self.Copies = []
+      # Number of copies received on other GPIO pins and not selected.
+      self.RepeatCount = 0
+
+
+   # Select the cleanest copy of the frames received, and start a new group.
+   def Select(self):
+      Frame = min(self.Copies, key=self.Rank)
+      self.RepeatCount += len(self.Copies) - 1
+      self.Copies = []
+
+      return Frame
+
+
+   # Add a frame received on a GPIO pin, returns the list of selected frames ready to be processed.
+   def Add(self, Frame):
+      Frames = []
+      if len(self.Copies) > 0 and Frame[Pi433MHzPacket.FRAME_TIME] - self.Copies[0][Pi433MHzPacket.FRAME_TIME] > self.Window:
+         Frames.append(self.Select())
+      self.Copies.append(Frame)
+      if len(set([Copy[Pi433MHzPacket.FRAME_RX_PIN] for Copy in self.Copies])) >= self.PinCount:
+         Frames.append(self.Select())
+
+      return Frames
+
+
+   # Period from time Now until Poll() selects the copies held, or None if no copies are held, in nanoseconds.
+   def NextDeadline(self, Now):
+      if len(self.Copies) == 0:
+         return None
+
+      return max(self.Copies[0][Pi433MHzPacket.FRAME_TIME] + self.Window + self.EndPeriod + 1 - Now, 0)
+
+
+   # Returns the list of selected frames when no more copies can be received at time Now.
+   def Poll(self, Now):
+      Frames = []
+      if len(self.Copies) > 0 and Now - self.Copies[0][Pi433MHzPacket.FRAME_TIME] > self.Window + self.EndPeriod:
+         Frames.append(self.Select())
+
+      return Frames
@@ -0,0 +1,121 @@
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* Pi433MHzDispatch - Run commands in the background.                       */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* Runs the commands for matched data in a pool of background worker       */
+#/* threads, so data continues to be received while a slow command runs.    */
+#/* The number of each command queued or running at once is limited, and   */
+#/* commands running longer than the timeout period are killed.             */
+#/****************************************************************************/
+
+
+
+import os
+import sys
+import time
+import signal
+import threading
+import subprocess
+import Pi433MHzRing
+
+
+
+# Command dispatcher, commands are queued in a ring buffer and run by a pool of worker threads.
+class CommandDispatcher:
+   def __init__(self, WorkerCount=2, QueueSize=16, CommandLimit=1, Timeout=30.0):
+      self.CommandLimit = CommandLimit
+      self.Timeout = Timeout
+      self.Lock = threading.Lock()
+      # Number of each command queued or running.
+      self.CommandCounts = {}
+      # Number of commands not run because too many of the same command were queued or running.
+      self.LimitedCount = 0
+      # Number of commands killed for running longer than the timeout period.
+      self.TimeoutCount = 0
+      # Number of commands completed.
+      self.CompletedCount = 0
+      self.Ring = Pi433MHzRing.RingBuffer(QueueSize)
+      self.Workers = Pi433MHzRing.WorkerPool(self.Ring, self.RunCommand, WorkerCount)
+
+
+   def Start(self):
+      self.Workers.Start()
+
+
+   # Wait for queued commands to complete, then stop the worker threads.
+   def Stop(self):
+      self.Workers.Stop()
+
+
+   # Number of commands waiting for a worker thread.
+   def QueueDepth(self):
+      return self.Ring.Depth()
+
+
+   # Number of commands not run because the queue was full.
+   def DroppedCount(self):
+      return self.Ring.DroppedCount
+
+
+   # Queue a command to be run, returns False if the command will not be run.
+   def Submit(self, Command):
+      with self.Lock:
+         CommandCount = self.CommandCounts.get(Command, 0)
+         if CommandCount >= self.CommandLimit:
+            self.LimitedCount += 1
+            return False
+         self.CommandCounts[Command] = CommandCount + 1
+
+      if self.Ring.Put([Command, time.monotonic()]) == False:
+         self.CommandDone(Command)
+         return False
+
+      return True
+
+
+   def CommandDone(self, Command):
+      with self.Lock:
+         self.CommandCounts[Command] -= 1
+         if self.CommandCounts[Command] == 0:
+            del self.CommandCounts[Command]
+
+
+   # Run a queued command, called by the worker threads.
+   def RunCommand(self, QueueItem):
+      Command, QueueTime = QueueItem
+      try:
+         StartTime = time.monotonic()
+         Process = subprocess.Popen(Command, shell=True, start_new_session=True)
+         try:
+            Result = Process.wait(timeout=self.Timeout)
+         except subprocess.TimeoutExpired:
+            # Kill the command and any processes it started.
+            os.killpg(Process.pid, signal.SIGKILL)
+            Result = Process.wait()
+            with self.Lock:
+               self.TimeoutCount += 1
+            sys.stdout.write("COMMAND TIMEOUT: {:s}\n".format(Command))
+         EndTime = time.monotonic()
+         sys.stdout.write("COMMAND COMPLETE: {:s} RESULT: {:d} QUEUED: {:f} RUN: {:f}\n".format(Command, Result, StartTime - QueueTime, EndTime - StartTime))
+         sys.stdout.flush()
+         with self.Lock:
+            self.CompletedCount += 1
+      finally:
+         self.CommandDone(Command)
@@ -0,0 +1,163 @@
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* Pi433MHzFec - CRC and forward error correction of data packets.          */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* CRC-16 - CRC-16/CCITT-FALSE, polynomial 0x1021, initial value 0xFFFF,    */
+#/*          calculated a byte at a time from a table.                       */
+#/* FEC    - Each 4 bits of data are sent as a Hamming(7,4) code word with  */
+#/*          an extra parity bit, one byte per 4 bits of data. A single bit */
+#/*          error in each byte is corrected, two bit errors are detected.  */
+#/*          Each block of 8 bytes is interleaved, sending bit 0 of each    */
+#/*          byte, then bit 1 of each byte, and so on. So a burst of up to   */
+#/*          8 bit errors corrupts only one bit of each byte, and is         */
+#/*          corrected.                                                      */
+#/****************************************************************************/
+
+
+
+# CRC-16 polynomial and initial value.
+CRC16_POLYNOMIAL = 0x1021
+CRC16_INITIAL = 0xFFFF
+# Number of bytes interleaved in each FEC block.
+FEC_BLOCK_SIZE = 8
+
+# Decoded FEC byte fields.
+HAMMING_DATA = 0
+HAMMING_CORRECTED = 1
+HAMMING_ERROR = 2
+
+
+
+# Table of the CRC-16 of each byte value.
+def Crc16Table():
+   Table = []
+   for Byte in range(256):
+      Crc = (Byte << 8)
+      for Count in range(8):
+         if Crc & 0x8000:
+            Crc = ((Crc << 1) ^ CRC16_POLYNOMIAL) & 0xFFFF
+         else:
+            Crc = (Crc << 1) & 0xFFFF
+      Table.append(Crc)
+
+   return Table
+
+
+
+CRC16_TABLE = Crc16Table()
+
+
+
+# CRC-16 of a list of bytes.
+def Crc16(ByteData, Crc=CRC16_INITIAL):
+   for Byte in ByteData:
+      Crc = ((Crc << 8) & 0xFFFF) ^ CRC16_TABLE[(Crc >> 8) ^ Byte]
+
+   return Crc
+
+
+
+# Hamming(7,4) code word with an extra parity bit for 4 bits of data, d1 d2 d3 d4 p1 p2 p3 p0.
+def HammingCodeWord(Nibble):
+   D1 = (Nibble >> 3) & 1
+   D2 = (Nibble >> 2) & 1
+   D3 = (Nibble >> 1) & 1
+   D4 = Nibble & 1
+   P1 = D1 ^ D2 ^ D4
+   P2 = D1 ^ D3 ^ D4
+   P3 = D2 ^ D3 ^ D4
+   CodeWord = (Nibble << 4) | (P1 << 3) | (P2 << 2) | (P3 << 1)
+
+   return CodeWord | (bin(CodeWord).count("1") & 1)
+
+
+
+HAMMING_ENCODE = [HammingCodeWord(Nibble) for Nibble in range(16)]
+
+
+
+# Table of the decoded [HAMMING_DATA, HAMMING_CORRECTED, HAMMING_ERROR] of each received byte value, from the nearest
+# code word. A byte two bits from a code word is equally near to several code words, and is flagged as an error.
+def HammingDecodeTable():
+   Table = []
+   for Byte in range(256):
+      Distances = [bin(Byte ^ CodeWord).count("1") for CodeWord in HAMMING_ENCODE]
+      Distance = min(Distances)
+      Table.append([Distances.index(Distance), int(Distance == 1), int(Distance > 1)])
+
+   return Table
+
+
+
+HAMMING_DECODE = HammingDecodeTable()
+
+
+
+# Interleave a block of 8 bytes, byte n of the result holds bit n of each byte. Interleaving twice restores the block.
+def InterleaveBlock(Block):
+   Result = []
+   for BitCount in range(7, -1, -1):
+      Byte = 0
+      for Count in range(FEC_BLOCK_SIZE):
+         Byte = (Byte << 1) | ((Block[Count] >> BitCount) & 1)
+      Result.append(Byte)
+
+   return Result
+
+
+
+# Number of bytes sent for DataSize bytes of data with FEC, a whole number of blocks.
+def FecSize(DataSize):
+   return -(-2 * DataSize // FEC_BLOCK_SIZE) * FEC_BLOCK_SIZE
+
+
+
+# Encode a list of bytes with FEC, each byte as two code words, padded to a whole number of interleaved blocks.
+def FecEncode(ByteData):
+   CodeWords = []
+   for Byte in ByteData:
+      CodeWords.append(HAMMING_ENCODE[Byte >> 4])
+      CodeWords.append(HAMMING_ENCODE[Byte & 0x0F])
+   CodeWords.extend([HAMMING_ENCODE[0]] * (FecSize(len(ByteData)) - len(CodeWords)))
+
+   FecData = []
+   for Count in range(0, len(CodeWords), FEC_BLOCK_SIZE):
+      FecData.extend(InterleaveBlock(CodeWords[Count:Count + FEC_BLOCK_SIZE]))
+
+   return FecData
+
+
+
+# Decode a list of FEC bytes, a whole number of interleaved blocks.
+# Returns the decoded bytes, including any padding, the number of bits corrected and the number of bytes with uncorrectable errors.
+def FecDecode(FecData):
+   ByteData = []
+   CorrectedCount = 0
+   ErrorCount = 0
+   for Count in range(0, len(FecData) - FEC_BLOCK_SIZE + 1, FEC_BLOCK_SIZE):
+      Block = InterleaveBlock(FecData[Count:Count + FEC_BLOCK_SIZE])
+      for Index in range(0, FEC_BLOCK_SIZE, 2):
+         High = HAMMING_DECODE[Block[Index]]
+         Low = HAMMING_DECODE[Block[Index + 1]]
+         ByteData.append((High[HAMMING_DATA] << 4) | Low[HAMMING_DATA])
+         CorrectedCount += High[HAMMING_CORRECTED] + Low[HAMMING_CORRECTED]
+         ErrorCount += High[HAMMING_ERROR] + Low[HAMMING_ERROR]
+
+   return ByteData, CorrectedCount, ErrorCount
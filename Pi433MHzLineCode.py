@@ -0,0 +1,405 @@
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* Pi433MHzLineCode - 433MHz line code decoders and line code detection.    */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* A registry of decoders for the ways devices encode bits into the levels */
+#/* transmitted, decoding the levels and periods in a pulse buffer. The     */
+#/* line code of received data is detected from a histogram of the level    */
+#/* periods, then a second pass over the levels counting sync gaps and the   */
+#/* phases of levels in units of the shortest period.                        */
+#/*                                                                          */
+#/* MARK  - Level with the transmitter on.                                   */
+#/* SPACE - Level with the transmitter off.                                  */
+#/* UNIT  - Shortest period of a level, the clock of the line code.         */
+#/*                                                                          */
+#/* EV1527     - Fixed code remotes, PWM with a 1:31 sync, 24 bit codes.     */
+#/* PWM        - Pulse width, each bit a mark and space, long mark = 1.      */
+#/* PPM        - Pulse position, fixed marks, long space = 1.                */
+#/* MANCHESTER - Each bit a half unit of each level, space to mark = 1.      */
+#/* PULSE      - Each level a bit, one unit = 0, two units = 1, as sent by   */
+#/*              Pi433MHzTx.py, after a start level.                         */
+#/* NRZ        - Each unit of a level a bit, mark = 1.                       */
+#/****************************************************************************/
+
+
+
+import math
+import collections
+
+
+
+# Line code names.
+LINE_CODE_EV1527 = "EV1527"
+LINE_CODE_PWM = "PWM"
+LINE_CODE_PPM = "PPM"
+LINE_CODE_MANCHESTER = "MANCHESTER"
+LINE_CODE_PULSE = "PULSE"
+LINE_CODE_NRZ = "NRZ"
+
+# Histogram bins for each doubling of a level period.
+HISTOGRAM_BINS_PER_OCTAVE = 8
+# Smallest fraction of the levels of a type in a cluster of periods, smaller clusters are considered noise.
+CLUSTER_MIN_FRACTION = 0.1
+# Shortest space, in units, considered a sync gap between code words rather than data.
+SYNC_MIN_UNITS = 8
+# Largest fraction of levels which do not fit the line code before decoding fails.
+MAX_ERROR_FRACTION = 0.1
+# Number of bits in an EV1527 code word.
+EV1527_BITS = 24
+# Number of start levels before the data of a PULSE frame, the same as RX_START_BITS in Pi433MHzDecode.py.
+PULSE_START_LEVELS = 1
+
+# Level period shape fields.
+SHAPE_UNIT = 0
+SHAPE_MARKS = 1
+SHAPE_SPACES = 2
+SHAPE_SYNC = 3
+# Number of two unit levels starting an even and an odd number of units from the first level.
+SHAPE_PHASES = 4
+
+# Registry fields.
+LINE_CODE_DECODER = 0
+LINE_CODE_MATCH = 1
+
+# Decoded line code fields.
+DECODED_LINE_CODE = 0
+DECODED_UNIT = 1
+DECODED_BYTES = 2
+
+
+
+# Registered line codes, in the order they are tried when detecting the line code of received data.
+LineCodes = collections.OrderedDict()
+
+
+
+# Register a line code decoder. Decoder(Marks, Widths, Shape) returns a list of bits, or None if the
+# levels do not decode. Match(Shape) returns True if the level period shape could be the line code.
+# Line codes registered without Before are tried last.
+def RegisterLineCode(Name, Decoder, Match, Before=None):
+   LineCodes[Name] = [Decoder, Match]
+   if Before != None:
+      # Move the line code and the line codes after it, to be tried before the existing line code.
+      MoveFlag = False
+      for Key in list(LineCodes.keys()):
+         if Key == Before:
+            MoveFlag = True
+         if MoveFlag == True and Key != Name:
+            LineCodes.move_to_end(Key)
+
+
+
+# Read the levels of a pulse buffer, as mark flags and periods in nanoseconds, leaving out gaps of the end of data period or longer.
+# With BitInvert of 1, a GPIO level of 0 is a mark.
+def PulseWidths(Data, EndPeriod, BitInvert):
+   Marks = []
+   Widths = []
+   for Level, Period in zip(Data.LevelView(), Data.PeriodView()):
+      if Period < EndPeriod:
+         Marks.append(Level != BitInvert)
+         Widths.append(Period)
+
+   return Marks, Widths
+
+
+
+# Group the periods of one type of level into clusters, from a histogram with logarithmic bins.
+# Returns the mean period of each cluster, shortest first.
+def HistogramClusters(Bins, LevelCount):
+   Clusters = []
+   MinCount = max(2, LevelCount * CLUSTER_MIN_FRACTION)
+   Count = 0
+   Total = 0
+   LastBin = None
+   for Bin in sorted(Bins.keys()) + [None]:
+      # Adjacent bins are the same cluster, an empty bin ends a cluster.
+      if Bin == None or (LastBin != None and Bin > LastBin + 1):
+         if Count >= MinCount:
+            Clusters.append(Total / Count)
+         Count = 0
+         Total = 0
+      if Bin != None:
+         Count += Bins[Bin][0]
+         Total += Bins[Bin][1]
+      LastBin = Bin
+
+   return Clusters
+
+
+
+# Measure the shape of the level periods, with one pass over the levels for the histograms of mark and space periods,
+# and a second pass in units of the shortest cluster period.
+# Returns [SHAPE_UNIT, SHAPE_MARKS, SHAPE_SPACES, SHAPE_SYNC, SHAPE_PHASES], the shortest cluster period, the cluster
+# periods for marks and spaces, the number of sync gaps and the phases of the two unit levels.
+def PulseShape(Marks, Widths):
+   Histograms = [{}, {}]
+   LevelCounts = [0, 0]
+   for Mark, Width in zip(Marks, Widths):
+      Bin = int(math.log2(max(Width, 1)) * HISTOGRAM_BINS_PER_OCTAVE)
+      Histogram = Histograms[int(Mark)]
+      if Bin in Histogram:
+         Histogram[Bin][0] += 1
+         Histogram[Bin][1] += Width
+      else:
+         Histogram[Bin] = [1, Width]
+      LevelCounts[int(Mark)] += 1
+
+   MarkClusters = HistogramClusters(Histograms[1], LevelCounts[1])
+   SpaceClusters = HistogramClusters(Histograms[0], LevelCounts[0])
+   if len(MarkClusters) + len(SpaceClusters) == 0:
+      return [0, [], [], 0, [0, 0]]
+   Unit = min(MarkClusters + SpaceClusters)
+
+   # Long spaces are sync gaps between code words, rather than data.
+   SyncCount = 0
+   Phases = [0, 0]
+   UnitCount = 0
+   for Mark, Width in zip(Marks, Widths):
+      if Mark == False and Width >= SYNC_MIN_UNITS * Unit:
+         SyncCount += 1
+      Units = int(round(Width / Unit))
+      if Units == 2:
+         Phases[UnitCount & 1] += 1
+      UnitCount += Units
+   SpaceClusters = [Width for Width in SpaceClusters if Width < SYNC_MIN_UNITS * Unit]
+
+   return [Unit, MarkClusters, SpaceClusters, SyncCount, Phases]
+
+
+
+# Period between the short and long clusters of a type of level.
+def ClusterThreshold(Clusters):
+   return math.sqrt(Clusters[0] * Clusters[-1])
+
+
+
+# Pack a list of bits into bytes, most significant bit first. The last partial byte holds the remaining bits.
+def PackBits(Bits):
+   ByteData = []
+   for Count in range(0, len(Bits), 8):
+      Byte = 0
+      for Bit in Bits[Count:Count + 8]:
+         Byte = (Byte << 1) | Bit
+      ByteData.append(Byte)
+
+   return ByteData
+
+
+
+# NRZ, each unit of a level is a bit, mark = 1.
+def DecodeNrz(Marks, Widths, Shape):
+   Bits = []
+   for Mark, Width in zip(Marks, Widths):
+      Bits.extend([int(Mark)] * int(round(Width / Shape[SHAPE_UNIT])))
+
+   return Bits
+
+
+
+def MatchNrz(Shape):
+   return Shape[SHAPE_UNIT] > 0
+
+
+
+# PULSE, each level is a bit, one unit = 0, two units = 1. The start levels are not data.
+def DecodePulse(Marks, Widths, Shape):
+   Bits = []
+   ErrorCount = 0
+   for Width in Widths[PULSE_START_LEVELS:]:
+      Units = int(round(Width / Shape[SHAPE_UNIT]))
+      if Units == 1:
+         Bits.append(0)
+      elif Units == 2:
+         Bits.append(1)
+      else:
+         ErrorCount += 1
+   if ErrorCount > MAX_ERROR_FRACTION * len(Widths):
+      return None
+
+   return Bits
+
+
+
+def MatchPulse(Shape):
+   return len(Shape[SHAPE_MARKS]) <= 2 and len(Shape[SHAPE_SPACES]) <= 2 and Shape[SHAPE_UNIT] > 0 \
+      and max(Shape[SHAPE_MARKS] + Shape[SHAPE_SPACES]) < 2.5 * Shape[SHAPE_UNIT]
+
+
+
+# MANCHESTER, each bit is a half of each level, space to mark = 1 and mark to space = 0.
+def DecodeManchester(Marks, Widths, Shape):
+   Halves = []
+   for Mark, Width in zip(Marks, Widths):
+      Units = int(round(Width / Shape[SHAPE_UNIT]))
+      if Units < 1 or Units > 2:
+         return None
+      Halves.extend([int(Mark)] * Units)
+
+   # Each bit has a level change in the middle, find which half starts the bits.
+   for Offset in [0, 1]:
+      Bits = []
+      for Count in range(Offset, len(Halves) - 1, 2):
+         if Halves[Count] == Halves[Count + 1]:
+            Bits = None
+            break
+         Bits.append(Halves[Count + 1])
+      if Bits != None and len(Bits) > 0:
+         return Bits
+
+   return None
+
+
+
+# Two unit levels are the second half of a bit and the first half of the next bit, so all start in the same phase.
+# Two unit levels of other line codes, such as PULSE, start in either phase.
+def MatchManchester(Shape):
+   return MatchPulse(Shape) and min(Shape[SHAPE_PHASES]) <= MAX_ERROR_FRACTION * sum(Shape[SHAPE_PHASES]) \
+      and sum(Shape[SHAPE_PHASES]) > 0
+
+
+
+# PWM, each bit is a mark then a space, a mark longer than the space = 1. Sync gaps separate code words.
+# Returns the bits of each code word, as a list of lists.
+def DecodePwmWords(Marks, Widths, Shape):
+   if len(Shape[SHAPE_MARKS]) < 2:
+      return None
+   Threshold = ClusterThreshold(Shape[SHAPE_MARKS])
+   SyncPeriod = SYNC_MIN_UNITS * Shape[SHAPE_UNIT]
+   Words = [[]]
+   PairCount = 0
+   ErrorCount = 0
+   # Start at the first mark, a final mark without a space is a sync mark.
+   Count = Marks.index(True) if True in Marks else len(Marks)
+   while Count + 1 < len(Marks):
+      if Widths[Count + 1] >= SyncPeriod:
+         if len(Words[-1]) > 0:
+            Words.append([])
+      else:
+         LongMark = (Widths[Count] > Threshold)
+         # A long mark has a short space and a short mark has a long space.
+         if LongMark == (Widths[Count + 1] > Threshold):
+            ErrorCount += 1
+         Words[-1].append(int(LongMark))
+         PairCount += 1
+      Count += 2
+   if PairCount == 0 or ErrorCount > MAX_ERROR_FRACTION * PairCount:
+      return None
+
+   return [Word for Word in Words if len(Word) > 0]
+
+
+
+def DecodePwm(Marks, Widths, Shape):
+   Words = DecodePwmWords(Marks, Widths, Shape)
+   if Words == None:
+      return None
+
+   return [Bit for Word in Words for Bit in Word]
+
+
+
+def MatchPwm(Shape):
+   return len(Shape[SHAPE_MARKS]) == 2 and len(Shape[SHAPE_SPACES]) == 2
+
+
+
+# EV1527, PWM with a 1:3 mark ratio and a sync gap before each 24 bit code word. Decodes the first complete code word.
+def DecodeEv1527(Marks, Widths, Shape):
+   Words = DecodePwmWords(Marks, Widths, Shape)
+   if Words != None:
+      for Word in Words:
+         if len(Word) == EV1527_BITS:
+            return Word
+
+   return None
+
+
+
+# Long sync gaps can be received as the end of data, ending the frame after each code word.
+def MatchEv1527(Shape):
+   return MatchPwm(Shape) and 2.4 < Shape[SHAPE_MARKS][1] / Shape[SHAPE_MARKS][0] < 4.5
+
+
+
+# PPM, fixed period marks, each space is a bit, a long space = 1.
+def DecodePpm(Marks, Widths, Shape):
+   Threshold = ClusterThreshold(Shape[SHAPE_SPACES])
+   SyncPeriod = SYNC_MIN_UNITS * Shape[SHAPE_UNIT]
+   MarkPeriod = Shape[SHAPE_MARKS][0]
+   Bits = []
+   ErrorCount = 0
+   for Mark, Width in zip(Marks, Widths):
+      if Mark == True:
+         # Marks of two periods are too close to be separate clusters with a lot of jitter, so check all marks are the same period.
+         if abs(Width - MarkPeriod) > MarkPeriod / 4:
+            ErrorCount += 1
+      elif Width < SyncPeriod:
+         Bits.append(int(Width > Threshold))
+   if ErrorCount > MAX_ERROR_FRACTION * len(Widths):
+      return None
+
+   return Bits
+
+
+
+def MatchPpm(Shape):
+   return len(Shape[SHAPE_MARKS]) == 1 and len(Shape[SHAPE_SPACES]) == 2
+
+
+
+# Detect the line code of the levels, trying each registered line code which matches the level period shape.
+# Returns the name of the first line code to decode the levels and the bits decoded, or None and None.
+def DetectLineCode(Marks, Widths, Shape):
+   for Name, LineCode in LineCodes.items():
+      if LineCode[LINE_CODE_MATCH](Shape) == True:
+         Bits = LineCode[LINE_CODE_DECODER](Marks, Widths, Shape)
+         if Bits != None and len(Bits) > 0:
+            return Name, Bits
+
+   return None, None
+
+
+
+# Decode a pulse buffer with the named line code, or the detected line code when no name is given.
+# Returns [DECODED_LINE_CODE, DECODED_UNIT, DECODED_BYTES], the line code, unit period and byte data, or None if the levels do not decode.
+def DecodeLineCode(Data, EndPeriod, BitInvert, Name=None):
+   Marks, Widths = PulseWidths(Data, EndPeriod, BitInvert)
+   Shape = PulseShape(Marks, Widths)
+   if Shape[SHAPE_UNIT] == 0:
+      return None
+
+   if Name == None:
+      Name, Bits = DetectLineCode(Marks, Widths, Shape)
+   else:
+      Bits = LineCodes[Name][LINE_CODE_DECODER](Marks, Widths, Shape)
+   if Bits == None:
+      return None
+
+   return [Name, Shape[SHAPE_UNIT], PackBits(Bits)]
+
+
+
+# Line codes with the most distinctive level period shapes are tried first.
+RegisterLineCode(LINE_CODE_EV1527, DecodeEv1527, MatchEv1527)
+RegisterLineCode(LINE_CODE_PWM, DecodePwm, MatchPwm)
+RegisterLineCode(LINE_CODE_PPM, DecodePpm, MatchPpm)
+RegisterLineCode(LINE_CODE_MANCHESTER, DecodeManchester, MatchManchester)
+RegisterLineCode(LINE_CODE_PULSE, DecodePulse, MatchPulse)
+RegisterLineCode(LINE_CODE_NRZ, DecodeNrz, MatchNrz)
@@ -0,0 +1,127 @@
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* Pi433MHzLog - Buffered daily log file.                                   */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* Keeps the daily log file open, buffering log entries and writing them   */
+#/* to the SD card when the buffer is full or the flush period has passed,  */
+#/* rather than opening, writing and closing the log file for every entry.  */
+#/* A new log file is started at midnight, and the closed log file can be   */
+#/* compressed with gzip in the background. A closed log file is never      */
+#/* reopened, late log entries for a closed day are written to the current  */
+#/* log file.                                                                */
+#/****************************************************************************/
+
+
+
+import os
+import time
+import gzip
+import shutil
+import datetime
+import threading
+
+
+
+# Only one log file is compressed at a time, so two threads never append to the same compressed log file.
+CompressLock = threading.Lock()
+
+
+
+# Compress a closed log file with gzip, appending to any existing compressed log file.
+def CompressFile(FileName):
+   with CompressLock:
+      with open(FileName, 'rb') as InFile:
+         with gzip.open(FileName + ".gz", 'ab') as OutFile:
+            shutil.copyfileobj(InFile, OutFile)
+      os.remove(FileName)
+
+
+
+# Daily log file, FileNameFormat contains {:s} which is replaced with the date YYYY-MM-DD.
+class DailyLogFile:
+   def __init__(self, FileNameFormat, FlushSize=65536, FlushPeriod=5.0, CompressFlag=False):
+      self.FileNameFormat = FileNameFormat
+      self.FlushSize = FlushSize
+      self.FlushPeriod = FlushPeriod
+      self.CompressFlag = CompressFlag
+      self.File = None
+      self.FileName = ""
+      self.FileDate = ""
+      # Latest date of a closed log file, which is not reopened.
+      self.ClosedDate = ""
+      self.BufferSize = 0
+      self.FlushTime = time.monotonic()
+      # Number of times the log file has been written to the SD card.
+      self.FlushCount = 0
+
+
+   # Close the current log file, compressing it if required, and open the log file for a new date.
+   def Rotate(self, FileDate):
+      if self.File != None:
+         self.Flush()
+         self.File.close()
+         self.File = None
+         self.ClosedDate = max(self.ClosedDate, self.FileDate)
+         # Only compress the log files of previous days.
+         if self.CompressFlag == True and self.FileDate != datetime.datetime.now().strftime("%Y-%m-%d"):
+            Compress = threading.Thread(target=CompressFile, args=(self.FileName,))
+            Compress.start()
+      self.FileDate = FileDate
+      if FileDate != "":
+         self.FileName = self.FileNameFormat.format(FileDate)
+         self.File = open(self.FileName, 'a', self.FlushSize)
+
+
+   # Write text to the log file for the date and time of the log entry.
+   def Write(self, Now, Text):
+      FileDate = Now.strftime("%Y-%m-%d")
+      # A log entry for a closed day, such as one decoded just before midnight, is written to the current log file.
+      if FileDate <= self.ClosedDate:
+         FileDate = self.FileDate
+         if FileDate == "":
+            FileDate = datetime.datetime.now().strftime("%Y-%m-%d")
+      if FileDate != self.FileDate:
+         self.Rotate(FileDate)
+      self.File.write(Text)
+      self.BufferSize += len(Text)
+      if self.BufferSize >= self.FlushSize or time.monotonic() - self.FlushTime >= self.FlushPeriod:
+         self.Flush()
+
+
+   # Write the buffered log entries to the log file.
+   def Flush(self):
+      if self.File != None and self.BufferSize > 0:
+         self.File.flush()
+         self.FlushCount += 1
+      self.BufferSize = 0
+      self.FlushTime = time.monotonic()
+
+
+   # Called periodically, flushes the buffer when the flush period has passed and closes the log file after midnight.
+   def Poll(self):
+      if self.File != None:
+         if datetime.datetime.now().strftime("%Y-%m-%d") != self.FileDate:
+            self.Rotate("")
+         elif time.monotonic() - self.FlushTime >= self.FlushPeriod:
+            self.Flush()
+
+
+   def Close(self):
+      self.Rotate("")
@@ -0,0 +1,344 @@
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* Pi433MHzMatch - 433MHz received data signature matching.                 */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* Loads the data signatures and commands from Pi433MHzRxMatch.ini into a   */
+#/* byte level prefix tree, so received byte data can be matched against    */
+#/* thousands of data signatures in the time taken to walk the received     */
+#/* bytes once, rather than comparing against every data signature.         */
+#/*                                                                          */
+#/* Each line of the configuration file is HEX_DATA_SIGNATURE=COMMAND, the   */
+#/* data signature matching the start of the received data. When several    */
+#/* data signatures match, the longest data signature is used.               */
+#/*                                                                          */
+#/* HEX_DATA_SIGNATURE:MAX_BIT_ERRORS=COMMAND also matches received data     */
+#/* differing from the data signature by up to MAX_BIT_ERRORS bits, when no */
+#/* data signature matches exactly. Data signatures are held as integers     */
+#/* and compared with XOR and a count of the bits set. Each data signature   */
+#/* is split into MAX_BIT_ERRORS + 1 parts, at least one of which must match */
+#/* exactly, so only data signatures sharing a part with the received data  */
+#/* are compared. Received data within the bit errors of data signatures     */
+#/* for different commands is ambiguous, and does not match.                 */
+#/*                                                                          */
+#/* SignatureParser walks the prefix tree as each byte is received, so a     */
+#/* match is known as soon as a data signature is complete, without waiting */
+#/* for the end of the received data.                                        */
+#/*                                                                          */
+#/* ConfigWatcher reloads the configuration file in a background thread     */
+#/* when it changes, building a new signature index for the application to  */
+#/* swap in between frames. A configuration file with errors is reported    */
+#/* and the previous signature index is kept.                                */
+#/****************************************************************************/
+
+
+
+import sys
+import threading
+import Pi433MHzPacket
+import Pi433MHzWatch
+
+
+
+# Config data fields:
+CONFIG_ELEMENT_MATCH = 0
+CONFIG_ELEMENT_COMMAND = 1
+# Optional maximum number of bit errors, config elements without it only match exactly.
+CONFIG_ELEMENT_MAX_BIT_ERRORS = 2
+
+# Prefix tree node fields.
+NODE_CHILDREN = 0
+NODE_ELEMENT = 1
+NODE_NIBBLE_ELEMENTS = 2
+
+# Bit error tolerant data signature fields.
+TOLERANT_SIGNATURE = 0
+TOLERANT_MAX_BIT_ERRORS = 1
+TOLERANT_ELEMENT = 2
+
+# Number of bytes received after a data signature matches, while a longer data signature could still match.
+MATCH_GRACE_BYTES = 2
+# Period to wait for the configuration file to change before checking again, in seconds.
+CONFIG_POLL_PERIOD = 2.0
+
+
+
+# Read a configuration data file, returning a list of [MATCH, COMMAND] or [MATCH, COMMAND, MAX_BIT_ERRORS] config elements.
+def LoadConfig(FileName):
+   ConfigData = []
+   File = open(FileName, 'r')
+   LineCount = 0
+   for TextLine in File:
+      LineCount += 1
+      TextLine = TextLine.replace("\n", "")
+      if TextLine != "":
+         Element = TextLine.split("=", 1)
+         if len(Element) != 2 or len(Element[CONFIG_ELEMENT_MATCH]) == 0:
+            File.close()
+            raise ValueError("{:s} line {:d}: expected HEX_DATA_SIGNATURE=COMMAND".format(FileName, LineCount))
+         # Split an optional maximum number of bit errors from the data signature.
+         Signature = Element[CONFIG_ELEMENT_MATCH].split(":", 1)
+         if len(Signature) == 2:
+            Element[CONFIG_ELEMENT_MATCH] = Signature[0]
+            try:
+               Element.append(int(Signature[1]))
+            except ValueError:
+               Element.append(-1)
+            if Element[CONFIG_ELEMENT_MAX_BIT_ERRORS] < 0 or Element[CONFIG_ELEMENT_MAX_BIT_ERRORS] >= 4 * len(Signature[0]):
+               File.close()
+               raise ValueError("{:s} line {:d}: invalid max bit errors {:s}".format(FileName, LineCount, Signature[1]))
+         try:
+            int(Element[CONFIG_ELEMENT_MATCH], 16)
+         except ValueError:
+            File.close()
+            raise ValueError("{:s} line {:d}: invalid hex data signature {:s}".format(FileName, LineCount, Element[CONFIG_ELEMENT_MATCH]))
+         ConfigData.append(Element)
+   File.close()
+
+   return ConfigData
+
+
+
+# Prefix tree of data signatures, each byte of a data signature is one level of the tree.
+# A data signature with an odd number of hex digits ends with the high nibble of a byte.
+class SignatureIndex:
+   def __init__(self, ConfigData=None):
+      self.Root = [{}, None, {}]
+      self.Count = 0
+      # Bit error tolerant data signatures, grouped by [BIT_LENGTH, PARTS], with a dictionary of part values for each part.
+      self.TolerantGroups = {}
+      # Number of bytes received before all bit error tolerant data signatures can be compared.
+      self.TolerantBytes = 0
+      if ConfigData != None:
+         for ConfigElement in ConfigData:
+            self.Add(ConfigElement)
+
+
+   # Add a config element to the prefix tree, the first of any duplicate data signatures is kept.
+   def Add(self, ConfigElement):
+      Match = ConfigElement[CONFIG_ELEMENT_MATCH]
+      Node = self.Root
+      for Count in range(0, len(Match) - 1, 2):
+         Byte = int(Match[Count:Count + 2], 16)
+         if Byte not in Node[NODE_CHILDREN]:
+            Node[NODE_CHILDREN][Byte] = [{}, None, {}]
+         Node = Node[NODE_CHILDREN][Byte]
+      NewFlag = False
+      if len(Match) % 2 == 1:
+         if int(Match[-1], 16) not in Node[NODE_NIBBLE_ELEMENTS]:
+            Node[NODE_NIBBLE_ELEMENTS][int(Match[-1], 16)] = ConfigElement
+            NewFlag = True
+      elif Node[NODE_ELEMENT] == None:
+         Node[NODE_ELEMENT] = ConfigElement
+         NewFlag = True
+      if NewFlag == True and len(ConfigElement) > CONFIG_ELEMENT_MAX_BIT_ERRORS and ConfigElement[CONFIG_ELEMENT_MAX_BIT_ERRORS] > 0:
+         self.AddTolerant(ConfigElement)
+      self.Count += 1
+
+
+   # Add a bit error tolerant config element to the bucket of each of its parts.
+   def AddTolerant(self, ConfigElement):
+      Match = ConfigElement[CONFIG_ELEMENT_MATCH]
+      MaxBitErrors = ConfigElement[CONFIG_ELEMENT_MAX_BIT_ERRORS]
+      BitLength = 4 * len(Match)
+      Parts = MaxBitErrors + 1
+      Signature = int(Match, 16)
+      Tolerant = [Signature, MaxBitErrors, ConfigElement]
+      Buckets = self.TolerantGroups.setdefault((BitLength, Parts), [{} for Part in range(Parts)])
+      for Part, [Shift, Mask] in enumerate(SignatureParts(BitLength, Parts)):
+         Buckets[Part].setdefault((Signature >> Shift) & Mask, []).append(Tolerant)
+      self.TolerantBytes = max(self.TolerantBytes, (BitLength + 7) // 8)
+
+
+   # Find the config element with the longest data signature matching the start of the byte data.
+   # Returns None if no data signature matches.
+   def Match(self, ByteData):
+      MatchElement = None
+      Node = self.Root
+      for Byte in ByteData:
+         NibbleElement = Node[NODE_NIBBLE_ELEMENTS].get(Byte >> 4)
+         if NibbleElement != None:
+            MatchElement = NibbleElement
+         Node = Node[NODE_CHILDREN].get(Byte)
+         if Node == None:
+            break
+         if Node[NODE_ELEMENT] != None:
+            MatchElement = Node[NODE_ELEMENT]
+
+      if MatchElement == None and len(self.TolerantGroups) > 0:
+         MatchElement = self.TolerantMatch(ByteData)
+
+      return MatchElement
+
+
+   # Find the bit error tolerant config element within its maximum bit errors of the start of the byte data.
+   # Returns None if no data signature, or data signatures for more than one command, are within their maximum bit errors.
+   def TolerantMatch(self, ByteData):
+      MatchElement = None
+      for [BitLength, Parts], Buckets in self.TolerantGroups.items():
+         ByteCount = (BitLength + 7) // 8
+         if len(ByteData) >= ByteCount:
+            Data = int.from_bytes(bytes(ByteData[:ByteCount]), "big") >> (8 * ByteCount - BitLength)
+            # At least one part of the data is the same as a data signature within its maximum bit errors.
+            for Part, [Shift, Mask] in enumerate(SignatureParts(BitLength, Parts)):
+               for Tolerant in Buckets[Part].get((Data >> Shift) & Mask, []):
+                  if bin(Data ^ Tolerant[TOLERANT_SIGNATURE]).count("1") <= Tolerant[TOLERANT_MAX_BIT_ERRORS]:
+                     if MatchElement == None:
+                        MatchElement = Tolerant[TOLERANT_ELEMENT]
+                     elif MatchElement[CONFIG_ELEMENT_COMMAND] != Tolerant[TOLERANT_ELEMENT][CONFIG_ELEMENT_COMMAND]:
+                        return None
+
+      return MatchElement
+
+
+
+# Split a data signature of BitLength bits into Parts parts, returns the [SHIFT, MASK] of each part.
+def SignatureParts(BitLength, Parts):
+   SignatureParts = []
+   for Part in range(Parts):
+      Start = Part * BitLength // Parts
+      End = (Part + 1) * BitLength // Parts
+      SignatureParts.append([BitLength - End, (1 << (End - Start)) - 1])
+
+   return SignatureParts
+
+
+
+# Match received byte data against a signature index as each byte is received, as a StartBitDecoder parser.
+# The frame is completed once a data signature matches and no longer data signature can match, or GraceBytes after
+# the first match. Frames which cannot match are not rejected, so they are still received in full for logging and
+# repairing bit errors from repeated copies.
+class SignatureParser:
+   def __init__(self, Index, GraceBytes=MATCH_GRACE_BYTES):
+      self.Index = Index
+      self.GraceBytes = GraceBytes
+      self.Reset()
+
+
+   # Match following frames against a new signature index, only call between frames.
+   def SetIndex(self, Index):
+      self.Index = Index
+      self.Reset()
+
+
+   # Reset the parser to start a new frame.
+   def Reset(self):
+      self.State = Pi433MHzPacket.PARSE_SIGNATURE
+      self.Node = self.Index.Root
+      self.MatchElement = None
+      self.GraceCount = 0
+      self.ByteData = []
+
+
+   # Parse the next byte of the frame, returns the parser state.
+   def Byte(self, Byte):
+      if self.State == Pi433MHzPacket.PARSE_SIGNATURE:
+         self.ByteData.append(Byte)
+         if self.Node != None:
+            NibbleElement = self.Node[NODE_NIBBLE_ELEMENTS].get(Byte >> 4)
+            if NibbleElement != None:
+               self.MatchElement = NibbleElement
+            self.Node = self.Node[NODE_CHILDREN].get(Byte)
+            if self.Node != None and self.Node[NODE_ELEMENT] != None:
+               self.MatchElement = self.Node[NODE_ELEMENT]
+
+         if self.Node == None or (len(self.Node[NODE_CHILDREN]) == 0 and len(self.Node[NODE_NIBBLE_ELEMENTS]) == 0):
+            # No longer data signature can match exactly.
+            if self.MatchElement != None:
+               self.State = Pi433MHzPacket.PARSE_COMPLETE
+            elif len(self.ByteData) >= self.Index.TolerantBytes:
+               # Once all bit error tolerant data signatures can be compared, no data signature can match.
+               if len(self.Index.TolerantGroups) > 0 and self.Index.TolerantMatch(self.ByteData) != None:
+                  self.State = Pi433MHzPacket.PARSE_COMPLETE
+               else:
+                  self.State = Pi433MHzPacket.PARSE_DATA
+         elif self.MatchElement != None:
+            # Wait a few bytes for a longer data signature to match.
+            self.GraceCount += 1
+            if self.GraceCount > self.GraceBytes:
+               self.State = Pi433MHzPacket.PARSE_COMPLETE
+
+      return self.State
+
+
+
+# Reload a configuration file into a new signature index when the file changes, in a background thread.
+class ConfigWatcher:
+   def __init__(self, FileName, PollPeriod=CONFIG_POLL_PERIOD):
+      self.FileName = FileName
+      self.PollPeriod = PollPeriod
+      self.Lock = threading.Lock()
+      self.StopEvent = threading.Event()
+      self.Watcher = None
+      self.Thread = None
+      # Signature index reloaded and waiting to be taken by the application.
+      self.NewIndex = None
+      # Number of times the configuration file has been reloaded, and failed to load.
+      self.ReloadCount = 0
+      self.ErrorCount = 0
+
+
+   def Start(self):
+      self.Watcher = Pi433MHzWatch.CreateWatcher(self.FileName)
+      self.Thread = threading.Thread(target=self.Run, daemon=True)
+      self.Thread.start()
+
+
+   def Stop(self):
+      self.StopEvent.set()
+      if self.Thread != None:
+         self.Thread.join()
+         self.Thread = None
+      if self.Watcher != None:
+         self.Watcher.Close()
+         self.Watcher = None
+
+
+   # Watch the configuration file until stopped, called by the watcher thread.
+   def Run(self):
+      while self.StopEvent.is_set() == False:
+         if self.Watcher.Wait(self.PollPeriod) == True and self.StopEvent.is_set() == False:
+            self.Reload()
+
+
+   # Load and index the configuration file, keeping the previous signature index if it has errors.
+   def Reload(self):
+      try:
+         Index = SignatureIndex(LoadConfig(self.FileName))
+      except (OSError, ValueError) as Error:
+         with self.Lock:
+            self.ErrorCount += 1
+         sys.stdout.write("CONFIG NOT RELOADED, KEEPING PREVIOUS CONFIG: {:s}\n".format(str(Error)))
+         sys.stdout.flush()
+         return
+
+      with self.Lock:
+         self.NewIndex = Index
+         self.ReloadCount += 1
+      sys.stdout.write("CONFIG RELOADED: {:s} {:d} DATA SIGNATURES\n".format(self.FileName, Index.Count))
+      sys.stdout.flush()
+
+
+   # Take the signature index reloaded since the last call, returns None if the configuration file has not been reloaded.
+   def TakeIndex(self):
+      with self.Lock:
+         Index = self.NewIndex
+         self.NewIndex = None
+
+      return Index
@@ -0,0 +1,500 @@
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* Pi433MHzPacket - 433MHz frame decoder and packet encoder.                */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* Decodes received edges into frames of byte data, starting with the     */
+#/* start bit period as the period of a binary 0. Short level = binary 0,   */
+#/* long level = binary 1. The short and long level periods are tracked as  */
+#/* the frame is received, so glitches and transmitter drift do not corrupt */
+#/* the rest of the frame. Edges from several receivers are decoded with    */
+#/* independent state for each GPIO pin. Encodes and decodes the example    */
+#/* data packet, which can also be parsed as each byte is received:          */
+#/*                                                                          */
+#/* SIGNITURE [4 bytes] - Unique identifier for each type of data being sent.*/
+#/* VERSION [1 byte]    - Packet format version, not sent for version 1.     */
+#/* DATA LEN [1 byte]   - Total number of bytes being transmitted.           */
+#/* DATA [1-255 bytes]  - Encrypted data.                                    */
+#/* CHECKSUM [1 byte]   - A checksum of the data sent to verify integrity.   */
+#/* CRC [2 bytes]       - Instead of CHECKSUM from version 2, a CRC-16 of   */
+#/*                       the signature, version, length and data.          */
+#/*                                                                          */
+#/* Version 3 sends DATA LEN, DATA and CRC with forward error correction,   */
+#/* see Pi433MHzFec.py.                                                      */
+#/*                                                                          */
+#/* Has no GPIO dependency, so can be used by other applications and for    */
+#/* decoding recorded or generated edges.                                    */
+#/****************************************************************************/
+
+
+
+import Pi433MHzCapture
+import Pi433MHzFec
+
+
+
+# Period of no RX data to consider end of RX data message, in nanoseconds.
+RX_END_PERIOD = 10000000
+# Smallest period of high or low signal to consider noise rather than data, and flag as bad data, in nanoseconds.
+RX_REJECT_PERIOD = 5000
+# Minimum number of bytes of data received to be considered valid.
+MIN_RX_BYTES = 4
+# Each level period moves the period of its cluster by 1 / 2 ** CLOCK_TRACKING_SHIFT of the difference.
+CLOCK_TRACKING_SHIFT = 3
+
+# Decoded frame fields.
+FRAME_DATA = 0
+FRAME_BIT_PERIOD = 1
+FRAME_TIME = 2
+FRAME_RX_PIN = 3
+# Number of level changes ignored as noise while the frame was received.
+FRAME_NOISE = 4
+# Mean difference in nanoseconds of each level period from a whole number of bit periods.
+FRAME_ERROR = 5
+
+# Data packet format versions.
+# Original format with an XOR checksum byte and no version byte.
+PACKET_VERSION_XOR = 1
+# Version byte and a CRC-16.
+PACKET_VERSION_CRC = 2
+# Version byte and a CRC-16, with forward error correction.
+PACKET_VERSION_FEC = 3
+
+# Data packet decoding results.
+PACKET_VALID = 0
+PACKET_INVALID_SIGNATURE = 1
+PACKET_INVALID_LENGTH = 2
+PACKET_INVALID_CHECKSUM = 3
+PACKET_INVALID_VERSION = 4
+
+# Packet parser states, for parsing frame byte data as each byte is received.
+PARSE_SIGNATURE = 0
+PARSE_LENGTH = 1
+PARSE_DATA = 2
+PARSE_CHECKSUM = 3
+# The frame is not a data packet, the rest of the frame is ignored.
+PARSE_REJECTED = 4
+# The data packet is complete, the frame is returned without waiting for the end of data period.
+PARSE_COMPLETE = 5
+PARSE_VERSION = 6
+
+
+
+# Recover the bit period of received levels, with online 1-D k-means clustering of the level periods into a cluster of
+# one bit period levels and a cluster of two bit period levels. Each level period moves the nearest cluster towards it,
+# so the bit period follows transmitter drift, while a single short glitch cannot become the bit period.
+class ClockRecovery:
+   def __init__(self, BitPeriod):
+      self.Reset(BitPeriod)
+
+
+   # Start clustering from a bit period, such as the start bit period.
+   def Reset(self, BitPeriod):
+      self.Clusters = [BitPeriod, 2 * BitPeriod]
+
+
+   # Current bit period estimate.
+   def BitPeriod(self):
+      return self.Clusters[0]
+
+
+   # Classify a level period as 1 or 2 bit periods, updating the cluster it is nearest to.
+   # Returns the number of bit periods and the difference from the cluster period, or 0 bit periods for a level
+   # shorter than half a bit period, which is noise.
+   def Level(self, Period):
+      Short = self.Clusters[0]
+      Long = self.Clusters[1]
+      if Period < Short // 2:
+         return 0, 0
+
+      if Period < (Short + Long) // 2:
+         Cluster = 0
+      else:
+         Cluster = 1
+      Error = Period - self.Clusters[Cluster]
+      # Levels much longer than two bit periods are not data, so do not move the clusters.
+      if Period < Short + Long:
+         self.Clusters[Cluster] += Error >> CLOCK_TRACKING_SHIFT
+
+      return Cluster + 1, abs(Error)
+
+
+
+# Decode received level changes into frames of byte data, long period = 1, short period = 0.
+# Edge times and periods are integer nanoseconds. When a Parser is given, each byte is passed to Parser.Byte() as it is
+# received, which returns PARSE_REJECTED to ignore the rest of the frame, or PARSE_COMPLETE to return the frame once it
+# has the minimum number of bytes.
+class StartBitDecoder:
+   def __init__(self, EndPeriod=RX_END_PERIOD, RejectPeriod=RX_REJECT_PERIOD, MinBytes=MIN_RX_BYTES, RxPin=0, Parser=None):
+      self.EndPeriod = EndPeriod
+      self.RejectPeriod = RejectPeriod
+      self.MinBytes = MinBytes
+      self.RxPin = RxPin
+      self.Parser = Parser
+      self.LastBitPeriod = EndPeriod
+      self.LastGpioLevel = 1
+      self.Clock = ClockRecovery(EndPeriod)
+      self.Reset()
+
+
+   # Reset data to start a new frame.
+   def Reset(self):
+      self.StartBitFlag = True
+      self.StartBitPeriod = self.EndPeriod
+      self.BitCount = 0
+      self.ByteDataCount = 0
+      self.ByteData = []
+      self.NoiseCount = 0
+      self.ErrorTotal = 0
+      # Set when the frame has been returned or rejected by the parser, until the end of data period.
+      self.SkipFlag = False
+      if self.Parser != None:
+         self.Parser.Reset()
+
+
+   # True when a frame has started and not yet ended.
+   def IsReceiving(self):
+      return self.StartBitPeriod != self.EndPeriod
+
+
+   # Process a received data level change at time ThisPeriod.
+   # Returns the previous frame when this level change is after the end of data period, or the current frame when the
+   # parser completes it, otherwise None.
+   def Edge(self, ThisPeriod, GpioLevel):
+      Frame = None
+      if ThisPeriod - self.LastBitPeriod > self.EndPeriod:
+         Frame = self.EndFrame()
+
+      DiffPeriod = ThisPeriod - self.LastBitPeriod
+      if GpioLevel != self.LastGpioLevel:
+         # Ignore noise.
+         if DiffPeriod > self.RejectPeriod:
+            # Once the frame has been returned or rejected, only wait for the end of data period.
+            if self.SkipFlag == True:
+               self.LastBitPeriod = ThisPeriod
+            # Wait for start of communication.
+            elif self.StartBitFlag == True:
+               # Calculate start bit period, consider as the initial period for the following bits.
+               if self.StartBitPeriod == self.EndPeriod:
+                  self.StartBitPeriod = ThisPeriod
+               else:
+                  self.Clock.Reset(ThisPeriod - self.StartBitPeriod)
+                  self.StartBitPeriod = self.Clock.BitPeriod()
+                  self.StartBitFlag = False
+               self.LastBitPeriod = ThisPeriod
+            else:
+               # Receiving a data level, convert into a data bit.
+               Bits, Error = self.Clock.Level(DiffPeriod)
+               if Bits == 0:
+                  # Levels shorter than half the bit period are noise, like levels shorter than the reject period.
+                  self.NoiseCount += 1
+               else:
+                  self.StartBitPeriod = self.Clock.BitPeriod()
+                  self.ErrorTotal += Error
+                  if self.BitCount % 8 == 0:
+                     self.ByteData.append(0)
+                     self.ByteDataCount += 1
+                  self.BitCount += 1
+                  self.ByteData[self.ByteDataCount - 1] = (self.ByteData[self.ByteDataCount - 1] << 1)
+                  if Bits > 1:
+                      self.ByteData[self.ByteDataCount - 1] |= 1
+                  self.LastBitPeriod = ThisPeriod
+
+                  # Parse each byte as it is completed.
+                  if self.Parser != None and self.BitCount % 8 == 0:
+                     ParseState = self.Parser.Byte(self.ByteData[self.ByteDataCount - 1])
+                     if ParseState == PARSE_COMPLETE and self.ByteDataCount >= self.MinBytes:
+                        Frame = self.Frame()
+                        self.SkipFlag = True
+                     elif ParseState == PARSE_REJECTED:
+                        self.SkipFlag = True
+         elif self.StartBitFlag == False:
+            self.NoiseCount += 1
+         self.LastGpioLevel = GpioLevel
+
+      return Frame
+
+
+   # Returns the frame when no data has been received for the end of data period at time Now, otherwise None.
+   def EndOfData(self, Now):
+      Frame = None
+      if Now - self.LastBitPeriod > self.EndPeriod:
+         Frame = self.EndFrame()
+
+      return Frame
+
+
+   # The current frame [FRAME_DATA, FRAME_BIT_PERIOD, FRAME_TIME, FRAME_RX_PIN, FRAME_NOISE, FRAME_ERROR].
+   def Frame(self):
+      return [self.ByteData, self.StartBitPeriod, self.LastBitPeriod, self.RxPin, self.NoiseCount, self.ErrorTotal // max(self.BitCount, 1)]
+
+
+   # End the current frame, returns the frame, or None if too short, noise, or already returned or rejected by the parser.
+   def EndFrame(self):
+      Frame = None
+      if self.SkipFlag == False and self.ByteDataCount >= self.MinBytes and self.StartBitPeriod > self.RejectPeriod:
+         Frame = self.Frame()
+      self.Reset()
+
+      return Frame
+
+
+
+# Decode received level changes from several receivers into frames of byte data, with a start bit decoder for each GPIO pin.
+# CreateParser() is called to create a parser for each GPIO pin, when given.
+class MultiPinDecoder:
+   def __init__(self, RxPins, EndPeriod=RX_END_PERIOD, RejectPeriod=RX_REJECT_PERIOD, MinBytes=MIN_RX_BYTES, CreateParser=None):
+      self.Decoders = {}
+      for RxPin in RxPins:
+         Parser = None
+         if CreateParser != None:
+            Parser = CreateParser()
+         self.Decoders[RxPin] = StartBitDecoder(EndPeriod, RejectPeriod, MinBytes, RxPin, Parser)
+      self.LastBitPeriod = EndPeriod
+
+
+   # True when a frame has started and not yet ended on any GPIO pin.
+   def IsReceiving(self):
+      for Decoder in self.Decoders.values():
+         if Decoder.IsReceiving() == True:
+            return True
+
+      return False
+
+
+   # Process a capture edge [EDGE_RX_PIN, EDGE_LEVEL, EDGE_TIME] with the decoder for its GPIO pin.
+   # Returns the previous frame on the GPIO pin when this level change is after the end of data period, or the current
+   # frame when its parser completes it, otherwise None.
+   def Edge(self, Edge):
+      return self.Decoders[Edge[Pi433MHzCapture.EDGE_RX_PIN]].Edge(Edge[Pi433MHzCapture.EDGE_TIME], Edge[Pi433MHzCapture.EDGE_LEVEL])
+
+
+   # Returns the list of frames on all GPIO pins when no data has been received for the end of data period at time Now.
+   def EndOfData(self, Now):
+      Frames = []
+      for Decoder in self.Decoders.values():
+         Frame = Decoder.EndOfData(Now)
+         if Frame != None:
+            Frames.append(Frame)
+         self.LastBitPeriod = max(self.LastBitPeriod, Decoder.LastBitPeriod)
+
+      return Frames
+
+
+
+# Decode a list of capture edges, returns the list of frames decoded.
+def DecodeEdges(Edges, EndPeriod=RX_END_PERIOD, RejectPeriod=RX_REJECT_PERIOD, MinBytes=MIN_RX_BYTES, Parser=None):
+   Frames = []
+   Decoder = StartBitDecoder(EndPeriod, RejectPeriod, MinBytes, 0, Parser)
+   for Edge in Edges:
+      Frame = Decoder.Edge(Edge[Pi433MHzCapture.EDGE_TIME], Edge[Pi433MHzCapture.EDGE_LEVEL])
+      if Frame != None:
+         Frames.append(Frame)
+   Frame = Decoder.EndFrame()
+   if Frame != None:
+      Frames.append(Frame)
+
+   return Frames
+
+
+
+# A very basic encrypt/decript function, for keeping demonstration code simple. Use a comprehensive function in production code.
+def BasicEncryptDecrypt(Data, Key):
+   KeyCount = 0
+   KeyLen = len(Key)
+   for Count in range(len(Data)):
+      Data[Count] ^= Key[KeyCount]
+      if KeyCount >= KeyLen:
+         KeyCount = 0
+
+
+
+# Number of checksum bytes at the end of a data packet.
+def ChecksumSize(Version):
+   if Version == PACKET_VERSION_XOR:
+      return 1
+   else:
+      return 2
+
+
+
+# CRC-16 of the data packet signature, version, length and data.
+def PacketCrc(DataPacket):
+   return Pi433MHzFec.Crc16(DataPacket["SIGNATURE"] + [DataPacket["VERSION"], DataPacket["DATA_LENGTH"]] + DataPacket["DATA"])
+
+
+
+# Place data into a data packet, encrypted and with a checksum, ready to be sent.
+# Version 1 data packets have no VERSION field.
+def EncodePacket(Data, Signature, Key, Version=PACKET_VERSION_XOR):
+   DataPacket = {
+      "SIGNATURE": list(Signature),
+      "DATA_LENGTH": len(Data),
+      "DATA": list(Data),
+      "CHECKSUM": 0,
+   }
+   BasicEncryptDecrypt(DataPacket["DATA"], Key)
+   if Version == PACKET_VERSION_XOR:
+      # Calculate checksum of data for transmission validation.
+      for Byte in DataPacket["DATA"]:
+         DataPacket["CHECKSUM"] ^= Byte
+   else:
+      DataPacket["VERSION"] = Version
+      DataPacket["CHECKSUM"] = PacketCrc(DataPacket)
+
+   return DataPacket
+
+
+
+# Data packet bytes in the order transmitted.
+def PacketBytes(DataPacket):
+   if "VERSION" not in DataPacket:
+      return DataPacket["SIGNATURE"] + [DataPacket["DATA_LENGTH"]] + DataPacket["DATA"] + [DataPacket["CHECKSUM"]]
+
+   Body = [DataPacket["DATA_LENGTH"]] + DataPacket["DATA"] + [DataPacket["CHECKSUM"] >> 8, DataPacket["CHECKSUM"] & 0xFF]
+   if DataPacket["VERSION"] == PACKET_VERSION_FEC:
+      Body = Pi433MHzFec.FecEncode(Body)
+
+   return DataPacket["SIGNATURE"] + [DataPacket["VERSION"]] + Body
+
+
+
+# Parse frame byte data as each byte is received, with a state machine following the data packet fields.
+# Rejects the frame at the first byte which does not match the packet signature or version, and completes the frame
+# when the last checksum byte is received, using the data length byte. With forward error correction the data length
+# byte is decoded from the first FEC block.
+class PacketParser:
+   def __init__(self, Signature, Version=PACKET_VERSION_XOR):
+      self.Signature = Signature
+      self.Version = Version
+      self.ChecksumSize = ChecksumSize(Version)
+      self.Reset()
+
+
+   # Reset the parser to start a new frame.
+   def Reset(self):
+      self.State = PARSE_SIGNATURE
+      self.ByteCount = 0
+      self.PacketSize = 0
+      self.FecData = []
+
+
+   # Parse the next byte of the frame, returns the parser state.
+   def Byte(self, Byte):
+      if self.State == PARSE_SIGNATURE:
+         if Byte != self.Signature[self.ByteCount]:
+            self.State = PARSE_REJECTED
+         elif self.ByteCount < len(self.Signature) - 1:
+            pass
+         elif self.Version == PACKET_VERSION_XOR:
+            self.State = PARSE_LENGTH
+         else:
+            self.State = PARSE_VERSION
+      elif self.State == PARSE_VERSION:
+         if Byte != self.Version:
+            self.State = PARSE_REJECTED
+         elif self.Version == PACKET_VERSION_FEC:
+            self.State = PARSE_DATA
+         else:
+            self.State = PARSE_LENGTH
+      elif self.State == PARSE_LENGTH:
+         self.PacketSize = self.ByteCount + 1 + Byte + self.ChecksumSize
+         if Byte == 0:
+            self.State = PARSE_CHECKSUM
+         else:
+            self.State = PARSE_DATA
+      elif self.State == PARSE_DATA:
+         if self.Version == PACKET_VERSION_FEC:
+            if self.PacketSize == 0:
+               self.FecData.append(Byte)
+               if len(self.FecData) == Pi433MHzFec.FEC_BLOCK_SIZE:
+                  DataLength = Pi433MHzFec.FecDecode(self.FecData)[0][0]
+                  self.PacketSize = len(self.Signature) + 1 + Pi433MHzFec.FecSize(1 + DataLength + self.ChecksumSize)
+            if self.ByteCount == self.PacketSize - 1:
+               self.State = PARSE_COMPLETE
+         elif self.ByteCount == self.PacketSize - self.ChecksumSize - 1:
+            self.State = PARSE_CHECKSUM
+      elif self.State == PARSE_CHECKSUM:
+         if self.ByteCount == self.PacketSize - 1:
+            self.State = PARSE_COMPLETE
+      self.ByteCount += 1
+
+      return self.State
+
+
+
+# Decode frame byte data into a data packet, the data remains encrypted.
+# Returns the decoding result PACKET_VALID, PACKET_INVALID_SIGNATURE, PACKET_INVALID_VERSION, PACKET_INVALID_LENGTH or
+# PACKET_INVALID_CHECKSUM, and the data packet. Data packets with forward error correction include the number of
+# CORRECTED_BITS.
+def DecodePacket(ByteData, Signature, Version=PACKET_VERSION_XOR):
+   DataPacket = {
+      "SIGNATURE": [],
+      "DATA_LENGTH": 0,
+      "DATA": [],
+      "CHECKSUM": 0,
+   }
+
+   # Validate packet signature.
+   DataCount = 0
+   for Count in range(len(Signature)):
+      if DataCount >= len(ByteData):
+         return [PACKET_INVALID_SIGNATURE, DataPacket]
+      DataPacket["SIGNATURE"].append(ByteData[DataCount])
+      if DataPacket["SIGNATURE"][DataCount] != Signature[Count]:
+         return [PACKET_INVALID_SIGNATURE, DataPacket]
+      DataCount += 1
+
+   # Validate packet version.
+   if Version != PACKET_VERSION_XOR:
+      DataPacket["VERSION"] = Version
+      if DataCount >= len(ByteData) or ByteData[DataCount] != Version:
+         return [PACKET_INVALID_VERSION, DataPacket]
+      DataCount += 1
+
+   # Correct errors in the rest of the packet, the data length is in the first FEC block.
+   if Version == PACKET_VERSION_FEC:
+      FecData = ByteData[DataCount:]
+      if len(FecData) < Pi433MHzFec.FEC_BLOCK_SIZE:
+         return [PACKET_INVALID_LENGTH, DataPacket]
+      FecData = FecData[:Pi433MHzFec.FecSize(1 + Pi433MHzFec.FecDecode(FecData)[0][0] + ChecksumSize(Version))]
+      ByteData, DataPacket["CORRECTED_BITS"] = Pi433MHzFec.FecDecode(FecData)[:2]
+      DataCount = 0
+
+   # Validate packet length.
+   if DataCount >= len(ByteData) or DataCount + ByteData[DataCount] + 1 + ChecksumSize(Version) > len(ByteData):
+      return [PACKET_INVALID_LENGTH, DataPacket]
+   DataPacket["DATA_LENGTH"] = ByteData[DataCount]
+   DataCount += 1
+   DataPacket["DATA"] = ByteData[DataCount:DataCount + DataPacket["DATA_LENGTH"]]
+   DataCount += DataPacket["DATA_LENGTH"]
+
+   # Validate packet checksum.
+   if Version == PACKET_VERSION_XOR:
+      DataPacket["CHECKSUM"] = ByteData[DataCount]
+      Checksum = 0
+      for Byte in DataPacket["DATA"]:
+         Checksum ^= Byte
+   else:
+      DataPacket["CHECKSUM"] = (ByteData[DataCount] << 8) | ByteData[DataCount + 1]
+      Checksum = PacketCrc(DataPacket)
+   if Checksum != DataPacket["CHECKSUM"]:
+      return [PACKET_INVALID_CHECKSUM, DataPacket]
+
+   return [PACKET_VALID, DataPacket]
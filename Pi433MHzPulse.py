@@ -0,0 +1,145 @@
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* Pi433MHzPulse - Compact buffer of received RX data levels and periods.   */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* RX data is held in two preallocated arrays, one byte per level and 32   */
+#/* bits per period in nanoseconds, rather than a new list for each level   */
+#/* received. Buffers are reset in place and reused from a pool, so noisy   */
+#/* bursts of thousands of levels do not allocate objects for each level.   */
+#/* The arrays can be read by the decoder through memoryviews without being */
+#/* copied.                                                                  */
+#/****************************************************************************/
+
+
+
+import array
+import collections
+
+
+
+# RX data field names, for RX data rows.
+DATA_SEQUENCE = 0
+DATA_RX_PIN = 1
+DATA_LEVEL = 2
+DATA_PERIOD = 3
+
+# Number of levels a new pulse buffer can hold before growing.
+PULSE_CAPACITY = 1024
+# Maximum number of unused pulse buffers kept for reuse.
+PULSE_POOL_SIZE = 16
+# Largest period in nanoseconds held in a pulse buffer, longer periods are held as this period.
+PERIOD_MAX = 0xFFFFFFFF
+
+
+
+# Create an array of Size 32 bit period values.
+def PeriodArray(Size=0):
+   for TypeCode in "IL":
+      if array.array(TypeCode).itemsize == 4:
+         return array.array(TypeCode, bytes(4 * Size))
+
+   raise TypeError("No 32 bit array type available")
+
+
+
+# RX data received on a GPIO pin, the level and period in nanoseconds of each level received.
+class PulseBuffer:
+   def __init__(self, RxPin=0, Capacity=PULSE_CAPACITY, Pool=None):
+      self.RxPin = RxPin
+      self.Pool = Pool
+      self.Levels = array.array("B", bytes(Capacity))
+      self.Periods = PeriodArray(Capacity)
+      self.Count = 0
+
+
+   def __len__(self):
+      return self.Count
+
+
+   # Empty the buffer in place, keeping the allocated arrays.
+   def Reset(self):
+      self.Count = 0
+
+
+   # Double the capacity of the arrays, keeping the levels already received.
+   def Grow(self):
+      Capacity = len(self.Levels)
+      self.Levels.extend(bytes(Capacity))
+      self.Periods.extend(PeriodArray(Capacity))
+
+
+   # Add a received level and its period in nanoseconds.
+   def Append(self, Level, Period):
+      if self.Count == len(self.Levels):
+         self.Grow()
+      self.Levels[self.Count] = Level
+      if Period > PERIOD_MAX:
+         Period = PERIOD_MAX
+      self.Periods[self.Count] = Period
+      self.Count += 1
+
+
+   # Memoryview of the levels received, one byte per level.
+   def LevelView(self):
+      return memoryview(self.Levels)[:self.Count]
+
+
+   # Memoryview of the periods received, 32 bits per period.
+   def PeriodView(self):
+      return memoryview(self.Periods)[:self.Count]
+
+
+   # RX data rows [DATA_SEQUENCE, DATA_RX_PIN, DATA_LEVEL, DATA_PERIOD], for applications using lists of RX data.
+   def Rows(self):
+      return [[Count, self.RxPin, self.Levels[Count], self.Periods[Count]] for Count in range(self.Count)]
+
+
+   # Return the buffer to the pool it came from when it is no longer required.
+   def Release(self):
+      if self.Pool != None:
+         self.Pool.Put(self)
+
+
+
+# Pool of pulse buffers for reuse, taken by the capture loop and released by the decoding workers.
+class PulsePool:
+   def __init__(self, Capacity=PULSE_CAPACITY, PoolSize=PULSE_POOL_SIZE):
+      self.Capacity = Capacity
+      self.PoolSize = PoolSize
+      # Appending and popping are atomic, so buffers can be released from other threads without a lock.
+      self.Buffers = collections.deque()
+
+
+   # Take an empty buffer from the pool, creating a new buffer when none are available.
+   def Get(self, RxPin=0):
+      try:
+         Buffer = self.Buffers.pop()
+      except IndexError:
+         Buffer = PulseBuffer(RxPin, self.Capacity, self)
+      Buffer.RxPin = RxPin
+      Buffer.Reset()
+
+      return Buffer
+
+
+   # Return a buffer to the pool, buffers beyond the pool size are left to be freed.
+   def Put(self, Buffer):
+      if len(self.Buffers) < self.PoolSize:
+         self.Buffers.append(Buffer)
@@ -0,0 +1,132 @@
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* Pi433MHzRecord - 433MHz received data recording file format.            */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* Reads and writes the raw RX data captured by Pi433MHz.py in a compact   */
+#/* binary file, allowing the data to be decoded again later without the    */
+#/* 433MHz receiver.                                                         */
+#/*                                                                          */
+#/* FILE HEADER    - "P433", format version [2 bytes].                       */
+#/* CAPTURE HEADER - GPIO pin [2 bytes], capture time in nanoseconds since   */
+#/*                  the epoch [8 bytes], number of periods [4 bytes].       */
+#/* PERIODS        - One 32 bit value per period, data level in the top bit */
+#/*                  and period in nanoseconds in the remaining 31 bits.     */
+#/* All values are little endian.                                            */
+#/****************************************************************************/
+
+
+
+import sys
+import struct
+import Pi433MHzPulse
+
+
+
+# Recording file identifier and format version.
+RECORD_MAGIC = b"P433"
+RECORD_VERSION = 1
+# Recording file header and capture header.
+FILE_HEADER = struct.Struct("<4sH")
+CAPTURE_HEADER = struct.Struct("<HqI")
+# Period value, data level bit and maximum period in nanoseconds.
+PERIOD_LEVEL_BIT = (1 << 31)
+PERIOD_MAX_NS = PERIOD_LEVEL_BIT - 1
+
+
+
+# Append RX data captures to a recording file.
+class CaptureWriter:
+   def __init__(self, FileName):
+      self.File = open(FileName, "ab")
+      if self.File.tell() == 0:
+         self.File.write(FILE_HEADER.pack(RECORD_MAGIC, RECORD_VERSION))
+
+
+   # Write a capture of a pulse buffer of RX data, received on a GPIO pin at a time in nanoseconds since the epoch.
+   def Write(self, RxPin, TimeStampNs, Data):
+      Periods = Pi433MHzPulse.PeriodArray(len(Data))
+      Count = 0
+      for Level, Period in zip(Data.LevelView(), Data.PeriodView()):
+         PeriodNs = min(Period, PERIOD_MAX_NS)
+         if Level != 0:
+            PeriodNs |= PERIOD_LEVEL_BIT
+         Periods[Count] = PeriodNs
+         Count += 1
+      if sys.byteorder != "little":
+         Periods.byteswap()
+      self.File.write(CAPTURE_HEADER.pack(RxPin, TimeStampNs, len(Periods)))
+      self.File.write(Periods.tobytes())
+
+
+   def Flush(self):
+      self.File.flush()
+
+
+   def Close(self):
+      self.File.close()
+
+
+
+# Read the GPIO pins of the captures in a recording file, reading only the capture headers.
+# Returns the set of GPIO pins.
+def ReadPins(FileName):
+   RxPins = set()
+   File = open(FileName, "rb")
+   try:
+      Magic, Version = FILE_HEADER.unpack(File.read(FILE_HEADER.size))
+      if Magic != RECORD_MAGIC or Version != RECORD_VERSION:
+         raise ValueError("Not a version {:d} recording file: {:s}".format(RECORD_VERSION, FileName))
+      while True:
+         Header = File.read(CAPTURE_HEADER.size)
+         if len(Header) < CAPTURE_HEADER.size:
+            break
+         RxPin, TimeStampNs, PeriodCount = CAPTURE_HEADER.unpack(Header)
+         RxPins.add(RxPin)
+         File.seek(PeriodCount * Pi433MHzPulse.PeriodArray().itemsize, 1)
+   finally:
+      File.close()
+
+   return RxPins
+
+
+
+# Read the RX data captures from a recording file.
+# Yields the GPIO pin, time in nanoseconds since the epoch and pulse buffer of RX data, with periods in nanoseconds, for each capture.
+def ReadCaptures(FileName):
+   File = open(FileName, "rb")
+   try:
+      Magic, Version = FILE_HEADER.unpack(File.read(FILE_HEADER.size))
+      if Magic != RECORD_MAGIC or Version != RECORD_VERSION:
+         raise ValueError("Not a version {:d} recording file: {:s}".format(RECORD_VERSION, FileName))
+      while True:
+         Header = File.read(CAPTURE_HEADER.size)
+         if len(Header) < CAPTURE_HEADER.size:
+            break
+         RxPin, TimeStampNs, PeriodCount = CAPTURE_HEADER.unpack(Header)
+         Periods = Pi433MHzPulse.PeriodArray()
+         Periods.frombytes(File.read(PeriodCount * Periods.itemsize))
+         if sys.byteorder != "little":
+            Periods.byteswap()
+         Data = Pi433MHzPulse.PulseBuffer(RxPin, len(Periods))
+         for Period in Periods:
+            Data.Append(Period >> 31, Period & PERIOD_MAX_NS)
+         yield RxPin, TimeStampNs, Data
+   finally:
+      File.close()
@@ -0,0 +1,86 @@
+#!/usr/bin/python3
+
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* Pi433MHzReplay - Decode recorded 433MHz data.                            */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* Script for decoding the raw RX data recorded by Pi433MHz.py, displaying  */
+#/* the same views of the data as Pi433MHz.py, without the 433MHz receiver.  */
+#/****************************************************************************/
+
+
+
+import sys
+import time
+import datetime
+import Pi433MHzDecode
+import Pi433MHzRecord
+
+
+
+# Number of command line arguments.
+ARG_COUNT = 2
+# Command line arguments.
+ARG_EXE = 0
+ARG_FILES = 1
+
+# Display bad data lines.
+LOG_BAD_DATA = False
+# Views of the RX data displayed, any of BINARY, HEX, ALT_HEX, BYTE, WORD0, WORD1, CHARACTER and LINE_CODE.
+LOG_VIEWS = Pi433MHzDecode.DECODE_VIEWS
+
+
+
+def main():
+   # Check for command line argument.
+   if len(sys.argv) < ARG_COUNT:
+      sys.stdout.write("\n" + sys.argv[ARG_EXE] + " [RECORDING_FILE] ...\n\n")
+   else:
+      CaptureCount = 0
+      BadDataCount = 0
+      StartTime = time.perf_counter()
+      # Use the vectorised decoding engine when NumPy is installed.
+      if Pi433MHzDecode.NumPyAvailable() == True:
+         Engine = Pi433MHzDecode.ENGINE_NUMPY
+      else:
+         Engine = Pi433MHzDecode.ENGINE_PYTHON
+      for FileName in sys.argv[ARG_FILES:]:
+         # As Pi433MHz.py, log the GPIO pin of RX data recorded from more than one receiver.
+         MultiPinFlag = (len(Pi433MHzRecord.ReadPins(FileName)) > 1)
+         for RxPin, TimeStampNs, Data in Pi433MHzRecord.ReadCaptures(FileName):
+            CaptureCount += 1
+            Now = datetime.datetime.fromtimestamp(TimeStampNs / 1000000000.0)
+            Decoded = Pi433MHzDecode.DecodeRxFrame(Data, Engine, LOG_VIEWS)
+            BadDataFlag = Decoded[Pi433MHzDecode.DECODED_BAD_DATA]
+            if BadDataFlag == True:
+               BadDataCount += 1
+            if BadDataFlag == False or (BadDataFlag == True and LOG_BAD_DATA == True):
+               if MultiPinFlag == True:
+                  sys.stdout.write(Pi433MHzDecode.FormatLogEntry(Decoded, Now, LOG_VIEWS, RxPin))
+               else:
+                  sys.stdout.write(Pi433MHzDecode.FormatLogEntry(Decoded, Now, LOG_VIEWS))
+
+      # Display a summary of the data decoded.
+      sys.stderr.write("CAPTURES: {:d} BAD DATA: {:d} TIME: {:f}\n".format(CaptureCount, BadDataCount, time.perf_counter() - StartTime))
+
+
+
+if __name__ == "__main__":
+   main()
@@ -0,0 +1,132 @@
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* Pi433MHzRing - Ring buffer between RX data capture and decoding.         */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* A bounded ring buffer passing completed RX data captures from the        */
+#/* capture loop to a pool of background worker threads, so the capture     */
+#/* loop never waits while data is decoded and logged. When the ring buffer */
+#/* is full new captures are dropped and counted, rather than blocking the   */
+#/* capture loop.                                                            */
+#/****************************************************************************/
+
+
+
+import sys
+import threading
+
+
+
+# Bounded ring buffer with a single producer and any number of consumers.
+# The producer never takes a lock, consumers share a lock to take items in turn.
+class RingBuffer:
+   def __init__(self, Size):
+      self.Size = Size
+      self.Slots = [None] * Size
+      self.WriteCount = 0
+      self.ReadCount = 0
+      # Number of items dropped because the ring buffer was full.
+      self.DroppedCount = 0
+      # Largest number of items waiting in the ring buffer.
+      self.MaxDepth = 0
+      self.ItemsWaiting = threading.Semaphore(0)
+      self.ReadLock = threading.Lock()
+
+
+   # Number of items waiting in the ring buffer.
+   def Depth(self):
+      return self.WriteCount - self.ReadCount
+
+
+   # Add an item to the ring buffer, returns False if the item was dropped.
+   def Put(self, Item):
+      Depth = self.Depth()
+      if Depth >= self.Size:
+         self.DroppedCount += 1
+         return False
+
+      self.Slots[self.WriteCount % self.Size] = Item
+      self.WriteCount += 1
+      if Depth + 1 > self.MaxDepth:
+         self.MaxDepth = Depth + 1
+      self.ItemsWaiting.release()
+
+      return True
+
+
+   # Wait up to the timeout period for an item, returns None if no item is available.
+   def Get(self, Timeout=None):
+      if self.ItemsWaiting.acquire(True, Timeout) == False:
+         return None
+
+      with self.ReadLock:
+         Index = self.ReadCount % self.Size
+         Item = self.Slots[Index]
+         self.Slots[Index] = None
+         self.ReadCount += 1
+
+      return Item
+
+
+
+# Pool of background worker threads, calling a function for each item taken from a ring buffer.
+class WorkerPool:
+   def __init__(self, Ring, Function, WorkerCount=1):
+      self.Ring = Ring
+      self.Function = Function
+      self.Lock = threading.Lock()
+      self.ExitFlag = False
+      # Number of items processed.
+      self.ProcessedCount = 0
+      # Number of items dropped because processing failed.
+      self.ErrorCount = 0
+      self.Workers = []
+      for Count in range(WorkerCount):
+         Worker = threading.Thread(target=self.WorkerLoop, name="Pi433MHzWorker{:d}".format(Count))
+         Worker.daemon = True
+         self.Workers.append(Worker)
+
+
+   def Start(self):
+      for Worker in self.Workers:
+         Worker.start()
+
+
+   # Process the items remaining in the ring buffer, then stop the worker threads.
+   def Stop(self):
+      self.ExitFlag = True
+      for Worker in self.Workers:
+         Worker.join()
+
+
+   def WorkerLoop(self):
+      while True:
+         Item = self.Ring.Get(0.1)
+         if Item == None:
+            if self.ExitFlag == True:
+               break
+         else:
+            try:
+               self.Function(Item)
+               with self.Lock:
+                  self.ProcessedCount += 1
+            except Exception as Error:
+               with self.Lock:
+                  self.ErrorCount += 1
+               sys.stderr.write("WORKER ERROR: {:s}\n".format(str(Error)))
@@ -1,4 +1,4 @@
-#!/usr/bin/python
+#!/usr/bin/python3
 
 # Pi433MHz - 433MHz Data Reciever and Decoder
 # Copyright (C) 2019 Jason Birch
@@ -37,159 +37,134 @@ import sys
 import math
 import time
 import datetime
-import RPi.GPIO
+import Pi433MHzCapture
+import Pi433MHzWave
+import Pi433MHzPacket
+import Pi433MHzDedup
 
 
 
-# GPIO Pin connected to 433MHz receiver.
-GPIO_RX_PIN = 26
+# GPIO Pins connected to 433MHz receivers, each receiver is decoded independently.
+GPIO_RX_PINS = [26]
 # GPIO Pin connected to 433MHz transmitter.
 GPIO_TX_PIN = 19
 
-# GPIO level to switch transmitter off.
-TX_OFF_LEVEL = 1
+# Receiver capture backend, POLL, EDGE, CHARDEV or SIMULATED.
+RX_CAPTURE_BACKEND = Pi433MHzCapture.BACKEND_EDGE
+
+# GPIO level to switch transmitter off, in Pi433MHzWave.py shared with the transmitting applications.
+TX_OFF_LEVEL = Pi433MHzWave.TX_OFF_LEVEL
+# Periods are in nanoseconds.
 # Period to signify end of Rx message.
-RX_END_PERIOD = 0.01
+RX_END_PERIOD = 10000000
+# Period to wait for RX data when idle.
+RX_IDLE_PERIOD = 500000000
 # Smallest period of high or low signal to consider noise rather than data, and flag as bad data. 
-RX_REJECT_PERIOD = 0.000005
+RX_REJECT_PERIOD = 5000
 # Single level period, one period is a binary 0, two periods are a binary 1. 
-RX_LEVEL_PERIOD = 0.000500
+RX_LEVEL_PERIOD = 500000
 # Start bits transmitted to signify start of transmission.
 RX_START_BITS = 1
 # Minimum received valid packet size.
 MIN_RX_BYTES = 4
+# Period between the ends of copies of the same frame received on different GPIO pins, in nanoseconds.
+DIVERSITY_WINDOW = 2000000
 
 # Data encryption key.
 ENCRYPTION_KEY = [ 0xC5, 0x07, 0x8C, 0xA9, 0xBD, 0x8B, 0x48, 0xEF, 0x88, 0xE1, 0x94, 0xDB, 0x63, 0x77, 0x95, 0x59 ]
 # Data packet identifier.
 PACKET_SIGNATURE = [ 0x63, 0xF9, 0x5C, 0x1B ]
-
-
-
-# A very basic encrypt/decript function, for keeping demonstration code simple. Use a comprehensive function in production code.
-def BasicEncryptDecrypt(Data):
-   KeyCount = 0
-   KeyLen = len(ENCRYPTION_KEY)
-   for Count in range(len(Data)):
-      Data[Count] ^= ENCRYPTION_KEY[KeyCount]
-      if KeyCount >= KeyLen:
-         KeyCount = 0
-
-
-
-#  /*******************************************/
-# /* Configure Raspberry Pi GPIO interfaces. */
-#/*******************************************/
-RPi.GPIO.setwarnings(False)
-RPi.GPIO.setmode(RPi.GPIO.BCM)
-RPi.GPIO.setup(GPIO_RX_PIN, RPi.GPIO.IN, pull_up_down=RPi.GPIO.PUD_UP)
-RPi.GPIO.setup(GPIO_TX_PIN, RPi.GPIO.OUT, initial=TX_OFF_LEVEL)
-
-
-# Initialise data.
-StartBitFlag = True
-ThisPeriod = RX_END_PERIOD
-StartBitPeriod = RX_END_PERIOD
-LastBitPeriod = RX_END_PERIOD
-LastGpioLevel = 1
-BitCount = 0
-ByteDataCount = 0
-ByteData = []
-# Data packet to transmit.
-DataPacket = {
-   "SIGNATURE": [],
-   "DATA_LENGTH": 0,
-   "DATA": [],
-   "CHECKSUM": 0,
-}
-
-# Infinate loop for this application.
-sys.stdout.write("\nWAITING FOR DATA...\n\n")
-sys.stdout.flush()
-ExitFlag = False
-while ExitFlag == False:
-   # Check if data is currently being received.
-   ThisPeriod = time.time()
-   DiffPeriod = ThisPeriod - LastBitPeriod
-
-   # If data level changes, decode long period = 1, short period = 0.
-   GpioLevel = RPi.GPIO.input(GPIO_RX_PIN)
-   if GpioLevel != LastGpioLevel:
-      # Ignore noise.
-      if DiffPeriod > RX_REJECT_PERIOD:
-         # Wait for start of communication.
-         if StartBitFlag == True:
-            # Calculate start bit period, consider as period for all following bits.
-            if StartBitPeriod == RX_END_PERIOD:
-               StartBitPeriod = ThisPeriod
-            else:
-               StartBitPeriod = (ThisPeriod - StartBitPeriod) * 0.90
-               StartBitFlag = False
-         else:
-            if DiffPeriod < StartBitPeriod:
-               StartBitPeriod = DiffPeriod
-
-            # Receiving a data level, convert into a data bit.
-            Bits = int(round(DiffPeriod / StartBitPeriod))
-            if BitCount % 8 == 0:
-               ByteData.append(0)
-               ByteDataCount += 1
-            BitCount += 1
-            ByteData[ByteDataCount - 1] = (ByteData[ByteDataCount - 1] << 1)
-            if Bits > 1:
-                ByteData[ByteDataCount - 1] |= 1
-         LastBitPeriod = ThisPeriod
-      LastGpioLevel = GpioLevel
-   elif DiffPeriod > RX_END_PERIOD:
-      # End of data reception.
-      if ByteDataCount >= MIN_RX_BYTES and StartBitPeriod > RX_REJECT_PERIOD:
-         DataCount = 0
-         # Validate packet signature.
-         MatchFlag = True
-         for Count in range(len(PACKET_SIGNATURE)):
-            DataPacket["SIGNATURE"].append(ByteData[DataCount])
-            if DataPacket["SIGNATURE"][DataCount] != PACKET_SIGNATURE[Count]:
-               MatchFlag = False
-               break
-            DataCount += 1
-         if MatchFlag == False:
-            sys.stdout.write("INVALID PACKET SIGNATURE\n")
-         else:
-            DataPacket["DATA_LENGTH"] = ByteData[DataCount]
-            DataCount += 1
-            for Count in range(DataPacket["DATA_LENGTH"]):
-               DataPacket["DATA"].append(ByteData[DataCount])
-               DataCount += 1
-            DataPacket["CHECKSUM"] = ByteData[DataCount]
-            DataCount += 1
-            sys.stdout.write("RECEIVED PACKET: " + str(DataPacket) + "\n")
-            # Validate packet checksum.
-            Checksum = 0
-            for Byte in DataPacket["DATA"]:
-               Checksum ^= Byte
-            if Checksum != DataPacket["CHECKSUM"]:
-               sys.stdout.write("INVALID PACKET CHECKSUM\n")
-            else:
-               # Decrypt and display data.
-               BasicEncryptDecrypt(DataPacket["DATA"])
-               Data = ""
-               for Count in range(DataPacket["DATA_LENGTH"]):
-                  Data += chr(DataPacket["DATA"][Count])
-               sys.stdout.write("DECRYPTED DATA: {:s}\n".format(Data))
-         sys.stdout.write("\n")
-         sys.stdout.flush()
-
-      # Reset data to start a new monitor period.
-      StartBitFlag = True
-      StartBitPeriod = RX_END_PERIOD
-      BitCount = 0
-      ByteDataCount = 0
-      ByteData = []
-      # Data packet to transmit.
-      DataPacket = {
-         "SIGNATURE": [],
-         "DATA_LENGTH": 0,
-         "DATA": [],
-         "CHECKSUM": 0,
-      }
-
+# Data packet format version, the same as Pi433MHzTx.py. PACKET_VERSION_XOR, PACKET_VERSION_CRC or PACKET_VERSION_FEC.
+PACKET_VERSION = Pi433MHzPacket.PACKET_VERSION_XOR
+
+
+
+# Rank copies of a frame received on different GPIO pins, a valid data packet first, then the cleanest copy.
+def RxRank(Frame):
+   PacketResult, DataPacket = Pi433MHzPacket.DecodePacket(Frame[Pi433MHzPacket.FRAME_DATA], PACKET_SIGNATURE, PACKET_VERSION)
+
+   return [PacketResult != Pi433MHzPacket.PACKET_VALID] + Pi433MHzDedup.FrameRank(Frame)
+
+
+
+# Display a received frame, validating, decrypting and displaying the data packet.
+def RxEndOfData(Frame):
+   if len(GPIO_RX_PINS) > 1:
+      sys.stdout.write("RX PIN: {:d}\n".format(Frame[Pi433MHzPacket.FRAME_RX_PIN]))
+   PacketResult, DataPacket = Pi433MHzPacket.DecodePacket(Frame[Pi433MHzPacket.FRAME_DATA], PACKET_SIGNATURE, PACKET_VERSION)
+   if PacketResult == Pi433MHzPacket.PACKET_INVALID_SIGNATURE:
+      sys.stdout.write("INVALID PACKET SIGNATURE\n")
+   elif PacketResult == Pi433MHzPacket.PACKET_INVALID_VERSION:
+      sys.stdout.write("INVALID PACKET VERSION\n")
+   elif PacketResult == Pi433MHzPacket.PACKET_INVALID_LENGTH:
+      sys.stdout.write("INVALID PACKET LENGTH\n")
+   else:
+      sys.stdout.write("RECEIVED PACKET: " + str(DataPacket) + "\n")
+      if "CORRECTED_BITS" in DataPacket:
+         sys.stdout.write("CORRECTED BITS: {:d}\n".format(DataPacket["CORRECTED_BITS"]))
+      if PacketResult == Pi433MHzPacket.PACKET_INVALID_CHECKSUM:
+         sys.stdout.write("INVALID PACKET CHECKSUM\n")
+      else:
+         # Decrypt and display data.
+         Pi433MHzPacket.BasicEncryptDecrypt(DataPacket["DATA"], ENCRYPTION_KEY)
+         Data = ""
+         for Count in range(DataPacket["DATA_LENGTH"]):
+            Data += chr(DataPacket["DATA"][Count])
+         sys.stdout.write("DECRYPTED DATA: {:s}\n".format(Data))
+   sys.stdout.write("\n")
+   sys.stdout.flush()
+
+
+
+def main():
+   # Start capturing receiver edges, with the transmitter switched off. RPi.GPIO is only imported by the backends using it.
+   Backend = Pi433MHzCapture.CreateBackend(RX_CAPTURE_BACKEND, GPIO_RX_PINS, GPIO_TX_PIN, TX_OFF_LEVEL)
+   Backend.Open()
+
+   # Decode received edges into frames of byte data, independently for each receiver. Each byte is parsed as it is
+   # received, so frames from other devices are ignored after the first byte not matching the packet signature, and
+   # data packets are returned as soon as the checksum byte is received.
+   Decoder = Pi433MHzPacket.MultiPinDecoder(GPIO_RX_PINS, RX_END_PERIOD, RX_REJECT_PERIOD, MIN_RX_BYTES, \
+      lambda: Pi433MHzPacket.PacketParser(PACKET_SIGNATURE, PACKET_VERSION))
+   # Select the cleanest copy of each frame received by several receivers.
+   RxSelector = Pi433MHzDedup.DiversitySelector(GPIO_RX_PINS, DIVERSITY_WINDOW, RX_END_PERIOD, RxRank)
+
+   # Infinate loop for this application.
+   sys.stdout.write("\nWAITING FOR DATA...\n\n")
+   sys.stdout.flush()
+   ExitFlag = False
+   while ExitFlag == False:
+      # Wait for edges, only wait for the end of data period while data is being received,
+      # and no longer than until copies of a frame held for other receivers are selected.
+      if Decoder.IsReceiving() == False:
+         Timeout = RX_IDLE_PERIOD
+      else:
+         Timeout = RX_END_PERIOD
+      Deadline = RxSelector.NextDeadline(Backend.Now())
+      if Deadline != None:
+         Timeout = min(Timeout, Deadline)
+      Edges = Backend.Read(Timeout)
+
+      # An edge after the end of data period starts new RX data, so the previous RX data is returned first.
+      for Edge in Edges:
+         Frame = Decoder.Edge(Edge)
+         if Frame != None:
+            for Frame in RxSelector.Add(Frame):
+               RxEndOfData(Frame)
+
+      # Check if data is currently being received.
+      Now = Backend.Now()
+      for Frame in Decoder.EndOfData(Now):
+         for Frame in RxSelector.Add(Frame):
+            RxEndOfData(Frame)
+      for Frame in RxSelector.Poll(Now):
+         RxEndOfData(Frame)
+      if Now - Decoder.LastBitPeriod > RX_END_PERIOD + DIVERSITY_WINDOW and Backend.IsFinished() == True:
+         ExitFlag = True
+
+   Backend.Close()
+
+
+
+if __name__ == "__main__":
+   main()
@@ -1,4 +1,4 @@
-#!/usr/bin/python
+#!/usr/bin/python3
 
 # Pi433MHz - 433MHz Data Reciever and Decoder
 # Copyright (C) 2019 Jason Birch
@@ -33,148 +33,202 @@ import sys
 import math
 import time
 import datetime
-import RPi.GPIO
+import Pi433MHzCapture
+import Pi433MHzWave
+import Pi433MHzPacket
+import Pi433MHzMatch
+import Pi433MHzDispatch
+import Pi433MHzDedup
 
 
 
-# GPIO Pin connected to 433MHz receiver.
-GPIO_RX_PIN = 26
+# GPIO Pins connected to 433MHz receivers, each receiver is decoded independently.
+GPIO_RX_PINS = [26]
 # GPIO Pin connected to 433MHz transmitter.
 GPIO_TX_PIN = 19
 
-# GPIO level to switch transmitter off.
-TX_OFF_LEVEL = 1
+# Receiver capture backend, POLL, EDGE, CHARDEV or SIMULATED.
+RX_CAPTURE_BACKEND = Pi433MHzCapture.BACKEND_EDGE
+
+# GPIO level to switch transmitter off, in Pi433MHzWave.py shared with the transmitting applications.
+TX_OFF_LEVEL = Pi433MHzWave.TX_OFF_LEVEL
+# Periods are in nanoseconds.
 # Period of no RX data to consider end of RX data message.
-RX_END_PERIOD = 0.01
+RX_END_PERIOD = 10000000
+# Period to wait for RX data when idle.
+RX_IDLE_PERIOD = 500000000
 # Smallest period of high or low signal to consider noise rather than data, and flag as bad data. 
-RX_REJECT_PERIOD = 0.000005
+RX_REJECT_PERIOD = 5000
 # Minimum number of bytes of data received to be considered valid.
 MIN_RX_BYTES = 4
 # Log received data which does not match.
 LOG_NO_MATCH = False
 
-# Config data fields:
-CONFIG_ELEMENT_MATCH = 0
-CONFIG_ELEMENT_COMMAND = 1
-
-
-
-# Read a configuration data file.
-def LoadConfig():
-   ConfigData = []
-   File = open("Pi433MHzRxMatch.ini", 'r', 0)
-   TextLine = "."
-   while TextLine != "":
-      TextLine = File.readline().replace("\n", "")
-      if TextLine != "":
-         Element = TextLine.split("=")
-         ConfigData.append(Element)
-   File.close()
-   
-   return ConfigData
-
-
-
-#  /*******************************************/
-# /* Configure Raspberry Pi GPIO interfaces. */
-#/*******************************************/
-RPi.GPIO.setwarnings(False)
-RPi.GPIO.setmode(RPi.GPIO.BCM)
-RPi.GPIO.setup(GPIO_RX_PIN, RPi.GPIO.IN, pull_up_down=RPi.GPIO.PUD_UP)
-RPi.GPIO.setup(GPIO_TX_PIN, RPi.GPIO.OUT, initial=TX_OFF_LEVEL)
-
-
-# Initialise data.
-StartBitFlag = True
-ThisPeriod = RX_END_PERIOD
-StartBitPeriod = RX_END_PERIOD
-LastBitPeriod = RX_END_PERIOD
-LastGpioLevel = 1
-BitCount = 0
-ByteDataCount = 0
-ByteData = []
-
-# Read configuration data.
-ConfigData = LoadConfig()
-
-# Infinate loop for this application.
-sys.stdout.write("\nWAITING FOR DATA...\n\n")
-sys.stdout.flush()
-ExitFlag = False
-while ExitFlag == False:
-   # Check if data is currently being received.
-   ThisPeriod = time.time()
-   DiffPeriod = ThisPeriod - LastBitPeriod
-
-   # If data level changes, decode long period = 1, short period = 0.
-   GpioLevel = RPi.GPIO.input(GPIO_RX_PIN)
-   if GpioLevel != LastGpioLevel:
-      # Ignore noise.
-      if DiffPeriod > RX_REJECT_PERIOD:
-         # Wait for start of communication.
-         if StartBitFlag == True:
-            # Calculate start bit period, consider as period for all following bits.
-            if StartBitPeriod == RX_END_PERIOD:
-               StartBitPeriod = ThisPeriod
-            else:
-               StartBitPeriod = (ThisPeriod - StartBitPeriod) * 0.90
-               StartBitFlag = False
-         else:
-            if DiffPeriod < StartBitPeriod:
-               StartBitPeriod = DiffPeriod
-
-            # Receiving a data level, convert into a data bit.
-            Bits = int(round(DiffPeriod / StartBitPeriod))
-            if BitCount % 8 == 0:
-               ByteData.append(0)
-               ByteDataCount += 1
-            BitCount += 1
-            ByteData[ByteDataCount - 1] = (ByteData[ByteDataCount - 1] << 1)
-            if Bits > 1:
-                ByteData[ByteDataCount - 1] |= 1
-         LastBitPeriod = ThisPeriod
-      LastGpioLevel = GpioLevel
-   elif DiffPeriod > RX_END_PERIOD:
-      # End of data reception.
-      if ByteDataCount >= MIN_RX_BYTES and StartBitPeriod > RX_REJECT_PERIOD:
-         # Format the byte data in hex format.
-         DataString = ""
-         DataCount = 0
-         for Byte in ByteData:
-            DataString += "{:02X}".format(Byte)
-            DataCount += 1
-
-         # Check for data match, checking from the start of data for the number of bytes in the config data, ignoring the remainder of received data.
-         Match = False
-         for ConfigElement in ConfigData:
-            ConfigMatchLen = len(ConfigElement[CONFIG_ELEMENT_MATCH])
-            if ByteDataCount * 2 >= ConfigMatchLen and DataString[:ConfigMatchLen] == ConfigElement[CONFIG_ELEMENT_MATCH]:
-               Match = True
-               break
-
-         # Respond to a data match.
-         if Match == True:
-            Now = datetime.datetime.now()
-            sys.stdout.write(Now.strftime("%Y-%m-%d %H:%M:%S\n"))
-            sys.stdout.write("MATCH: " + str(ConfigElement) + "\n")
-            sys.stdout.write("START BIT PERIOD {:f}\n".format(StartBitPeriod))
-            sys.stdout.write(DataString + "\n")
-            sys.stdout.flush()
-            os.system(ConfigElement[CONFIG_ELEMENT_COMMAND])
-            sys.stdout.write("\n\n")
-            sys.stdout.flush()
-         elif LOG_NO_MATCH == True:
-            Now = datetime.datetime.now()
-            sys.stdout.write(Now.strftime("%Y-%m-%d %H:%M:%S\n"))
-            sys.stdout.write("NO MATCH: " + str(ConfigElement) + "\n")
-            sys.stdout.write("START BIT PERIOD {:f}\n".format(StartBitPeriod))
-            sys.stdout.write(DataString + "\n")
-            sys.stdout.flush()
-
-      # Reset data to start a new monitor period.
-      StartBitFlag = True
-      StartBitPeriod = RX_END_PERIOD
-      BitCount = 0
-      ByteDataCount = 0
-      ByteData = []
-
+# Configuration file of data signatures and commands.
+CONFIG_FILE = "Pi433MHzRxMatch.ini"
+# Number of bytes received after a data signature matches, while a longer data signature could still match.
+MATCH_GRACE_BYTES = 2
+# Reload the configuration file when it changes, without restarting.
+CONFIG_RELOAD = True
+
+# Period after the last copy of repeated data to consider the next copy as new data, in nanoseconds.
+DEDUP_WINDOW = 500000000
+# Maximum number of bit errors between copies of repeated data.
+DEDUP_MAX_BIT_ERRORS = 2
+# Period between the ends of copies of the same frame received on different GPIO pins, in nanoseconds.
+DIVERSITY_WINDOW = 2000000
+
+# Number of commands which can run at the same time.
+COMMAND_WORKERS = 4
+# Number of commands which can wait to be run.
+COMMAND_QUEUE_SIZE = 32
+# Number of the same command which can be waiting or running at the same time.
+COMMAND_LIMIT = 1
+# Period after which a running command is killed.
+COMMAND_TIMEOUT = 30.0
+
+
+
+# Rank copies of a frame received on different GPIO pins, a matching frame first, then the cleanest copy.
+def RxRank(Frame):
+   return [ConfigIndex.Match(Frame[Pi433MHzPacket.FRAME_DATA]) == None] + Pi433MHzDedup.FrameRank(Frame)
+
+
+
+# Process a received frame, when a data signature has matched or no data has been received for the end of data period.
+def RxEndOfData(Frame):
+   StartBitPeriod = Frame[Pi433MHzPacket.FRAME_BIT_PERIOD] / 1000000000.0
+
+   # Check for data match, checking from the start of data for the number of bytes in the config data, ignoring the remainder of received data.
+   MatchData = Frame[Pi433MHzPacket.FRAME_DATA]
+   ConfigElement = ConfigIndex.Match(MatchData)
+   LogFlag = LOG_NO_MATCH
+
+   # Only respond once to each burst of repeated data, a different command matched is a new burst.
+   MatchKey = None
+   if ConfigElement != None:
+      MatchKey = ConfigElement[Pi433MHzMatch.CONFIG_ELEMENT_COMMAND]
+   Burst, NewFlag = RxVoter.Add(MatchData, Frame[Pi433MHzPacket.FRAME_TIME], MatchKey)
+   if Burst[Pi433MHzDedup.BURST_FLAG] != False:
+      ConfigElement = None
+      LogFlag = False
+   elif ConfigElement == None and Burst[Pi433MHzDedup.BURST_COPIES] >= 3:
+      # Repair bit errors with a majority vote of the copies received, when no copy has matched.
+      MatchData = RxVoter.VoteData(Burst)
+      ConfigElement = ConfigIndex.Match(MatchData)
+      if ConfigElement != None:
+         sys.stdout.write("REPAIRED FROM {:d} COPIES\n".format(Burst[Pi433MHzDedup.BURST_COPIES]))
+   if ConfigElement != None:
+      Burst[Pi433MHzDedup.BURST_FLAG] = ConfigElement[Pi433MHzMatch.CONFIG_ELEMENT_COMMAND]
+
+   # Format the byte data in hex format.
+   if ConfigElement != None or LogFlag == True:
+      DataString = ""
+      for Byte in MatchData:
+         DataString += "{:02X}".format(Byte)
+
+   # Respond to a data match.
+   if ConfigElement != None:
+      Now = datetime.datetime.now()
+      sys.stdout.write(Now.strftime("%Y-%m-%d %H:%M:%S\n"))
+      sys.stdout.write("MATCH: " + str(ConfigElement) + "\n")
+      if len(GPIO_RX_PINS) > 1:
+         sys.stdout.write("RX PIN: {:d}\n".format(Frame[Pi433MHzPacket.FRAME_RX_PIN]))
+      sys.stdout.write("START BIT PERIOD {:f}\n".format(StartBitPeriod))
+      sys.stdout.write(DataString + "\n")
+      # Run the command in the background, so data continues to be received while the command runs.
+      if Dispatcher.Submit(ConfigElement[Pi433MHzMatch.CONFIG_ELEMENT_COMMAND]) == False:
+         sys.stdout.write("COMMAND NOT RUN, ALREADY RUNNING OR QUEUE FULL\n")
+      sys.stdout.write("COMMAND QUEUE: {:d}\n\n".format(Dispatcher.QueueDepth()))
+      sys.stdout.flush()
+   elif LogFlag == True:
+      Now = datetime.datetime.now()
+      sys.stdout.write(Now.strftime("%Y-%m-%d %H:%M:%S\n"))
+      sys.stdout.write("NO MATCH\n")
+      if len(GPIO_RX_PINS) > 1:
+         sys.stdout.write("RX PIN: {:d}\n".format(Frame[Pi433MHzPacket.FRAME_RX_PIN]))
+      sys.stdout.write("START BIT PERIOD {:f}\n".format(StartBitPeriod))
+      sys.stdout.write(DataString + "\n")
+      sys.stdout.flush()
+
+
+
+def main():
+   global ConfigIndex, RxVoter, Dispatcher
+
+   # Start capturing receiver edges, with the transmitter switched off. RPi.GPIO is only imported by the backends using it.
+   Backend = Pi433MHzCapture.CreateBackend(RX_CAPTURE_BACKEND, GPIO_RX_PINS, GPIO_TX_PIN, TX_OFF_LEVEL)
+   Backend.Open()
+
+   # Read configuration data, indexed by data signature.
+   ConfigIndex = Pi433MHzMatch.SignatureIndex(Pi433MHzMatch.LoadConfig(CONFIG_FILE))
+
+   # Decode received edges into frames of byte data, independently for each receiver. Each byte is matched as it is
+   # received, so a frame is processed as soon as a data signature matches, rather than at the end of data period.
+   Decoder = Pi433MHzPacket.MultiPinDecoder(GPIO_RX_PINS, RX_END_PERIOD, RX_REJECT_PERIOD, MIN_RX_BYTES, \
+      lambda: Pi433MHzMatch.SignatureParser(ConfigIndex, MATCH_GRACE_BYTES))
+   # Select the cleanest copy of each frame received by several receivers.
+   RxSelector = Pi433MHzDedup.DiversitySelector(GPIO_RX_PINS, DIVERSITY_WINDOW, RX_END_PERIOD, RxRank)
+
+   # Watch the configuration file for changes.
+   if CONFIG_RELOAD == True:
+      Watcher = Pi433MHzMatch.ConfigWatcher(CONFIG_FILE)
+      Watcher.Start()
+
+   # Group repeated data, to respond once to each burst of repeated data.
+   RxVoter = Pi433MHzDedup.BurstVoter(DEDUP_WINDOW, DEDUP_MAX_BIT_ERRORS)
+
+   # Start the background command workers.
+   Dispatcher = Pi433MHzDispatch.CommandDispatcher(COMMAND_WORKERS, COMMAND_QUEUE_SIZE, COMMAND_LIMIT, COMMAND_TIMEOUT)
+   Dispatcher.Start()
+
+   # Infinate loop for this application.
+   sys.stdout.write("\nWAITING FOR DATA...\n\n")
+   sys.stdout.flush()
+   ExitFlag = False
+   while ExitFlag == False:
+      # Swap in a reloaded configuration between frames, so each frame is matched against one configuration.
+      if CONFIG_RELOAD == True and Decoder.IsReceiving() == False:
+         NewIndex = Watcher.TakeIndex()
+         if NewIndex != None:
+            ConfigIndex = NewIndex
+            for PinDecoder in Decoder.Decoders.values():
+               PinDecoder.Parser.SetIndex(ConfigIndex)
+
+      # Wait for edges, only wait for the end of data period while data is being received,
+      # and no longer than until copies of a frame held for other receivers are selected.
+      if Decoder.IsReceiving() == False:
+         Timeout = RX_IDLE_PERIOD
+      else:
+         Timeout = RX_END_PERIOD
+      Deadline = RxSelector.NextDeadline(Backend.Now())
+      if Deadline != None:
+         Timeout = min(Timeout, Deadline)
+      Edges = Backend.Read(Timeout)
+
+      # An edge after the end of data period starts new RX data, so the previous RX data is returned first.
+      for Edge in Edges:
+         Frame = Decoder.Edge(Edge)
+         if Frame != None:
+            for Frame in RxSelector.Add(Frame):
+               RxEndOfData(Frame)
+
+      # Check if data is currently being received.
+      Now = Backend.Now()
+      for Frame in Decoder.EndOfData(Now):
+         for Frame in RxSelector.Add(Frame):
+            RxEndOfData(Frame)
+      for Frame in RxSelector.Poll(Now):
+         RxEndOfData(Frame)
+      if Now - Decoder.LastBitPeriod > RX_END_PERIOD + DIVERSITY_WINDOW and Backend.IsFinished() == True:
+         ExitFlag = True
+
+   Backend.Close()
+   Dispatcher.Stop()
+   if CONFIG_RELOAD == True:
+      Watcher.Stop()
+
+
+
+if __name__ == "__main__":
+   main()
@@ -0,0 +1,118 @@
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* Pi433MHzSignatureDb - RX signature statistics database.                  */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* SQLite database of the RX signatures logged by Pi433MHz.py, updated as  */
+#/* each packet is logged. Holds the number of times each RX signature has  */
+#/* been received, when it was first and last received, and the number of   */
+#/* times it was received in each hour, so summaries can be queried without */
+#/* reading the log files.                                                   */
+#/****************************************************************************/
+
+
+
+import time
+import sqlite3
+
+
+
+# Database tables.
+DATABASE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS Signatures (
+   Signature TEXT PRIMARY KEY,
+   Count INTEGER NOT NULL,
+   FirstSeen INTEGER NOT NULL,
+   LastSeen INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS HourlyCounts (
+   Signature TEXT NOT NULL,
+   Hour INTEGER NOT NULL,
+   Count INTEGER NOT NULL,
+   PRIMARY KEY (Signature, Hour)
+);
+CREATE INDEX IF NOT EXISTS HourlyCountsHour ON HourlyCounts (Hour);
+"""
+
+# Seconds in an hour.
+HOUR_PERIOD = 3600
+
+
+
+class SignatureDatabase:
+   def __init__(self, FileName, CommitPeriod=5.0):
+      self.CommitPeriod = CommitPeriod
+      self.CommitTime = time.monotonic()
+      self.PendingCount = 0
+      # The connection is used by the decoding worker threads, the application serialises access.
+      self.Connection = sqlite3.connect(FileName, check_same_thread=False)
+      self.Connection.executescript(DATABASE_SCHEMA)
+      self.Connection.commit()
+
+
+   # Count an RX signature received at a time in seconds since the epoch.
+   def Add(self, RxSignature, TimeStamp):
+      RxSignature = RxSignature.strip()
+      TimeStamp = int(TimeStamp)
+      self.Connection.execute("INSERT INTO Signatures (Signature, Count, FirstSeen, LastSeen) VALUES (?, 1, ?, ?) " \
+         "ON CONFLICT (Signature) DO UPDATE SET Count = Count + 1, FirstSeen = MIN(FirstSeen, excluded.FirstSeen), LastSeen = MAX(LastSeen, excluded.LastSeen)", \
+         (RxSignature, TimeStamp, TimeStamp))
+      self.Connection.execute("INSERT INTO HourlyCounts (Signature, Hour, Count) VALUES (?, ?, 1) " \
+         "ON CONFLICT (Signature, Hour) DO UPDATE SET Count = Count + 1", \
+         (RxSignature, TimeStamp // HOUR_PERIOD))
+      self.PendingCount += 1
+
+
+   # Write the counts added to the database file.
+   def Commit(self):
+      if self.PendingCount > 0:
+         self.Connection.commit()
+         self.PendingCount = 0
+      self.CommitTime = time.monotonic()
+
+
+   # Called periodically, commits the counts added when the commit period has passed.
+   def Poll(self):
+      if self.PendingCount > 0 and time.monotonic() - self.CommitTime >= self.CommitPeriod:
+         self.Commit()
+
+
+   def Close(self):
+      self.Commit()
+      self.Connection.close()
+
+
+   # Most received RX signatures, as a list of [SIGNATURE, COUNT, FIRST_SEEN, LAST_SEEN].
+   def Top(self, Count):
+      return self.Connection.execute("SELECT Signature, Count, FirstSeen, LastSeen FROM Signatures " \
+         "ORDER BY Count DESC, Signature LIMIT ?", (Count,)).fetchall()
+
+
+   # Most received RX signatures between two times in seconds since the epoch, to the hour,
+   # as a list of [SIGNATURE, COUNT].
+   def TopInRange(self, StartTime, EndTime, Count):
+      return self.Connection.execute("SELECT Signature, SUM(Count) AS RangeCount FROM HourlyCounts " \
+         "WHERE Hour >= ? AND Hour < ? GROUP BY Signature ORDER BY RangeCount DESC, Signature LIMIT ?", \
+         (int(StartTime) // HOUR_PERIOD, (int(EndTime) + HOUR_PERIOD - 1) // HOUR_PERIOD, Count)).fetchall()
+
+
+   # Number of times an RX signature was received in each hour, as a list of [HOUR_TIME, COUNT].
+   def Hours(self, RxSignature):
+      return self.Connection.execute("SELECT Hour * ?, Count FROM HourlyCounts WHERE Signature = ? ORDER BY Hour", \
+         (HOUR_PERIOD, RxSignature.strip())).fetchall()
@@ -0,0 +1,139 @@
+#!/usr/bin/python3
+
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* Pi433MHzSignatures - Query the RX signature statistics database.        */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* Script for summarising the RX signatures received by Pi433MHz.py, from  */
+#/* the RX signature statistics database updated as packets are logged.     */
+#/*                                                                          */
+#/* TOP [COUNT]                   - Most received RX signatures.             */
+#/* RANGE START END [COUNT]       - Most received RX signatures between two  */
+#/*                                 dates "YYYY-MM-DD[ HH:MM]".              */
+#/* HOURS SIGNATURE               - Hourly counts for an RX signature.       */
+#/* IMPORT LOG_FILE ...           - Add the RX signatures in existing log    */
+#/*                                 files to the database.                   */
+#/****************************************************************************/
+
+
+
+import sys
+import gzip
+import time
+import datetime
+import Pi433MHzSignatureDb
+
+
+
+# RX signature statistics database file.
+SIGNATURE_DATABASE = "LOG/Pi433MHzSignatures.db"
+
+# Number of command line arguments.
+ARG_COUNT = 2
+# Command line arguments.
+ARG_EXE = 0
+ARG_COMMAND = 1
+ARG_PARAM = 2
+
+# Default number of RX signatures to display.
+DEFAULT_COUNT = 20
+
+
+
+# Convert a "YYYY-MM-DD[ HH:MM]" date and time to seconds since the epoch.
+def ParseDate(DateText):
+   if len(DateText) > 10:
+      Date = datetime.datetime.strptime(DateText, "%Y-%m-%d %H:%M")
+   else:
+      Date = datetime.datetime.strptime(DateText, "%Y-%m-%d")
+
+   return time.mktime(Date.timetuple())
+
+
+
+# Format a time in seconds since the epoch.
+def FormatTime(TimeStamp):
+   return datetime.datetime.fromtimestamp(TimeStamp).strftime("%Y-%m-%d %H:%M:%S")
+
+
+
+# Add the RX signatures logged in a Pi433MHz.py log file to the database.
+def ImportLogFile(Database, FileName):
+   if FileName.endswith(".gz"):
+      File = gzip.open(FileName, 'rt', errors="replace")
+   else:
+      File = open(FileName, 'r', errors="replace")
+   ImportCount = 0
+   LogTime = None
+   for TextLine in File:
+      TextLine = TextLine.rstrip("\n")
+      # Each log entry starts with the date and time of the RX data.
+      if len(TextLine) == 19 and TextLine[4] == "-" and TextLine[13] == ":":
+         try:
+            LogTime = time.mktime(datetime.datetime.strptime(TextLine, "%Y-%m-%d %H:%M:%S").timetuple())
+         except ValueError:
+            pass
+      elif TextLine.startswith("RX SIGNATURE: ") and LogTime != None:
+         RxSignature = TextLine[len("RX SIGNATURE: "):].split("!")[0]
+         Database.Add(RxSignature, LogTime)
+         ImportCount += 1
+   File.close()
+
+   return ImportCount
+
+
+
+def main():
+   # Check for command line argument.
+   if len(sys.argv) < ARG_COUNT:
+      sys.stdout.write("\n" + sys.argv[ARG_EXE] + " TOP [COUNT]\n")
+      sys.stdout.write(sys.argv[ARG_EXE] + " RANGE START END [COUNT]\n")
+      sys.stdout.write(sys.argv[ARG_EXE] + " HOURS SIGNATURE\n")
+      sys.stdout.write(sys.argv[ARG_EXE] + " IMPORT LOG_FILE ...\n\n")
+   else:
+      Database = Pi433MHzSignatureDb.SignatureDatabase(SIGNATURE_DATABASE)
+      Command = sys.argv[ARG_COMMAND].upper()
+      Params = sys.argv[ARG_PARAM:]
+      if Command == "TOP":
+         Count = DEFAULT_COUNT
+         if len(Params) > 0:
+            Count = int(Params[0])
+         for RxSignature, SignatureCount, FirstSeen, LastSeen in Database.Top(Count):
+            sys.stdout.write("{:7d} RX SIGNATURE: {:s} FIRST: {:s} LAST: {:s}\n".format(SignatureCount, RxSignature, FormatTime(FirstSeen), FormatTime(LastSeen)))
+      elif Command == "RANGE" and len(Params) >= 2:
+         Count = DEFAULT_COUNT
+         if len(Params) > 2:
+            Count = int(Params[2])
+         for RxSignature, SignatureCount in Database.TopInRange(ParseDate(Params[0]), ParseDate(Params[1]), Count):
+            sys.stdout.write("{:7d} RX SIGNATURE: {:s}\n".format(SignatureCount, RxSignature))
+      elif Command == "HOURS" and len(Params) >= 1:
+         for HourTime, SignatureCount in Database.Hours(" ".join(Params)):
+            sys.stdout.write("{:s} {:7d}\n".format(FormatTime(HourTime), SignatureCount))
+      elif Command == "IMPORT":
+         for FileName in Params:
+            sys.stdout.write("{:s}: {:d}\n".format(FileName, ImportLogFile(Database, FileName)))
+      else:
+         sys.stdout.write("UNKNOWN COMMAND: {:s}\n".format(" ".join(sys.argv[ARG_COMMAND:])))
+      Database.Close()
+
+
+
+if __name__ == "__main__":
+   main()
@@ -0,0 +1,103 @@
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* Pi433MHzSynth - Synthetic 433MHz receiver signal generator.              */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* Generates the edges a 433MHz receiver would produce for transmitted     */
+#/* packet bytes, with receiver imperfections added, for testing and        */
+#/* benchmarking the decoding without a 433MHz receiver.                     */
+#/*                                                                          */
+#/* JITTER - Gaussian timing error added to the time of each edge.          */
+#/* GLITCH - Short noise pulses inserted into levels.                        */
+#/* DROP   - Edges missed by the receiver capture.                           */
+#/****************************************************************************/
+
+
+
+import random
+import Pi433MHzWave
+import Pi433MHzDecode
+import Pi433MHzCapture
+import Pi433MHzPulse
+
+
+
+# Synthetic signal settings fields.
+SYNTH_BIT_PERIOD = 0
+SYNTH_START_BITS = 1
+SYNTH_INVERT = 2
+SYNTH_JITTER = 3
+SYNTH_GLITCH_RATE = 4
+SYNTH_GLITCH_PERIOD = 5
+SYNTH_DROP_RATE = 6
+
+
+
+# Synthetic signal settings, a bit period of 500us with no receiver imperfections. Periods are in nanoseconds.
+def SynthSettings(BitPeriod=500000, StartBits=1, Invert=0, Jitter=0, GlitchRate=0.0, GlitchPeriod=2000, DropRate=0.0):
+   return [BitPeriod, StartBits, Invert, Jitter, GlitchRate, GlitchPeriod, DropRate]
+
+
+
+# Generate the capture edges [EDGE_RX_PIN, EDGE_LEVEL, EDGE_TIME] received for the transmitted packet bytes, starting at StartTime.
+# Edge times are integer nanoseconds.
+# Receiver levels follow the transmitter GPIO levels, inverted when SYNTH_INVERT is 1.
+def SynthEdges(PacketBytes, Settings, RxPin=26, StartTime=1000000000, Random=random):
+   Waveform = Pi433MHzWave.CompileWaveform(PacketBytes, Settings[SYNTH_BIT_PERIOD], Settings[SYNTH_START_BITS])
+
+   Edges = []
+   EdgeTime = StartTime
+   for Level, Period in Waveform:
+      Level ^= Settings[SYNTH_INVERT]
+      Edges.append([RxPin, Level, EdgeTime])
+      # Insert a glitch, a noise pulse of the opposite level, part way through the level.
+      if Period > 0 and Random.random() < Settings[SYNTH_GLITCH_RATE]:
+         GlitchTime = EdgeTime + int(Random.uniform(0.25, 0.75) * Period)
+         Edges.append([RxPin, Level ^ 1, GlitchTime])
+         Edges.append([RxPin, Level, GlitchTime + Settings[SYNTH_GLITCH_PERIOD]])
+      EdgeTime += Period
+
+   # Add timing jitter, keeping edges in time order.
+   if Settings[SYNTH_JITTER] > 0:
+      LastTime = 0
+      for Edge in Edges:
+         Edge[Pi433MHzCapture.EDGE_TIME] = max(Edge[Pi433MHzCapture.EDGE_TIME] + int(round(Random.gauss(0.0, Settings[SYNTH_JITTER]))), LastTime)
+         LastTime = Edge[Pi433MHzCapture.EDGE_TIME]
+
+   # Drop edges, never the first edge which starts the transmission.
+   if Settings[SYNTH_DROP_RATE] > 0:
+      Edges = Edges[:1] + [Edge for Edge in Edges[1:] if Random.random() >= Settings[SYNTH_DROP_RATE]]
+
+   return Edges
+
+
+
+# Generate the pulse buffer of RX data captured by Pi433MHz.py for the transmitted packet bytes.
+def SynthRxData(PacketBytes, Settings, RxPin=26, Random=random):
+   Captures = Pi433MHzDecode.CaptureEdges(SynthEdges(PacketBytes, Settings, RxPin, 1000000000, Random), RxPin)
+   if len(Captures) == 0:
+      return Pi433MHzPulse.PulseBuffer(RxPin)
+
+   return Captures[0]
+
+
+
+# Generate a list of random packet bytes.
+def RandomBytes(ByteCount, Random=random):
+   return [Random.randrange(256) for Count in range(ByteCount)]
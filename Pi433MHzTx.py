@@ -1,4 +1,4 @@
-#!/usr/bin/python
+#!/usr/bin/python3
 
 # Pi433MHz - 433MHz Data Reciever and Decoder
 # Copyright (C) 2019 Jason Birch
@@ -36,7 +36,9 @@ import math
 import time
 import hashlib
 import datetime
-import RPi.GPIO
+import Pi433MHzWave
+import Pi433MHzPacket
+import Pi433MHzTxQueue
 
 
 
@@ -45,130 +47,85 @@ ARG_COUNT = 2
 # Data to send command line argument.
 ARG_EXE = 0
 ARG_DATA = 1
+# Optional command line argument to measure transmit timing.
+ARG_MEASURE = 2
 
 # GPIO Pin connected to 433MHz receiver.
 GPIO_RX_PIN = 26
 # GPIO Pin connected to 433MHz transmitter.
 GPIO_TX_PIN = 19
 
-# GPIO level to switch transmitter off.
-TX_OFF_LEVEL = 1
-# GPIO level to switch transmitter on.
-TX_ON_LEVEL = 0
-# Period to signify end of Tx message.
-TX_END_PERIOD = 0.01
-# Single level period, one period is a binary 0, two periods are a binary 1. 
-TX_LEVEL_PERIOD = 0.002
-# Start bits transmitted to signify start of transmission.
-TX_START_BITS = 1
+# Transmit levels and periods are in Pi433MHzWave.py, shared with Pi433MHzTxDaemon.py.
+TX_OFF_LEVEL = Pi433MHzWave.TX_OFF_LEVEL
+TX_ON_LEVEL = Pi433MHzWave.TX_ON_LEVEL
+TX_END_PERIOD = Pi433MHzWave.TX_END_PERIOD
+TX_LEVEL_PERIOD = Pi433MHzWave.TX_LEVEL_PERIOD
+TX_START_BITS = Pi433MHzWave.TX_START_BITS
+TX_SPIN_PERIOD = Pi433MHzWave.TX_SPIN_PERIOD
+# Unix socket path of a running Pi433MHzTxDaemon.py, used to transmit instead of configuring GPIO.
+TX_SOCKET_PATH = Pi433MHzTxQueue.TX_SOCKET_PATH
 
 # Data encryption key.
 ENCRYPTION_KEY = [ 0xC5, 0x07, 0x8C, 0xA9, 0xBD, 0x8B, 0x48, 0xEF, 0x88, 0xE1, 0x94, 0xDB, 0x63, 0x77, 0x95, 0x59 ]
 # Data packet identifier.
 PACKET_SIGNATURE = [ 0x63, 0xF9, 0x5C, 0x1B ]
-
-
-
-# Data packet to transmit.
-DataPacket = {
-   "SIGNATURE": PACKET_SIGNATURE,
-   "DATA_LENGTH": 0,
-   "DATA": [],
-   "CHECKSUM": 0,
-}
-
-
-
-# Transmit a byte of data from the 433MHz module.
-def Tx433Byte(Byte):
-   global CurrentTxLevel
-
-   BitMask = (1 << 7)
-   for BitCount in range(8):
-      # Get the next bit from the byte to transmit.
-      Bit = (Byte & BitMask)
-      BitMask = int(BitMask / 2)
-
-      # Toggle GPIO level.
-      if CurrentTxLevel == TX_OFF_LEVEL:
-         CurrentTxLevel = TX_ON_LEVEL
-      else:
-         CurrentTxLevel = TX_OFF_LEVEL
-      RPi.GPIO.output(GPIO_TX_PIN, CurrentTxLevel)
-      # Bit 0 level period.
-      time.sleep(TX_LEVEL_PERIOD)
-      # Bit 1 level additional period.
-      if Bit > 0:
-         time.sleep(TX_LEVEL_PERIOD)
-
-
-
-# A very basic encrypt/decript function, for keeping demonstration code simple. Use a comprehensive function in production code.
-def BasicEncryptDecrypt(Data):
-   KeyCount = 0
-   KeyLen = len(ENCRYPTION_KEY)
-   for Count in range(len(Data)):
-      Data[Count] ^= ENCRYPTION_KEY[KeyCount]
-      if KeyCount >= KeyLen:
-         KeyCount = 0
-
-
-
-#  /*******************************************/
-# /* Configure Raspberry Pi GPIO interfaces. */
-#/*******************************************/
-RPi.GPIO.setwarnings(False)
-RPi.GPIO.setmode(RPi.GPIO.BCM)
-RPi.GPIO.setup(GPIO_RX_PIN, RPi.GPIO.IN, pull_up_down=RPi.GPIO.PUD_UP)
-RPi.GPIO.setup(GPIO_TX_PIN, RPi.GPIO.OUT, initial=TX_OFF_LEVEL)
-
-
-
-# Check for command line argument.
-if len(sys.argv) < ARG_COUNT:
-   sys.stdout.write("\n" + sys.argv[ARG_EXE] + " [SEND_DATA]\n\n")
-else:
-   # Place data into data packet and set packet values ready to be sent.
-   DataPacket["DATA_LENGTH"] = len(sys.argv[ARG_DATA])
-   #Tokenise and encrypt data to be sent.
-   DataPacket["DATA"] = list(sys.argv[ARG_DATA])
-   for Count in range(len(DataPacket["DATA"])):
-      DataPacket["DATA"][Count] = ord(DataPacket["DATA"][Count])
-   BasicEncryptDecrypt(DataPacket["DATA"])
-   # Calculate checksum of data for transmission validation.
-   DataPacket["CHECKSUM"] = 0
-   for Byte in DataPacket["DATA"]:
-      DataPacket["CHECKSUM"] ^= Byte
-
-   # Display data packet being sent.
-   sys.stdout.write("\nSENDING PACKET:\n")
-   sys.stdout.write(str(DataPacket) + "\n\n")
-
-   # Switch on 433MHz transmitter.
-   CurrentTxLevel = TX_ON_LEVEL
-   RPi.GPIO.output(GPIO_TX_PIN, CurrentTxLevel)
-   # Wait for the number of start bits.
-   for Count in range(TX_START_BITS):
-      time.sleep(TX_LEVEL_PERIOD)
-
-   # Transmit data packet signature.
-   for Byte in DataPacket["SIGNATURE"]:
-      Tx433Byte(Byte)
-
-   # Transmit data packet data length.
-   Tx433Byte(DataPacket["DATA_LENGTH"])
-
-   # Transmit data packet encrypted data.
-   for Byte in DataPacket["DATA"]:
-      Tx433Byte(Byte)
-
-   # Transmit data packet data checksum.
-   Tx433Byte(DataPacket["CHECKSUM"])
-
-   # Switch off 433MHz transmitter.
-   CurrentTxLevel = TX_OFF_LEVEL
-   RPi.GPIO.output(GPIO_TX_PIN, CurrentTxLevel)
-
-   # End of transmission period.
-   time.sleep(TX_END_PERIOD)
-
+# Data packet format version. PACKET_VERSION_XOR for an XOR checksum, PACKET_VERSION_CRC for a CRC-16 or
+# PACKET_VERSION_FEC for a CRC-16 with forward error correction.
+PACKET_VERSION = Pi433MHzPacket.PACKET_VERSION_XOR
+
+
+
+def main():
+   # Check for command line argument.
+   if len(sys.argv) < ARG_COUNT:
+      sys.stdout.write("\n" + sys.argv[ARG_EXE] + " [SEND_DATA] [MEASURE]\n\n")
+   else:
+      # Place data into data packet, encrypted and with a checksum, ready to be sent.
+      DataPacket = Pi433MHzPacket.EncodePacket([ord(Character) for Character in sys.argv[ARG_DATA]], PACKET_SIGNATURE, ENCRYPTION_KEY, PACKET_VERSION)
+
+      # Display data packet being sent.
+      sys.stdout.write("\nSENDING PACKET:\n")
+      sys.stdout.write(str(DataPacket) + "\n\n")
+
+      PacketBytes = Pi433MHzPacket.PacketBytes(DataPacket)
+      MeasureFlag = (len(sys.argv) > ARG_MEASURE and sys.argv[ARG_MEASURE].upper() == "MEASURE")
+
+      SentFlag = False
+      if os.path.exists(TX_SOCKET_PATH) and MeasureFlag == False:
+         # Transmit data packet with the running transmit daemon.
+         try:
+            sys.stdout.write(Pi433MHzTxQueue.SendRequest(PacketBytes, SocketPath=TX_SOCKET_PATH) + "\n\n")
+            SentFlag = True
+         except OSError:
+            # Socket left by a transmit daemon which is no longer running, transmit directly.
+            pass
+
+      if SentFlag == False:
+         import RPi.GPIO
+
+         #  /*******************************************/
+         # /* Configure Raspberry Pi GPIO interfaces. */
+         #/*******************************************/
+         RPi.GPIO.setwarnings(False)
+         RPi.GPIO.setmode(RPi.GPIO.BCM)
+         RPi.GPIO.setup(GPIO_RX_PIN, RPi.GPIO.IN, pull_up_down=RPi.GPIO.PUD_UP)
+         RPi.GPIO.setup(GPIO_TX_PIN, RPi.GPIO.OUT, initial=TX_OFF_LEVEL)
+
+         # Compile the data packet into a list of transmitter levels and periods, before transmitting.
+         Waveform = Pi433MHzWave.CompileWaveform(PacketBytes, TX_LEVEL_PERIOD, TX_START_BITS, TX_END_PERIOD)
+
+         # Transmit data packet.
+         Measurement = Pi433MHzWave.PlayWaveform(lambda Level: RPi.GPIO.output(GPIO_TX_PIN, Level), Waveform, TX_SPIN_PERIOD, MeasureFlag)
+
+         # Display the achieved timing against the requested timing.
+         if MeasureFlag == True:
+            sys.stdout.write("LEVEL CHANGES: {:d}\n".format(Measurement[Pi433MHzWave.MEASURE_SEGMENTS]))
+            sys.stdout.write("MAX SCHEDULE ERROR: {:d} ns\n".format(Measurement[Pi433MHzWave.MEASURE_MAX_ERROR]))
+            sys.stdout.write("MEAN SCHEDULE ERROR: {:d} ns\n".format(Measurement[Pi433MHzWave.MEASURE_MEAN_ERROR]))
+            sys.stdout.write("MAX LEVEL PERIOD ERROR: {:d} ns ({:.1f}% OF LEVEL PERIOD)\n\n".format(Measurement[Pi433MHzWave.MEASURE_MAX_PERIOD_ERROR], \
+               100.0 * Measurement[Pi433MHzWave.MEASURE_MAX_PERIOD_ERROR] / TX_LEVEL_PERIOD))
+
+
+
+if __name__ == "__main__":
+   main()
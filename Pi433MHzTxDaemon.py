@@ -0,0 +1,98 @@
+#!/usr/bin/python3
+
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* Pi433MHzTxDaemon - 433MHz transmit daemon.                               */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* Script which configures the 433MHz transmitter GPIO once, then transmits */
+#/* the data in requests received on a Unix socket, in priority order. So   */
+#/* sending data does not wait for Python and GPIO to start up, and several */
+#/* applications can transmit without corrupting each other's data.         */
+#/****************************************************************************/
+
+
+
+import sys
+import signal
+import Pi433MHzWave
+import Pi433MHzTxQueue
+
+
+
+# GPIO Pin connected to 433MHz transmitter.
+GPIO_TX_PIN = 19
+
+# Transmit levels and periods are in Pi433MHzWave.py, shared with Pi433MHzTx.py.
+TX_OFF_LEVEL = Pi433MHzWave.TX_OFF_LEVEL
+TX_END_PERIOD = Pi433MHzWave.TX_END_PERIOD
+TX_LEVEL_PERIOD = Pi433MHzWave.TX_LEVEL_PERIOD
+TX_START_BITS = Pi433MHzWave.TX_START_BITS
+TX_SPIN_PERIOD = Pi433MHzWave.TX_SPIN_PERIOD
+
+# Unix socket path transmit requests are received on.
+TX_SOCKET_PATH = Pi433MHzTxQueue.TX_SOCKET_PATH
+# Maximum number of transmit requests waiting to be transmitted.
+TX_QUEUE_SIZE = 64
+# Maximum number of times a request can transmit its data.
+TX_MAX_REPEAT = Pi433MHzTxQueue.TX_MAX_REPEAT
+# Maximum period the transmitter is off between repeated transmissions, in nanoseconds.
+TX_MAX_GAP_PERIOD = Pi433MHzTxQueue.TX_MAX_GAP_PERIOD
+
+
+
+def main():
+   import RPi.GPIO
+
+   TxQueue = Pi433MHzTxQueue.TxQueue(lambda Level: RPi.GPIO.output(GPIO_TX_PIN, Level), TX_LEVEL_PERIOD, \
+      TX_START_BITS, TX_END_PERIOD, TX_SPIN_PERIOD, TX_QUEUE_SIZE)
+   # Listen before configuring the GPIO, so a second daemon exits without driving the transmitter.
+   try:
+      Server = Pi433MHzTxQueue.TxServer(TX_SOCKET_PATH, TxQueue, TX_MAX_REPEAT, TX_MAX_GAP_PERIOD)
+   except OSError as Error:
+      sys.stderr.write("ERROR {:s}\n".format(str(Error)))
+      sys.exit(1)
+
+   #  /*******************************************/
+   # /* Configure Raspberry Pi GPIO interfaces. */
+   #/*******************************************/
+   RPi.GPIO.setwarnings(False)
+   RPi.GPIO.setmode(RPi.GPIO.BCM)
+   RPi.GPIO.setup(GPIO_TX_PIN, RPi.GPIO.OUT, initial=TX_OFF_LEVEL)
+
+   # Start transmitting queued requests.
+   TxQueue.Start()
+   # Stop cleanly when terminated, removing the socket.
+   signal.signal(signal.SIGTERM, signal.default_int_handler)
+   sys.stdout.write("LISTENING: {:s}\n".format(TX_SOCKET_PATH))
+   sys.stdout.flush()
+   try:
+      Server.serve_forever()
+   except KeyboardInterrupt:
+      pass
+   finally:
+      Server.server_close()
+      # Transmit requests already queued before exiting.
+      TxQueue.Stop()
+      RPi.GPIO.output(GPIO_TX_PIN, TX_OFF_LEVEL)
+
+
+
+if __name__ == "__main__":
+   main()
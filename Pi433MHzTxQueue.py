@@ -0,0 +1,255 @@
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* Pi433MHzTxQueue - 433MHz transmit request queue.                         */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* Transmit requests are received on a Unix socket and queued in priority  */
+#/* order, then transmitted one at a time by a single transmit thread, so   */
+#/* requests from several applications can not corrupt each other.          */
+#/*                                                                          */
+#/* Requests are a line of text:                                             */
+#/* SEND HEX_DATA [PRIORITY] [REPEAT] [GAP]                                  */
+#/* PRIORITY - Lower numbers are transmitted first.                          */
+#/* REPEAT   - Number of times to transmit the data.                         */
+#/* GAP      - Seconds transmitter is off between repeated transmissions.    */
+#/*                                                                          */
+#/* Replies are a line of text:                                              */
+#/* QUEUED ID                                                                */
+#/* COMPLETE ID QUEUED: SECONDS TRANSMIT: SECONDS TOTAL: SECONDS             */
+#/* ERROR MESSAGE                                                            */
+#/****************************************************************************/
+
+
+
+import os
+import sys
+import time
+import queue
+import socket
+import itertools
+import threading
+import socketserver
+import Pi433MHzWave
+
+
+
+# Default Unix socket path transmit requests are received on.
+TX_SOCKET_PATH = "/tmp/Pi433MHzTx.sock"
+# Default transmit request priority.
+TX_DEFAULT_PRIORITY = 5
+# Default maximum number of times a request can transmit its data, so one request can not hold the transmitter.
+TX_MAX_REPEAT = 20
+# Default maximum period the transmitter is off between repeated transmissions, in nanoseconds.
+TX_MAX_GAP_PERIOD = 5000000000
+
+# Transmit request fields.
+TXREQ_ID = 0
+TXREQ_DATA = 1
+TXREQ_REPEAT = 2
+TXREQ_GAP = 3
+TXREQ_QUEUE_TIME = 4
+TXREQ_START_TIME = 5
+TXREQ_END_TIME = 6
+TXREQ_DONE = 7
+
+
+
+# Priority queue of transmit requests, transmitted one at a time by a transmit thread.
+class TxQueue:
+   def __init__(self, Output, LevelPeriodNs, StartBits, EndPeriodNs, SpinPeriodNs, QueueSize=64):
+      self.Output = Output
+      self.LevelPeriodNs = LevelPeriodNs
+      self.StartBits = StartBits
+      self.EndPeriodNs = EndPeriodNs
+      self.SpinPeriodNs = SpinPeriodNs
+      self.Queue = queue.PriorityQueue(QueueSize)
+      # Sequence number keeps requests of the same priority in the order received.
+      self.Sequence = itertools.count()
+      self.Thread = None
+      # Number of requests not queued because the queue was full.
+      self.RejectedCount = 0
+      # Number of requests transmitted.
+      self.CompletedCount = 0
+
+
+   def Start(self):
+      self.Thread = threading.Thread(target=self.Run, daemon=True)
+      self.Thread.start()
+
+
+   # Wait for queued requests to be transmitted, then stop the transmit thread.
+   def Stop(self):
+      if self.Thread != None:
+         self.Queue.put([float("inf"), next(self.Sequence), None])
+         self.Thread.join()
+         self.Thread = None
+
+
+   # Number of requests waiting to be transmitted.
+   def QueueDepth(self):
+      return self.Queue.qsize()
+
+
+   # Queue packet bytes to be transmitted, returns the transmit request, or None if the queue is full.
+   def Submit(self, PacketBytes, Priority=TX_DEFAULT_PRIORITY, Repeat=1, GapNs=0):
+      Sequence = next(self.Sequence)
+      TxRequest = [Sequence, PacketBytes, Repeat, GapNs, time.perf_counter_ns(), 0, 0, threading.Event()]
+      try:
+         self.Queue.put_nowait([Priority, Sequence, TxRequest])
+      except queue.Full:
+         self.RejectedCount += 1
+         return None
+
+      return TxRequest
+
+
+   # Compile the transmit request into a single waveform, with the transmitter off for the gap period between repeats.
+   def CompileRequest(self, TxRequest):
+      Frame = Pi433MHzWave.CompileWaveform(TxRequest[TXREQ_DATA], self.LevelPeriodNs, self.StartBits, self.EndPeriodNs)
+      # A gap shorter than the end of transmission period would join the repeats into one transmission.
+      GapNs = max(TxRequest[TXREQ_GAP], self.EndPeriodNs)
+      Waveform = []
+      for Count in range(TxRequest[TXREQ_REPEAT]):
+         Waveform.extend(Frame[:-1])
+         if Count < TxRequest[TXREQ_REPEAT] - 1:
+            Waveform.append([Pi433MHzWave.TX_OFF_LEVEL, GapNs])
+         else:
+            Waveform.append(Frame[-1])
+
+      return Waveform
+
+
+   def Run(self):
+      while True:
+         Priority, Sequence, TxRequest = self.Queue.get()
+         if TxRequest == None:
+            break
+         TxRequest[TXREQ_START_TIME] = time.perf_counter_ns()
+         try:
+            Waveform = self.CompileRequest(TxRequest)
+            Pi433MHzWave.PlayWaveform(self.Output, Waveform, self.SpinPeriodNs)
+            TxRequest[TXREQ_END_TIME] = time.perf_counter_ns()
+            self.CompletedCount += 1
+            sys.stdout.write("TX COMPLETE: {:d} {:s}\n".format(TxRequest[TXREQ_ID], LatencyText(TxRequest)))
+            sys.stdout.flush()
+         except Exception as Error:
+            TxRequest[TXREQ_END_TIME] = time.perf_counter_ns()
+            sys.stderr.write("TX ERROR: {:d} {:s}\n".format(TxRequest[TXREQ_ID], str(Error)))
+         finally:
+            TxRequest[TXREQ_DONE].set()
+
+
+
+# Text describing the latency of a completed transmit request.
+def LatencyText(TxRequest):
+   return "QUEUED: {:f} TRANSMIT: {:f} TOTAL: {:f}".format((TxRequest[TXREQ_START_TIME] - TxRequest[TXREQ_QUEUE_TIME]) / 1000000000.0, \
+      (TxRequest[TXREQ_END_TIME] - TxRequest[TXREQ_START_TIME]) / 1000000000.0, (TxRequest[TXREQ_END_TIME] - TxRequest[TXREQ_QUEUE_TIME]) / 1000000000.0)
+
+
+
+# Handle the transmit requests on a client connection.
+class TxRequestHandler(socketserver.StreamRequestHandler):
+   def handle(self):
+      try:
+         for Line in self.rfile:
+            TxRequest = self.server.QueueRequest(Line.decode("ascii", "replace").split())
+            if type(TxRequest) == str:
+               self.wfile.write(TxRequest.encode("ascii"))
+            else:
+               # Reply as soon as the request is queued, a client not interested in completion can close the connection.
+               self.wfile.write("QUEUED {:d}\n".format(TxRequest[TXREQ_ID]).encode("ascii"))
+               self.wfile.flush()
+               TxRequest[TXREQ_DONE].wait()
+               self.wfile.write("COMPLETE {:d} {:s}\n".format(TxRequest[TXREQ_ID], LatencyText(TxRequest)).encode("ascii"))
+            self.wfile.flush()
+      except OSError:
+         # Client closed the connection without waiting for completion.
+         pass
+
+
+
+# Unix socket server, passing transmit requests to a transmit queue.
+class TxServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+   daemon_threads = True
+
+   def __init__(self, SocketPath, Queue, MaxRepeat=TX_MAX_REPEAT, MaxGapNs=TX_MAX_GAP_PERIOD):
+      self.Queue = Queue
+      self.MaxRepeat = MaxRepeat
+      self.MaxGapNs = MaxGapNs
+      # Remove a socket left by a previous run, only when no transmit daemon is answering on it.
+      if os.path.exists(SocketPath):
+         with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as Socket:
+            try:
+               Socket.connect(SocketPath)
+            except ConnectionRefusedError:
+               os.remove(SocketPath)
+            else:
+               raise OSError("TRANSMIT DAEMON ALREADY RUNNING: {:s}".format(SocketPath))
+      socketserver.UnixStreamServer.__init__(self, SocketPath, TxRequestHandler)
+
+
+   def server_close(self):
+      socketserver.UnixStreamServer.server_close(self)
+      if os.path.exists(self.server_address):
+         os.remove(self.server_address)
+
+
+   # Queue a SEND request, returns the transmit request, or the error reply text.
+   def QueueRequest(self, Fields):
+      if len(Fields) < 2 or Fields[0].upper() != "SEND":
+         return "ERROR EXPECTED: SEND HEX_DATA [PRIORITY] [REPEAT] [GAP]\n"
+      try:
+         PacketBytes = list(bytes.fromhex(Fields[1]))
+         Priority = TX_DEFAULT_PRIORITY
+         if len(Fields) > 2:
+            Priority = int(Fields[2])
+         Repeat = 1
+         if len(Fields) > 3:
+            Repeat = int(Fields[3])
+         GapNs = 0
+         if len(Fields) > 4:
+            GapNs = int(round(float(Fields[4]) * 1000000000))
+      except ValueError as Error:
+         return "ERROR {:s}\n".format(str(Error))
+      if Repeat < 1 or Repeat > self.MaxRepeat:
+         return "ERROR INVALID REPEAT: {:d}\n".format(Repeat)
+      if GapNs < 0 or GapNs > self.MaxGapNs:
+         return "ERROR INVALID GAP: {:s}\n".format(Fields[4])
+
+      TxRequest = self.Queue.Submit(PacketBytes, Priority, Repeat, GapNs)
+      if TxRequest == None:
+         return "ERROR QUEUE FULL\n"
+
+      return TxRequest
+
+
+
+# Send a transmit request to a running transmit daemon, returns the final reply line.
+# When WaitFlag is False, returns once the request is queued rather than transmitted.
+def SendRequest(PacketBytes, Priority=TX_DEFAULT_PRIORITY, Repeat=1, Gap=0.0, WaitFlag=True, SocketPath=TX_SOCKET_PATH):
+   Request = "SEND {:s} {:d} {:d} {:f}\n".format(bytes(PacketBytes).hex(), Priority, Repeat, Gap)
+   with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as Socket:
+      Socket.connect(SocketPath)
+      Socket.sendall(Request.encode("ascii"))
+      Reply = Socket.makefile("r", encoding="ascii")
+      Line = Reply.readline()
+      if Line.startswith("QUEUED") and WaitFlag == True:
+         Line = Reply.readline()
+
+   return Line.strip()
@@ -0,0 +1,158 @@
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* Pi433MHzWatch - Watch a file for changes.                                */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* INOTIFY - Linux inotify events for the directory holding the file, so   */
+#/*           changes are seen immediately without reading the file system. */
+#/*           Editors which save by replacing the file are also seen.       */
+#/* MTIME   - Polls the modification time, size and inode of the file, used */
+#/*           when inotify is not available.                                 */
+#/****************************************************************************/
+
+
+
+import os
+import time
+import select
+import struct
+
+
+
+# File watcher names.
+WATCHER_INOTIFY = "INOTIFY"
+WATCHER_MTIME = "MTIME"
+
+# inotify flags and events, from linux/inotify.h.
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+# struct inotify_event, the event name follows the structure.
+INOTIFY_EVENT = struct.Struct("iIII")
+# Size of buffer to read inotify events into.
+INOTIFY_READ_SIZE = 4096
+# Period to wait for more changes after a change, so a file being written is read once complete, in seconds.
+SETTLE_PERIOD = 0.1
+
+
+
+# Watch a file with inotify events for its directory.
+class InotifyWatcher:
+   def __init__(self, FileName):
+      import ctypes
+      import ctypes.util
+
+      self.FileName = os.path.abspath(FileName)
+      self.Name = os.path.basename(self.FileName).encode()
+      self.LibC = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+      self.WatchFd = self.LibC.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+      if self.WatchFd < 0:
+         raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+      Mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+      if self.LibC.inotify_add_watch(self.WatchFd, os.path.dirname(self.FileName).encode(), Mask) < 0:
+         Error = ctypes.get_errno()
+         os.close(self.WatchFd)
+         raise OSError(Error, "inotify_add_watch failed")
+      self.Poll = select.poll()
+      self.Poll.register(self.WatchFd, select.POLLIN)
+
+
+   # True if an event for the file is read.
+   def ReadEvents(self):
+      ChangeFlag = False
+      try:
+         Data = os.read(self.WatchFd, INOTIFY_READ_SIZE)
+      except BlockingIOError:
+         return False
+      Offset = 0
+      while Offset + INOTIFY_EVENT.size <= len(Data):
+         WatchDescriptor, Mask, Cookie, NameSize = INOTIFY_EVENT.unpack_from(Data, Offset)
+         Offset += INOTIFY_EVENT.size
+         if Data[Offset:Offset + NameSize].rstrip(b"\0") == self.Name:
+            ChangeFlag = True
+         Offset += NameSize
+
+      return ChangeFlag
+
+
+   # Wait up to Timeout seconds for the file to change, returns True if it changed.
+   def Wait(self, Timeout):
+      ChangeFlag = False
+      if len(self.Poll.poll(int(Timeout * 1000))) > 0:
+         ChangeFlag = self.ReadEvents()
+         # Wait for the file to be completely written.
+         while ChangeFlag == True and len(self.Poll.poll(int(SETTLE_PERIOD * 1000))) > 0:
+            self.ReadEvents()
+
+      return ChangeFlag
+
+
+   def Close(self):
+      os.close(self.WatchFd)
+
+
+
+# Watch a file by polling its modification time, size and inode.
+class MtimeWatcher:
+   def __init__(self, FileName):
+      self.FileName = FileName
+      self.LastStat = self.Stat()
+
+
+   def Stat(self):
+      try:
+         Stat = os.stat(self.FileName)
+      except OSError:
+         return None
+
+      return [Stat.st_mtime_ns, Stat.st_size, Stat.st_ino]
+
+
+   # Wait Timeout seconds, returns True if the file changed.
+   def Wait(self, Timeout):
+      time.sleep(Timeout)
+      ChangeFlag = False
+      Stat = self.Stat()
+      if Stat != self.LastStat:
+         # Wait for the file to be completely written.
+         while Stat != self.LastStat:
+            self.LastStat = Stat
+            time.sleep(SETTLE_PERIOD)
+            Stat = self.Stat()
+         ChangeFlag = True
+
+      return ChangeFlag
+
+
+   def Close(self):
+      pass
+
+
+
+# Create a watcher for a file, using inotify when available, otherwise polling the modification time.
+def CreateWatcher(FileName):
+   try:
+      return InotifyWatcher(FileName)
+   except (OSError, AttributeError):
+      return MtimeWatcher(FileName)
@@ -0,0 +1,126 @@
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* Pi433MHzWave - 433MHz transmitter waveform compiler and player.          */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* Compiles a data packet into a list of transmitter levels and periods    */
+#/* before transmitting, then plays the list against a schedule of deadlines */
+#/* from the start of transmission. Each wait sleeps until shortly before   */
+#/* the deadline, then spins until the deadline, so sleep overshoot does not */
+#/* accumulate through the packet.                                           */
+#/****************************************************************************/
+
+
+
+import time
+
+
+
+# GPIO level to switch transmitter off.
+TX_OFF_LEVEL = 1
+# GPIO level to switch transmitter on.
+TX_ON_LEVEL = 0
+# Transmit settings shared by Pi433MHzTx.py and Pi433MHzTxDaemon.py, periods are in nanoseconds.
+# Period to signify end of Tx message.
+TX_END_PERIOD = 10000000
+# Single level period, one period is a binary 0, two periods are a binary 1.
+TX_LEVEL_PERIOD = 2000000
+# Start bits transmitted to signify start of transmission.
+TX_START_BITS = 1
+# Period before each level change to stop sleeping and wait precisely for the level change.
+TX_SPIN_PERIOD = 200000
+
+# Waveform segment fields.
+WAVE_LEVEL = 0
+WAVE_PERIOD = 1
+
+# Timing measurement fields.
+MEASURE_SEGMENTS = 0
+MEASURE_MAX_ERROR = 1
+MEASURE_MEAN_ERROR = 2
+MEASURE_MAX_PERIOD_ERROR = 3
+
+
+
+# Compile packet bytes into a waveform, a list of [WAVE_LEVEL, WAVE_PERIOD] segments with periods in nanoseconds.
+# The transmitter is switched on for the start bits, then the level is toggled for each bit,
+# one level period is a binary 0, two level periods are a binary 1.
+def CompileWaveform(PacketBytes, LevelPeriodNs, StartBits=1, EndPeriodNs=0):
+   Waveform = [[TX_ON_LEVEL, StartBits * LevelPeriodNs]]
+   TxLevel = TX_ON_LEVEL
+   for Byte in PacketBytes:
+      for BitCount in range(7, -1, -1):
+         # Toggle GPIO level.
+         if TxLevel == TX_OFF_LEVEL:
+            TxLevel = TX_ON_LEVEL
+         else:
+            TxLevel = TX_OFF_LEVEL
+         if Byte & (1 << BitCount):
+            Waveform.append([TxLevel, 2 * LevelPeriodNs])
+         else:
+            Waveform.append([TxLevel, LevelPeriodNs])
+   # Switch off transmitter for the end of transmission period.
+   Waveform.append([TX_OFF_LEVEL, EndPeriodNs])
+
+   return Waveform
+
+
+
+# Wait until a deadline on the perf_counter_ns() clock, sleeping until the spin period before the deadline.
+def WaitUntil(DeadlineNs, SpinPeriodNs):
+   RemainingNs = DeadlineNs - time.perf_counter_ns()
+   if RemainingNs > SpinPeriodNs:
+      time.sleep((RemainingNs - SpinPeriodNs) / 1000000000.0)
+   while time.perf_counter_ns() < DeadlineNs:
+      pass
+
+
+
+# Play a waveform, calling Output(Level) at the start of each segment.
+# When MeasureFlag is True, returns the timing measurement [MEASURE_SEGMENTS, MEASURE_MAX_ERROR,
+# MEASURE_MEAN_ERROR, MEASURE_MAX_PERIOD_ERROR] of level changes against the schedule, in nanoseconds.
+def PlayWaveform(Output, Waveform, SpinPeriodNs=200000, MeasureFlag=False):
+   OutputTimes = []
+   DeadlineNs = time.perf_counter_ns()
+   StartNs = DeadlineNs
+   for Level, PeriodNs in Waveform:
+      WaitUntil(DeadlineNs, SpinPeriodNs)
+      Output(Level)
+      if MeasureFlag == True:
+         OutputTimes.append(time.perf_counter_ns())
+      DeadlineNs += PeriodNs
+   WaitUntil(DeadlineNs, SpinPeriodNs)
+
+   Measurement = None
+   if MeasureFlag == True:
+      MaxError = 0
+      TotalError = 0
+      MaxPeriodError = 0
+      ScheduleNs = StartNs
+      for Count in range(len(Waveform)):
+         Error = OutputTimes[Count] - ScheduleNs
+         MaxError = max(MaxError, abs(Error))
+         TotalError += abs(Error)
+         if Count > 0:
+            PeriodError = (OutputTimes[Count] - OutputTimes[Count - 1]) - Waveform[Count - 1][WAVE_PERIOD]
+            MaxPeriodError = max(MaxPeriodError, abs(PeriodError))
+         ScheduleNs += Waveform[Count][WAVE_PERIOD]
+      Measurement = [len(Waveform), MaxError, TotalError // len(Waveform), MaxPeriodError]
+
+   return Measurement
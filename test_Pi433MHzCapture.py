@@ -0,0 +1,198 @@
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* test_Pi433MHzCapture - Tests of the capture backends.                    */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* Run with: python3 -m unittest test_Pi433MHzCapture                       */
+#/****************************************************************************/
+
+
+
+import os
+import random
+import unittest
+import threading
+import Pi433MHzCapture
+import Pi433MHzDecode
+import Pi433MHzPacket
+import Pi433MHzSynth
+
+
+
+# Random seed, so each run tests the same data.
+TEST_SEED = 433
+# GPIO pin the edges are received on.
+TEST_RX_PIN = 26
+# GPIO pin of the transmitter, held off by the backends which have a transmitter.
+TEST_TX_PIN = 19
+# Data packet identifier and encryption key.
+PACKET_SIGNATURE = [ 0x63, 0xF9, 0x5C, 0x1B ]
+ENCRYPTION_KEY = [ 0xC5, 0x07, 0x8C, 0xA9, 0xBD, 0x8B, 0x48, 0xEF, 0x88, 0xE1, 0x94, 0xDB, 0x63, 0x77, 0x95, 0x59 ]
+# Time of the first edge, and the period between the start of each transmission, longer than a transmission, in nanoseconds.
+TEST_START_TIME = 1000000000
+TEST_GAP_PERIOD = 500000000
+
+
+
+# Create a SIMULATED backend replaying the edges of each packet, a gap period apart.
+def SimulatedBackend(PacketList, Random):
+   Edges = []
+   for Count in range(len(PacketList)):
+      Edges.extend(Pi433MHzSynth.SynthEdges(PacketList[Count], Pi433MHzSynth.SynthSettings(), TEST_RX_PIN, \
+         TEST_START_TIME + Count * TEST_GAP_PERIOD, Random))
+
+   return Pi433MHzCapture.CreateBackend(Pi433MHzCapture.BACKEND_SIMULATED, [TEST_RX_PIN], TEST_TX_PIN, \
+      Edges=Edges, StartTime=TEST_START_TIME - TEST_GAP_PERIOD)
+
+
+
+# Write the line events of a list of edges to a pipe from a thread, so the pipe buffer does not block the test.
+def WriteLineEvents(WriteFd, Edges):
+   def Write():
+      for Count in range(len(Edges)):
+         RxPin, Level, TimeStampNs = Edges[Count]
+         os.write(WriteFd, Pi433MHzCapture.PackLineEvent(TimeStampNs, RxPin, Level, Count + 1, Count + 1))
+      os.close(WriteFd)
+
+   Thread = threading.Thread(target=Write, daemon=True)
+   Thread.start()
+
+   return Thread
+
+
+
+class TestSimulated(unittest.TestCase):
+   # Replay data packets through the read loop of Pi433MHzRx.py, each is decoded into a valid data packet.
+   def test_RxDecode(self):
+      Random = random.Random(TEST_SEED)
+      DataList = [Pi433MHzSynth.RandomBytes(Random.randint(1, 32), Random) for Count in range(10)]
+      PacketList = [Pi433MHzPacket.PacketBytes(Pi433MHzPacket.EncodePacket(Data, PACKET_SIGNATURE, ENCRYPTION_KEY)) for Data in DataList]
+      Backend = SimulatedBackend(PacketList, Random)
+      Backend.Open()
+      Decoder = Pi433MHzPacket.MultiPinDecoder([TEST_RX_PIN], Pi433MHzPacket.RX_END_PERIOD, Pi433MHzPacket.RX_REJECT_PERIOD, \
+         Pi433MHzPacket.MIN_RX_BYTES, lambda: Pi433MHzPacket.PacketParser(PACKET_SIGNATURE))
+
+      Frames = []
+      while Backend.IsFinished() == False or Decoder.IsReceiving() == True:
+         for Edge in Backend.Read(Pi433MHzPacket.RX_END_PERIOD):
+            Frame = Decoder.Edge(Edge)
+            if Frame != None:
+               Frames.append(Frame)
+         Frames.extend(Decoder.EndOfData(Backend.Now()))
+      Backend.Close()
+
+      self.assertEqual(len(Frames), len(DataList))
+      for Frame, Data in zip(Frames, DataList):
+         self.assertEqual(Frame[Pi433MHzPacket.FRAME_RX_PIN], TEST_RX_PIN)
+         PacketResult, DataPacket = Pi433MHzPacket.DecodePacket(Frame[Pi433MHzPacket.FRAME_DATA], PACKET_SIGNATURE)
+         self.assertEqual(PacketResult, Pi433MHzPacket.PACKET_VALID)
+         Pi433MHzPacket.BasicEncryptDecrypt(DataPacket["DATA"], ENCRYPTION_KEY)
+         self.assertEqual(DataPacket["DATA"], Data)
+
+
+   # Replay packet bytes through the read loop of Pi433MHz.py, each capture decodes to the packet bytes.
+   def test_MonitorCapture(self):
+      Random = random.Random(TEST_SEED)
+      PacketList = [Pi433MHzSynth.RandomBytes(Random.randint(4, 32), Random) for Count in range(10)]
+      Backend = SimulatedBackend(PacketList, Random)
+      Backend.Open()
+      Capture = Pi433MHzDecode.MultiPinCapture([TEST_RX_PIN])
+
+      Captures = []
+      while Backend.IsFinished() == False or Capture.IsReceiving() == True:
+         for Edge in Backend.Read(Pi433MHzDecode.RX_END_PERIOD):
+            Data = Capture.Edge(Edge)
+            if Data != None:
+               Captures.append(Data)
+         Captures.extend(Capture.EndOfData(Backend.Now()))
+      Backend.Close()
+
+      self.assertEqual(len(Captures), len(PacketList))
+      for Data, PacketBytes in zip(Captures, PacketList):
+         Decoded = Pi433MHzDecode.DecodeRxFrame(Data, None, [Pi433MHzDecode.VIEW_ALT_HEX])
+         self.assertEqual(Decoded[Pi433MHzDecode.DECODED_BAD_DATA], False)
+         self.assertEqual(Decoded[Pi433MHzDecode.DECODED_ALT_BYTES], PacketBytes)
+
+
+
+class TestCharDev(unittest.TestCase):
+   # Line events replayed through a pipe are read as the same edges, until the pipe is closed.
+   def test_PipeEdges(self):
+      Random = random.Random(TEST_SEED)
+      PacketBytes = Pi433MHzSynth.RandomBytes(32, Random)
+      Edges = Pi433MHzSynth.SynthEdges(PacketBytes, Pi433MHzSynth.SynthSettings(), TEST_RX_PIN, TEST_START_TIME, Random)
+      ReadFd, WriteFd = os.pipe()
+      Backend = Pi433MHzCapture.CreateBackend(Pi433MHzCapture.BACKEND_CHARDEV, [TEST_RX_PIN], LineFd=ReadFd)
+      Backend.Open()
+      Thread = WriteLineEvents(WriteFd, Edges)
+
+      ReadEdges = []
+      while Backend.IsFinished() == False:
+         ReadEdges.extend(Backend.Read(Pi433MHzPacket.RX_END_PERIOD))
+      Thread.join()
+      Backend.Close()
+
+      self.assertEqual(ReadEdges, [list(Edge) for Edge in Edges])
+      self.assertEqual(Backend.DroppedCount, 0)
+
+
+   # A line event split between reads is kept until the remainder is read.
+   def test_SplitEvent(self):
+      ReadFd, WriteFd = os.pipe()
+      Backend = Pi433MHzCapture.CreateBackend(Pi433MHzCapture.BACKEND_CHARDEV, [TEST_RX_PIN], LineFd=ReadFd)
+      Backend.Open()
+      LineEvents = Pi433MHzCapture.PackLineEvent(TEST_START_TIME, TEST_RX_PIN, 0, 1, 1) \
+         + Pi433MHzCapture.PackLineEvent(TEST_START_TIME + 500000, TEST_RX_PIN, 1, 2, 2)
+      SplitSize = Pi433MHzCapture.GPIO_V2_LINE_EVENT.size + 10
+
+      os.write(WriteFd, LineEvents[:SplitSize])
+      self.assertEqual(Backend.Read(0), [[TEST_RX_PIN, 0, TEST_START_TIME]])
+      self.assertEqual(len(Backend.ReadBuffer), 10)
+      os.write(WriteFd, LineEvents[SplitSize:])
+      os.close(WriteFd)
+      self.assertEqual(Backend.Read(0), [[TEST_RX_PIN, 1, TEST_START_TIME + 500000]])
+      self.assertEqual(len(Backend.ReadBuffer), 0)
+      self.assertEqual(Backend.IsFinished(), False)
+      self.assertEqual(Backend.Read(0), [])
+      self.assertEqual(Backend.IsFinished(), True)
+      Backend.Close()
+
+
+   # Gaps in the line sequence numbers of each GPIO pin are counted as dropped edges.
+   def test_LineSeqNoGaps(self):
+      ReadFd, WriteFd = os.pipe()
+      Backend = Pi433MHzCapture.CreateBackend(Pi433MHzCapture.BACKEND_CHARDEV, [TEST_RX_PIN, TEST_TX_PIN], LineFd=ReadFd)
+      Backend.Open()
+      for SeqNo, RxPin, LineSeqNo in [[1, TEST_RX_PIN, 1], [2, TEST_TX_PIN, 1], [3, TEST_RX_PIN, 2], [6, TEST_RX_PIN, 5], \
+         [7, TEST_TX_PIN, 2], [9, TEST_TX_PIN, 4]]:
+         os.write(WriteFd, Pi433MHzCapture.PackLineEvent(TEST_START_TIME + SeqNo * 500000, RxPin, SeqNo % 2, SeqNo, LineSeqNo))
+      os.close(WriteFd)
+
+      Edges = []
+      while Backend.IsFinished() == False:
+         Edges.extend(Backend.Read(0))
+      Backend.Close()
+
+      self.assertEqual(len(Edges), 6)
+      self.assertEqual(Backend.DroppedCount, 3)
+
+
+
+if __name__ == "__main__":
+   unittest.main()
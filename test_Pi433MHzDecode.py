@@ -0,0 +1,68 @@
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* test_Pi433MHzDecode - Tests of the RX data decoding engines.             */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* Run with: python3 -m unittest test_Pi433MHzDecode                        */
+#/****************************************************************************/
+
+
+
+import random
+import datetime
+import unittest
+import Pi433MHzDecode
+import Pi433MHzSynth
+
+
+
+# Random seed, so each run tests the same data.
+TEST_SEED = 433
+# Number of frames of data tested.
+TEST_FRAMES = 400
+# Maximum timing jitter of the frames tested, in nanoseconds.
+TEST_MAX_JITTER = 200000
+# Glitches and dropped edges, as a fraction of levels and edges.
+TEST_GLITCH_RATE = 0.01
+TEST_DROP_RATE = 0.001
+# All views of the data.
+TEST_VIEWS = [Pi433MHzDecode.VIEW_BINARY, Pi433MHzDecode.VIEW_HEX, Pi433MHzDecode.VIEW_ALT_HEX, Pi433MHzDecode.VIEW_BYTE, \
+   Pi433MHzDecode.VIEW_WORD_0, Pi433MHzDecode.VIEW_WORD_1, Pi433MHzDecode.VIEW_CHARACTER, Pi433MHzDecode.VIEW_LINE_CODE]
+
+
+
+class TestEngines(unittest.TestCase):
+   # The NUMPY engine formats the same log entry as the PYTHON engine for noisy data.
+   @unittest.skipUnless(Pi433MHzDecode.NumPyAvailable(), "NumPy is not installed")
+   def test_NumPyMatchesPython(self):
+      Random = random.Random(TEST_SEED)
+      Now = datetime.datetime(2026, 10, 18, 12, 0, 0)
+      for Count in range(TEST_FRAMES):
+         PacketBytes = Pi433MHzSynth.RandomBytes(Random.randint(1, 32), Random)
+         Settings = Pi433MHzSynth.SynthSettings(Jitter=Random.randint(0, TEST_MAX_JITTER), GlitchRate=TEST_GLITCH_RATE, \
+            DropRate=TEST_DROP_RATE, Invert=Random.randint(0, 1))
+         Data = Pi433MHzSynth.SynthRxData(PacketBytes, Settings, 26, Random)
+         PythonEntry = Pi433MHzDecode.DecodeRxData(Data, Now, Pi433MHzDecode.ENGINE_PYTHON, TEST_VIEWS)
+         NumPyEntry = Pi433MHzDecode.DecodeRxData(Data, Now, Pi433MHzDecode.ENGINE_NUMPY, TEST_VIEWS)
+         self.assertEqual(NumPyEntry, PythonEntry)
+
+
+
+if __name__ == "__main__":
+   unittest.main()
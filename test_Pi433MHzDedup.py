@@ -0,0 +1,141 @@
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* test_Pi433MHzDedup - Tests of repeated transmission de-duplication.      */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* Run with: python3 -m unittest test_Pi433MHzDedup                         */
+#/****************************************************************************/
+
+
+
+import unittest
+import Pi433MHzDedup
+
+
+
+# Period after the last copy of repeated data to consider the next copy as new data, in nanoseconds.
+TEST_WINDOW = 500000000
+# Period between copies of repeated data, in nanoseconds.
+TEST_REPEAT_PERIOD = 100000000
+# Maximum number of bit errors between copies of repeated data.
+TEST_MAX_BIT_ERRORS = 2
+
+
+
+class TestVote(unittest.TestCase):
+   # Bits which differ are counted in every byte.
+   def test_BitDifference(self):
+      self.assertEqual(Pi433MHzDedup.BitDifference([0xAB, 0xCD], [0xAB, 0xCD]), 0)
+      self.assertEqual(Pi433MHzDedup.BitDifference([0xAB, 0xCD], [0xAA, 0xCC]), 2)
+      self.assertEqual(Pi433MHzDedup.BitDifference([0x00, 0xFF], [0xFF, 0x00]), 16)
+
+
+   # Each bit takes the value of the majority of copies.
+   def test_MajorityVote(self):
+      self.assertEqual(Pi433MHzDedup.MajorityVote([[0xAB, 0xCD], [0xAA, 0xCD], [0xAB, 0xCC]]), [0xAB, 0xCD])
+
+
+   # A tied vote takes the bit from the first copy.
+   def test_MajorityVoteTie(self):
+      self.assertEqual(Pi433MHzDedup.MajorityVote([[0x01], [0x00]]), [0x01])
+      self.assertEqual(Pi433MHzDedup.MajorityVote([[0x00], [0x01]]), [0x00])
+
+
+   # Copies of different lengths vote each byte with the copies which have the byte, at the length of the longest copy.
+   def test_MajorityVoteLengths(self):
+      self.assertEqual(Pi433MHzDedup.MajorityVote([[0xAB, 0xCD, 0xEF], [0xAB], [0xAA, 0xCD, 0xEE, 0x12, 0x34]]), \
+         [0xAB, 0xCD, 0xEF, 0x12, 0x34])
+
+
+
+class TestBurstFilter(unittest.TestCase):
+   # Copies of a key are repeats until no copy has been received for the window period.
+   def test_Expire(self):
+      Filter = Pi433MHzDedup.BurstFilter(TEST_WINDOW)
+      self.assertEqual(Filter.Check("63 F9 5C 1B", 0), True)
+      self.assertEqual(Filter.Check("63 F9 5C 1B", TEST_WINDOW), False)
+      self.assertEqual(Filter.Check("63 F9 5C 1B", 2 * TEST_WINDOW), False)
+      self.assertEqual(Filter.Check("00 11 22 33", 2 * TEST_WINDOW), True)
+      self.assertEqual(Filter.Check("63 F9 5C 1B", 3 * TEST_WINDOW + 1), True)
+      self.assertEqual(Filter.RepeatCount, 2)
+      self.assertEqual(len(Filter.Bursts), 1)
+
+
+
+class TestBurstVoter(unittest.TestCase):
+   # Copies within the maximum bit errors join a burst, other data and copies after the window period are new bursts.
+   def test_Grouping(self):
+      Voter = Pi433MHzDedup.BurstVoter(TEST_WINDOW, TEST_MAX_BIT_ERRORS)
+      Burst, NewFlag = Voter.Add([0xAB, 0xCD, 0xEF], 0)
+      self.assertEqual(NewFlag, True)
+      RepeatBurst, NewFlag = Voter.Add([0xAB, 0xCD, 0xEC], TEST_REPEAT_PERIOD)
+      self.assertEqual(NewFlag, False)
+      self.assertIs(RepeatBurst, Burst)
+      OtherBurst, NewFlag = Voter.Add([0xAB, 0xCD, 0xE8], 2 * TEST_REPEAT_PERIOD)
+      self.assertEqual(NewFlag, True)
+      self.assertIsNot(OtherBurst, Burst)
+      LateBurst, NewFlag = Voter.Add([0xAB, 0xCD, 0xEF], 3 * TEST_REPEAT_PERIOD + TEST_WINDOW)
+      self.assertEqual(NewFlag, True)
+      self.assertIsNot(LateBurst, Burst)
+      self.assertEqual(Voter.RepeatCount, 1)
+
+
+   # Bit errors in different copies are repaired by the majority vote.
+   def test_Repair(self):
+      Voter = Pi433MHzDedup.BurstVoter(TEST_WINDOW, TEST_MAX_BIT_ERRORS)
+      for Count, ByteData in enumerate([[0xAB, 0xCD, 0xEE], [0xAA, 0xCD, 0xEF], [0xAB, 0xCC, 0xEF]]):
+         Burst, NewFlag = Voter.Add(ByteData, Count * TEST_REPEAT_PERIOD)
+      self.assertEqual(Burst[Pi433MHzDedup.BURST_COPIES], 3)
+      self.assertEqual(Voter.VoteData(Burst), [0xAB, 0xCD, 0xEF])
+
+
+   # A copy matching a different key to the key a burst was handled for is a new burst, such as another button on the
+   # same remote. Copies matching the same key, or no key, are repeats of the handled burst.
+   def test_HandledKey(self):
+      Voter = Pi433MHzDedup.BurstVoter(TEST_WINDOW, TEST_MAX_BIT_ERRORS)
+      Burst, NewFlag = Voter.Add([0xAB, 0xCD, 0xE1], 0, "BUTTON1")
+      Burst[Pi433MHzDedup.BURST_FLAG] = "BUTTON1"
+      RepeatBurst, NewFlag = Voter.Add([0xAB, 0xCD, 0xE1], TEST_REPEAT_PERIOD, "BUTTON1")
+      self.assertEqual(NewFlag, False)
+      self.assertIs(RepeatBurst, Burst)
+      RepeatBurst, NewFlag = Voter.Add([0xAB, 0xCD, 0xE0], 2 * TEST_REPEAT_PERIOD)
+      self.assertEqual(NewFlag, False)
+      self.assertIs(RepeatBurst, Burst)
+      OtherBurst, NewFlag = Voter.Add([0xAB, 0xCD, 0xE2], 3 * TEST_REPEAT_PERIOD, "BUTTON2")
+      self.assertEqual(NewFlag, True)
+      self.assertIsNot(OtherBurst, Burst)
+      self.assertEqual(OtherBurst[Pi433MHzDedup.BURST_FLAG], False)
+
+
+   # A short copy joins a burst without shortening it, so repaired data keeps the length of the longest copies.
+   def test_ShortCopy(self):
+      Voter = Pi433MHzDedup.BurstVoter(TEST_WINDOW, TEST_MAX_BIT_ERRORS)
+      Burst, NewFlag = Voter.Add([0xAB, 0xCD, 0xEF], 0)
+      RepeatBurst, NewFlag = Voter.Add([0xAB, 0xCD, 0xEF, 0x12, 0x34], TEST_REPEAT_PERIOD)
+      self.assertEqual(NewFlag, False)
+      self.assertIs(RepeatBurst, Burst)
+      self.assertEqual(Voter.VoteData(Burst), [0xAB, 0xCD, 0xEF, 0x12, 0x34])
+      RepeatBurst, NewFlag = Voter.Add([0xAB, 0xCD, 0xEF, 0x13, 0x34], 2 * TEST_REPEAT_PERIOD)
+      self.assertEqual(NewFlag, False)
+      self.assertEqual(Voter.VoteData(Burst), [0xAB, 0xCD, 0xEF, 0x12, 0x34])
+
+
+
+if __name__ == "__main__":
+   unittest.main()
@@ -0,0 +1,113 @@
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* test_Pi433MHzFec - Tests of the CRC and forward error correction.        */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* Run with: python3 -m unittest test_Pi433MHzFec                           */
+#/****************************************************************************/
+
+
+
+import random
+import unittest
+import Pi433MHzFec
+import Pi433MHzSynth
+
+
+
+# Random seed, so each run tests the same data.
+TEST_SEED = 433
+# Number of lists of bytes tested.
+TEST_FRAMES = 50
+# Number of bits in each interleaved FEC block.
+BLOCK_BITS = 8 * Pi433MHzFec.FEC_BLOCK_SIZE
+
+
+
+# Flip one random bit of each code word, code words are the bytes of each block before interleaving.
+def CodeWordErrors(FecData, Random):
+   ErrorData = []
+   for Count in range(0, len(FecData), Pi433MHzFec.FEC_BLOCK_SIZE):
+      CodeWords = Pi433MHzFec.InterleaveBlock(FecData[Count:Count + Pi433MHzFec.FEC_BLOCK_SIZE])
+      CodeWords = [CodeWord ^ (1 << Random.randrange(8)) for CodeWord in CodeWords]
+      ErrorData.extend(Pi433MHzFec.InterleaveBlock(CodeWords))
+
+   return ErrorData
+
+
+
+# Flip a burst of consecutive bits as transmitted, most significant bit of each byte first, starting at bit StartBit.
+def BurstErrors(FecData, StartBit, BitCount):
+   ErrorData = list(FecData)
+   for Bit in range(StartBit, StartBit + BitCount):
+      ErrorData[Bit // 8] ^= (0x80 >> (Bit % 8))
+
+   return ErrorData
+
+
+
+class TestCrc16(unittest.TestCase):
+   # CRC-16/CCITT-FALSE check value.
+   def test_CheckValue(self):
+      self.assertEqual(Pi433MHzFec.Crc16(b"123456789"), 0x29B1)
+
+
+
+class TestFec(unittest.TestCase):
+   # Encoded bytes are a whole number of blocks, and decode to the bytes encoded followed by padding.
+   def test_RoundTrip(self):
+      Random = random.Random(TEST_SEED)
+      for Count in range(TEST_FRAMES):
+         ByteData = Pi433MHzSynth.RandomBytes(Random.randint(1, 32), Random)
+         FecData = Pi433MHzFec.FecEncode(ByteData)
+         self.assertEqual(len(FecData), Pi433MHzFec.FecSize(len(ByteData)))
+         DecodedData, CorrectedCount, ErrorCount = Pi433MHzFec.FecDecode(FecData)
+         self.assertEqual(DecodedData[:len(ByteData)], ByteData)
+         self.assertEqual(CorrectedCount, 0)
+         self.assertEqual(ErrorCount, 0)
+
+
+   # A bit error in every code word is corrected and counted.
+   def test_CodeWordErrors(self):
+      Random = random.Random(TEST_SEED)
+      for Count in range(TEST_FRAMES):
+         ByteData = Pi433MHzSynth.RandomBytes(Random.randint(1, 32), Random)
+         FecData = Pi433MHzFec.FecEncode(ByteData)
+         DecodedData, CorrectedCount, ErrorCount = Pi433MHzFec.FecDecode(CodeWordErrors(FecData, Random))
+         self.assertEqual(DecodedData[:len(ByteData)], ByteData)
+         self.assertEqual(CorrectedCount, len(FecData))
+         self.assertEqual(ErrorCount, 0)
+
+
+   # A burst of 8 bit errors within an interleaved block is corrected and counted.
+   def test_BurstErrors(self):
+      Random = random.Random(TEST_SEED)
+      for Count in range(TEST_FRAMES):
+         ByteData = Pi433MHzSynth.RandomBytes(Random.randint(1, 32), Random)
+         FecData = Pi433MHzFec.FecEncode(ByteData)
+         StartBit = BLOCK_BITS * Random.randrange(len(FecData) // Pi433MHzFec.FEC_BLOCK_SIZE) + Random.randint(0, BLOCK_BITS - 8)
+         DecodedData, CorrectedCount, ErrorCount = Pi433MHzFec.FecDecode(BurstErrors(FecData, StartBit, 8))
+         self.assertEqual(DecodedData[:len(ByteData)], ByteData)
+         self.assertEqual(CorrectedCount, 8)
+         self.assertEqual(ErrorCount, 0)
+
+
+
+if __name__ == "__main__":
+   unittest.main()
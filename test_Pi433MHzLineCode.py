@@ -0,0 +1,102 @@
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* test_Pi433MHzLineCode - Tests of the line code decoders.                 */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* Run with: python3 -m unittest test_Pi433MHzLineCode                      */
+#/****************************************************************************/
+
+
+
+import random
+import unittest
+import Pi433MHzDecode
+import Pi433MHzLineCode
+import Pi433MHzSynth
+
+
+
+# Random seed, so each run tests the same data.
+TEST_SEED = 433
+# Number of frames of data tested.
+TEST_FRAMES = 50
+# Half bit period of Manchester levels, in nanoseconds.
+TEST_HALF_PERIOD = 250000
+
+
+
+# Manchester levels of a list of bits, as mark flags and periods. Each bit is a half of each level, space to mark = 1.
+def ManchesterWidths(Bits):
+   Marks = []
+   Widths = []
+   for Bit in Bits:
+      for Mark in [Bit == 0, Bit == 1]:
+         if len(Marks) > 0 and Marks[-1] == Mark:
+            Widths[-1] += TEST_HALF_PERIOD
+         else:
+            Marks.append(Mark)
+            Widths.append(TEST_HALF_PERIOD)
+
+   return Marks, Widths
+
+
+
+class TestPulse(unittest.TestCase):
+   # Data sent by Pi433MHzTx.py is detected as PULSE, and decodes to the same bytes as the ALT_HEX view.
+   def test_PulseMatchesAltHex(self):
+      Random = random.Random(TEST_SEED)
+      for Count in range(TEST_FRAMES):
+         PacketBytes = Pi433MHzSynth.RandomBytes(Random.randint(4, 32), Random)
+         Data = Pi433MHzSynth.SynthRxData(PacketBytes, Pi433MHzSynth.SynthSettings(), 26, Random)
+         Decoded = Pi433MHzDecode.DecodeRxFrame(Data)
+         LineCode = Decoded[Pi433MHzDecode.DECODED_LINE_CODE]
+         self.assertEqual(LineCode[Pi433MHzLineCode.DECODED_LINE_CODE], Pi433MHzLineCode.LINE_CODE_PULSE)
+         self.assertEqual(Decoded[Pi433MHzDecode.DECODED_ALT_BYTES], PacketBytes)
+         self.assertEqual(LineCode[Pi433MHzLineCode.DECODED_BYTES], PacketBytes)
+
+
+   # Data sent by Pi433MHzTx.py does not match the Manchester level period shape.
+   def test_PulseNotManchester(self):
+      Random = random.Random(TEST_SEED)
+      for Count in range(TEST_FRAMES):
+         PacketBytes = Pi433MHzSynth.RandomBytes(Random.randint(4, 32), Random)
+         Data = Pi433MHzSynth.SynthRxData(PacketBytes, Pi433MHzSynth.SynthSettings(), 26, Random)
+         Marks, Widths = Pi433MHzLineCode.PulseWidths(Data, Pi433MHzDecode.RX_END_PERIOD, Pi433MHzDecode.RX_BIT_INVERT)
+         Shape = Pi433MHzLineCode.PulseShape(Marks, Widths)
+         self.assertEqual(Pi433MHzLineCode.MatchPulse(Shape), True)
+         self.assertEqual(Pi433MHzLineCode.MatchManchester(Shape), False)
+
+
+
+class TestManchester(unittest.TestCase):
+   # Manchester levels are detected as MANCHESTER, and decode to the bits sent.
+   def test_Manchester(self):
+      Random = random.Random(TEST_SEED)
+      for Count in range(TEST_FRAMES):
+         Bits = [1, 0] + [Random.randint(0, 1) for BitCount in range(8 * Random.randint(2, 8) - 2)]
+         Marks, Widths = ManchesterWidths(Bits)
+         Shape = Pi433MHzLineCode.PulseShape(Marks, Widths)
+         Name, DecodedBits = Pi433MHzLineCode.DetectLineCode(Marks, Widths, Shape)
+         self.assertEqual(Name, Pi433MHzLineCode.LINE_CODE_MANCHESTER)
+         self.assertEqual(DecodedBits, Bits)
+
+
+
+if __name__ == "__main__":
+   unittest.main()
@@ -0,0 +1,144 @@
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* test_Pi433MHzMatch - Tests of data signature matching.                   */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* Run with: python3 -m unittest test_Pi433MHzMatch                         */
+#/****************************************************************************/
+
+
+
+import unittest
+import Pi433MHzMatch
+import Pi433MHzPacket
+
+
+
+# Parse byte data, returns the parser state and the number of bytes parsed when the parser completes the frame.
+def ParseBytes(Parser, ByteData):
+   for Count in range(len(ByteData)):
+      State = Parser.Byte(ByteData[Count])
+      if State != Pi433MHzPacket.PARSE_SIGNATURE:
+         return State, Count + 1
+
+   return State, len(ByteData)
+
+
+
+class TestSignatureIndex(unittest.TestCase):
+   # The longest data signature matching the start of the byte data is matched.
+   def test_LongestMatch(self):
+      Index = Pi433MHzMatch.SignatureIndex([["6555", "SHORT"], ["65556A6A", "LONG"], ["65556A6B", "OTHER"]])
+      self.assertEqual(Index.Match([0x65, 0x55, 0x6A, 0x6A, 0x00])[Pi433MHzMatch.CONFIG_ELEMENT_COMMAND], "LONG")
+      self.assertEqual(Index.Match([0x65, 0x55, 0x6A, 0x6B])[Pi433MHzMatch.CONFIG_ELEMENT_COMMAND], "OTHER")
+      self.assertEqual(Index.Match([0x65, 0x55, 0x6A, 0x00])[Pi433MHzMatch.CONFIG_ELEMENT_COMMAND], "SHORT")
+      self.assertEqual(Index.Match([0x65, 0x54, 0x6A, 0x6A]), None)
+      self.assertEqual(Index.Match([0x65]), None)
+
+
+   # A data signature with an odd number of hex digits matches the high nibble of the last byte.
+   def test_NibbleMatch(self):
+      Index = Pi433MHzMatch.SignatureIndex([["65556", "NIBBLE"], ["655565", "BYTE"]])
+      self.assertEqual(Index.Match([0x65, 0x55, 0x6F])[Pi433MHzMatch.CONFIG_ELEMENT_COMMAND], "NIBBLE")
+      self.assertEqual(Index.Match([0x65, 0x55, 0x65])[Pi433MHzMatch.CONFIG_ELEMENT_COMMAND], "BYTE")
+      self.assertEqual(Index.Match([0x65, 0x55, 0x7F]), None)
+
+
+   # The first of duplicate data signatures is kept.
+   def test_Duplicate(self):
+      Index = Pi433MHzMatch.SignatureIndex([["6555", "FIRST"], ["6555", "SECOND"]])
+      self.assertEqual(Index.Match([0x65, 0x55])[Pi433MHzMatch.CONFIG_ELEMENT_COMMAND], "FIRST")
+
+
+
+class TestTolerantMatch(unittest.TestCase):
+   # Data within the maximum bit errors of a data signature matches, one more bit error does not.
+   def test_Boundary(self):
+      Index = Pi433MHzMatch.SignatureIndex([["65556A6A", "COMMAND", 2]])
+      self.assertEqual(Index.Match([0x65, 0x55, 0x6A, 0x6A])[Pi433MHzMatch.CONFIG_ELEMENT_COMMAND], "COMMAND")
+      self.assertEqual(Index.Match([0x64, 0x55, 0x6A, 0x6B, 0x00])[Pi433MHzMatch.CONFIG_ELEMENT_COMMAND], "COMMAND")
+      self.assertEqual(Index.Match([0x64, 0x55, 0x6B, 0x6B, 0x00]), None)
+      self.assertEqual(Index.Match([0x64, 0x55, 0x6A]), None)
+
+
+   # Bit errors in every part of a data signature, each part within the maximum bit errors, still match.
+   def test_SpreadErrors(self):
+      Index = Pi433MHzMatch.SignatureIndex([["65556A6A6566", "COMMAND", 3]])
+      self.assertEqual(Index.Match([0x65, 0x55, 0x6B, 0x6A, 0x65, 0x67])[Pi433MHzMatch.CONFIG_ELEMENT_COMMAND], "COMMAND")
+      self.assertEqual(Index.Match([0xE5, 0x55, 0x6B, 0x6A, 0x65, 0x67])[Pi433MHzMatch.CONFIG_ELEMENT_COMMAND], "COMMAND")
+      self.assertEqual(Index.Match([0xE5, 0x55, 0x6B, 0x6A, 0x65, 0x66 ^ 0x11]), None)
+
+
+   # A data signature with an odd number of hex digits matches with bit errors.
+   def test_Nibble(self):
+      Index = Pi433MHzMatch.SignatureIndex([["65556", "COMMAND", 1]])
+      self.assertEqual(Index.Match([0x65, 0x55, 0x7F])[Pi433MHzMatch.CONFIG_ELEMENT_COMMAND], "COMMAND")
+      self.assertEqual(Index.Match([0x65, 0x55, 0x9F]), None)
+
+
+   # Data within the maximum bit errors of data signatures for different commands does not match, the same command does.
+   def test_Ambiguous(self):
+      Index = Pi433MHzMatch.SignatureIndex([["65556A6A", "BUTTON1", 2], ["65556A6F", "BUTTON2", 2]])
+      self.assertEqual(Index.Match([0x65, 0x55, 0x6A, 0x6E]), None)
+      self.assertEqual(Index.Match([0x65, 0x55, 0x6A, 0x68])[Pi433MHzMatch.CONFIG_ELEMENT_COMMAND], "BUTTON1")
+      Index = Pi433MHzMatch.SignatureIndex([["65556A6A", "BUTTON1", 2], ["65556A6F", "BUTTON1", 2]])
+      self.assertEqual(Index.Match([0x65, 0x55, 0x6A, 0x6E])[Pi433MHzMatch.CONFIG_ELEMENT_COMMAND], "BUTTON1")
+
+
+   # An exact match is used rather than a bit error tolerant match.
+   def test_ExactFirst(self):
+      Index = Pi433MHzMatch.SignatureIndex([["65556A6A", "BUTTON1", 2], ["65556A6B", "BUTTON2"]])
+      self.assertEqual(Index.Match([0x65, 0x55, 0x6A, 0x6B])[Pi433MHzMatch.CONFIG_ELEMENT_COMMAND], "BUTTON2")
+
+
+
+class TestSignatureParser(unittest.TestCase):
+   # The parser completes once no longer data signature can match, or after the grace bytes.
+   def test_EarlyCompletion(self):
+      Index = Pi433MHzMatch.SignatureIndex([["6555", "SHORT"], ["65556A6A", "LONG"]])
+      Parser = Pi433MHzMatch.SignatureParser(Index, 2)
+      self.assertEqual(ParseBytes(Parser, [0x65, 0x55, 0x6A, 0x6A, 0x00, 0x00]), (Pi433MHzPacket.PARSE_COMPLETE, 4))
+      self.assertEqual(Parser.MatchElement[Pi433MHzMatch.CONFIG_ELEMENT_COMMAND], "LONG")
+      Parser.Reset()
+      self.assertEqual(ParseBytes(Parser, [0x65, 0x55, 0x6A, 0x00, 0x00]), (Pi433MHzPacket.PARSE_COMPLETE, 4))
+      self.assertEqual(Parser.MatchElement[Pi433MHzMatch.CONFIG_ELEMENT_COMMAND], "SHORT")
+      Parser.Reset()
+      self.assertEqual(ParseBytes(Parser, [0x00, 0x55, 0x6A]), (Pi433MHzPacket.PARSE_DATA, 1))
+
+
+   # A shorter data signature completes after the grace bytes, while a longer data signature could still match.
+   def test_GraceBytes(self):
+      Index = Pi433MHzMatch.SignatureIndex([["6555", "SHORT"], ["65556A6A6A6A", "LONG"]])
+      Parser = Pi433MHzMatch.SignatureParser(Index, 2)
+      self.assertEqual(ParseBytes(Parser, [0x65, 0x55, 0x6A, 0x6A, 0x6A, 0x6A]), (Pi433MHzPacket.PARSE_COMPLETE, 4))
+      self.assertEqual(Parser.MatchElement[Pi433MHzMatch.CONFIG_ELEMENT_COMMAND], "SHORT")
+
+
+   # Once all bit error tolerant data signatures can be compared, the parser completes a match with bit errors.
+   def test_TolerantCompletion(self):
+      Index = Pi433MHzMatch.SignatureIndex([["65556A6A", "COMMAND", 2]])
+      Parser = Pi433MHzMatch.SignatureParser(Index)
+      self.assertEqual(ParseBytes(Parser, [0x65, 0x54, 0x6A, 0x6B, 0x00]), (Pi433MHzPacket.PARSE_COMPLETE, 4))
+      Parser.Reset()
+      self.assertEqual(ParseBytes(Parser, [0x64, 0x54, 0x6A, 0x6B, 0x00]), (Pi433MHzPacket.PARSE_DATA, 4))
+
+
+
+if __name__ == "__main__":
+   unittest.main()
@@ -0,0 +1,137 @@
+# Pi433MHz - 433MHz Data Reciever and Decoder
+# Copyright (C) 2019 Jason Birch
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+#/****************************************************************************/
+#/* test_Pi433MHzPacket - Tests of the data packet formats.                  */
+#/* ------------------------------------------------------------------------ */
+#/* V1.00 - 2026-10-18 - Jason Birch                                         */
+#/* ------------------------------------------------------------------------ */
+#/* Run with: python3 -m unittest test_Pi433MHzPacket                        */
+#/****************************************************************************/
+
+
+
+import random
+import unittest
+import Pi433MHzFec
+import Pi433MHzPacket
+import Pi433MHzSynth
+
+
+
+# Random seed, so each run tests the same data.
+TEST_SEED = 433
+# Number of data packets tested.
+TEST_FRAMES = 50
+# Data packet identifier and encryption key.
+PACKET_SIGNATURE = [ 0x63, 0xF9, 0x5C, 0x1B ]
+ENCRYPTION_KEY = [ 0xC5, 0x07, 0x8C, 0xA9, 0xBD, 0x8B, 0x48, 0xEF, 0x88, 0xE1, 0x94, 0xDB, 0x63, 0x77, 0x95, 0x59 ]
+# All data packet versions.
+PACKET_VERSIONS = [Pi433MHzPacket.PACKET_VERSION_XOR, Pi433MHzPacket.PACKET_VERSION_CRC, Pi433MHzPacket.PACKET_VERSION_FEC]
+
+
+
+# Random data packet bytes of a data packet version, and the data sent.
+def RandomPacket(Version, Random):
+   Data = Pi433MHzSynth.RandomBytes(Random.randint(0, 32), Random)
+   DataPacket = Pi433MHzPacket.EncodePacket(Data, PACKET_SIGNATURE, ENCRYPTION_KEY, Version)
+
+   return Pi433MHzPacket.PacketBytes(DataPacket), Data
+
+
+
+# Parse byte data, returns the number of bytes parsed when the parser completes or rejects the frame.
+def ParseBytes(Parser, ByteData):
+   for Count in range(len(ByteData)):
+      State = Parser.Byte(ByteData[Count])
+      if State == Pi433MHzPacket.PARSE_COMPLETE or State == Pi433MHzPacket.PARSE_REJECTED:
+         return State, Count + 1
+
+   return State, len(ByteData)
+
+
+
+class TestDecodePacket(unittest.TestCase):
+   # Each data packet version decodes to the data sent.
+   def test_RoundTrip(self):
+      Random = random.Random(TEST_SEED)
+      for Version in PACKET_VERSIONS:
+         for Count in range(TEST_FRAMES):
+            PacketBytes, Data = RandomPacket(Version, Random)
+            PacketResult, DataPacket = Pi433MHzPacket.DecodePacket(PacketBytes, PACKET_SIGNATURE, Version)
+            self.assertEqual(PacketResult, Pi433MHzPacket.PACKET_VALID)
+            Pi433MHzPacket.BasicEncryptDecrypt(DataPacket["DATA"], ENCRYPTION_KEY)
+            self.assertEqual(DataPacket["DATA"], Data)
+
+
+   # A bit error in the data of a CRC data packet fails the checksum, and a different version is rejected.
+   def test_CrcErrors(self):
+      PacketBytes = Pi433MHzPacket.PacketBytes(Pi433MHzPacket.EncodePacket([0x01, 0x02, 0x03], PACKET_SIGNATURE, ENCRYPTION_KEY, \
+         Pi433MHzPacket.PACKET_VERSION_CRC))
+      # The first data byte follows the signature, version and length bytes.
+      PacketBytes[len(PACKET_SIGNATURE) + 2] ^= 0x01
+      self.assertEqual(Pi433MHzPacket.DecodePacket(PacketBytes, PACKET_SIGNATURE, Pi433MHzPacket.PACKET_VERSION_CRC)[0], \
+         Pi433MHzPacket.PACKET_INVALID_CHECKSUM)
+      self.assertEqual(Pi433MHzPacket.DecodePacket(PacketBytes, PACKET_SIGNATURE, Pi433MHzPacket.PACKET_VERSION_FEC)[0], \
+         Pi433MHzPacket.PACKET_INVALID_VERSION)
+
+
+   # Bit errors in a FEC data packet are corrected, and reported as CORRECTED_BITS.
+   def test_CorrectedBits(self):
+      Random = random.Random(TEST_SEED)
+      for Count in range(TEST_FRAMES):
+         PacketBytes, Data = RandomPacket(Pi433MHzPacket.PACKET_VERSION_FEC, Random)
+         HeaderSize = len(PACKET_SIGNATURE) + 1
+         ErrorCount = (len(PacketBytes) - HeaderSize) // Pi433MHzFec.FEC_BLOCK_SIZE
+         # One bit error in each FEC block.
+         for Block in range(ErrorCount):
+            PacketBytes[HeaderSize + Block * Pi433MHzFec.FEC_BLOCK_SIZE + Random.randrange(Pi433MHzFec.FEC_BLOCK_SIZE)] ^= \
+               (1 << Random.randrange(8))
+         PacketResult, DataPacket = Pi433MHzPacket.DecodePacket(PacketBytes, PACKET_SIGNATURE, Pi433MHzPacket.PACKET_VERSION_FEC)
+         self.assertEqual(PacketResult, Pi433MHzPacket.PACKET_VALID)
+         self.assertEqual(DataPacket["CORRECTED_BITS"], ErrorCount)
+         Pi433MHzPacket.BasicEncryptDecrypt(DataPacket["DATA"], ENCRYPTION_KEY)
+         self.assertEqual(DataPacket["DATA"], Data)
+
+
+
+class TestPacketParser(unittest.TestCase):
+   # The parser completes each data packet version at the last byte of the data packet, ignoring following bytes.
+   def test_EarlyCompletion(self):
+      Random = random.Random(TEST_SEED)
+      for Version in PACKET_VERSIONS:
+         Parser = Pi433MHzPacket.PacketParser(PACKET_SIGNATURE, Version)
+         for Count in range(TEST_FRAMES):
+            PacketBytes, Data = RandomPacket(Version, Random)
+            Parser.Reset()
+            State, ByteCount = ParseBytes(Parser, PacketBytes + Pi433MHzSynth.RandomBytes(16, Random))
+            self.assertEqual(State, Pi433MHzPacket.PARSE_COMPLETE)
+            self.assertEqual(ByteCount, len(PacketBytes))
+
+
+   # The parser rejects a frame at the first byte which does not match the signature or version.
+   def test_Rejected(self):
+      Random = random.Random(TEST_SEED)
+      PacketBytes, Data = RandomPacket(Pi433MHzPacket.PACKET_VERSION_CRC, Random)
+      Parser = Pi433MHzPacket.PacketParser(PACKET_SIGNATURE, Pi433MHzPacket.PACKET_VERSION_FEC)
+      self.assertEqual(ParseBytes(Parser, PacketBytes), (Pi433MHzPacket.PARSE_REJECTED, len(PACKET_SIGNATURE) + 1))
+      Parser = Pi433MHzPacket.PacketParser([0x63, 0xF8], Pi433MHzPacket.PACKET_VERSION_FEC)
+      self.assertEqual(ParseBytes(Parser, PacketBytes), (Pi433MHzPacket.PARSE_REJECTED, 2))
+
+
+
+if __name__ == "__main__":
+   unittest.main()